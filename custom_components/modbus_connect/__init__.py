@@ -17,9 +17,15 @@ from .const import (
     CONF_SERIAL_PORT,
     CONF_STOPBITS,
     FRAMER_SOCKET,
+    OPTION_NATIVE_TRANSPORT,
+    OPTION_WIRE_TRACE,
     PLATFORMS,
 )
-from .coordinator import ModbusConnectConfigEntry, ModbusConnectCoordinator
+from .coordinator import (
+    ModbusConnectConfigEntry,
+    ModbusConnectCoordinator,
+    read_limits_store,
+)
 from .loader import async_load_device
 from .schema import DeviceSchemaError
 
@@ -52,12 +58,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ModbusConnectConfigEntry
             timeout=device.timeout,
             retries=device.retries,
             request_delay=device.request_delay,
+            pipeline_depth=device.pipeline_depth,
+            native=entry.options.get(OPTION_NATIVE_TRANSPORT, False),
         )
     # Drop the gateway reference on unload — and on any setup failure below
     # (HA runs on-unload callbacks for failed setups too), so an exception
     # after this point can never leak the shared client's refcount.
     entry.async_on_unload(lambda: client.release(entry.entry_id))
+    if entry.options.get(OPTION_WIRE_TRACE, False):
+        client.start_trace()
     coordinator = ModbusConnectCoordinator(hass, entry, client, device)
+    await coordinator.async_restore_read_limits()
     await coordinator.async_config_entry_first_refresh()
 
     # Fill firmware/hardware/serial from the first read before entities (and the
@@ -88,3 +99,8 @@ async def _async_options_updated(hass: HomeAssistant, entry: ModbusConnectConfig
 async def async_unload_entry(hass: HomeAssistant, entry: ModbusConnectConfigEntry) -> bool:
     """Unload a device; the on-unload callback drops the gateway reference."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ModbusConnectConfigEntry) -> None:
+    """Delete a removed device's auto-tuned read limits."""
+    await read_limits_store(hass, entry.entry_id).async_remove()
@@ -0,0 +1,104 @@
+"""Per-device circuit breaker for shared buses.
+
+Pure logic, no Home Assistant imports.
+
+A unit that went offline behind a shared gateway costs ``timeout * (retries
++ 1)`` per request, and every one of those seconds is a bus turn the healthy
+devices on the same gateway wait behind. :class:`CircuitBreaker` notices the
+silence — ``FAILURE_THRESHOLD`` consecutive requests without an answer,
+counting the gateway's own "target failed to respond" exceptions — and then
+fails that unit's requests locally, without touching the wire. Once per
+backoff window one request goes through as a probe (half-open): an answer
+closes the breaker, silence doubles the window up to ``MAX_OPEN_SECONDS``.
+
+Any answer, exception answers included, proves the unit is there; a
+connection error says nothing about the unit, only about the gateway.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+FAILURE_THRESHOLD = 3  # consecutive unanswered requests that open the breaker
+OPEN_SECONDS = 10.0  # first backoff window
+MAX_OPEN_SECONDS = 300.0
+
+
+class CircuitBreaker:
+    """Whether one device id gets requests, from its recent answers."""
+
+    def __init__(self) -> None:
+        self.failures = 0  # consecutive unanswered requests
+        self.window = OPEN_SECONDS
+        self.retry_at: float | None = None  # monotonic; set while open
+        self.probing = False  # a half-open probe is on the wire
+        self.trips = 0  # times the breaker opened
+        self.rejected = 0  # requests failed locally
+
+    @property
+    def open(self) -> bool:
+        return self.retry_at is not None
+
+    def allow(self, now: float) -> bool:
+        """Whether a request may go on the wire now; counts the ones that may not.
+
+        While open, the first request once the window has passed is the probe
+        and starts the next window, so a probe that never reports back (its
+        caller gave up) costs one window, not the device. One still marked out
+        when its window ends is taken to be lost.
+        """
+        if self.retry_at is None:
+            return True
+        if now >= self.retry_at:
+            # A new probe, whether or not the last one ever reported back.
+            self.retry_at = now + self.window
+            self.probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def answered(self) -> bool:
+        """The device answered; True if that closed an open breaker."""
+        was_open = self.open
+        self.failures = 0
+        self.window = OPEN_SECONDS
+        self.retry_at = None
+        self.probing = False
+        return was_open
+
+    def abandoned(self) -> None:
+        """A request ended without saying anything about the device.
+
+        A connection error or a cancelled request: if it was the probe, it is
+        no longer out, and the next window probes again.
+        """
+        self.probing = False
+
+    def unanswered(self, now: float) -> bool:
+        """A request went unanswered; True if that opened the breaker."""
+        self.failures += 1
+        if self.probing:
+            # The probe failed: stay open, and wait longer before the next.
+            self.probing = False
+            self.window = min(MAX_OPEN_SECONDS, self.window * 2)
+            self.retry_at = now + self.window
+            return False
+        if self.retry_at is None and self.failures >= FAILURE_THRESHOLD:
+            self.retry_at = now + self.window
+            self.trips += 1
+            return True
+        return False
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        probe_out = self.probing and self.retry_at is not None and now < self.retry_at
+        state = "half_open" if probe_out else "open" if self.open else "closed"
+        return {
+            "state": state,
+            "consecutive_failures": self.failures,
+            "retry_in": (
+                round(max(0.0, self.retry_at - now), 1) if self.retry_at is not None else None
+            ),
+            "window": self.window,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
@@ -1,24 +1,44 @@
-"""Thin pymodbus wrapper: one shared connection per gateway or serial port,
-with block reads.
+"""Thin pymodbus (or native transport) wrapper: one shared connection per
+gateway or serial port, with block reads.
 
 No Home Assistant imports; the coordinator owns scheduling, backoff and
-caching — this module only moves bytes and normalizes errors.
+caching — this module only moves bytes, normalizes errors, and decides whose
+turn it is when several entries share one bus.
 """
 
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
+import struct
 import time
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
 from typing import Any, ClassVar
 
 from pymodbus import FramerType
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
-from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ModbusException, ModbusIOException
 from pymodbus.pdu import ExceptionResponse
 
+from .breaker import CircuitBreaker
+from .metrics import TransactionMetrics
 from .models import BIT_TABLES, TABLE_COIL, TABLE_DISCRETE, TABLE_HOLDING, TABLE_INPUT, Span
+from .silence import GuardTime, inter_frame_gap
+from .timeouts import RoundTripEstimator
+from .trace import (
+    ANSWERED,
+    CONNECTION_ERROR,
+    TIMEOUT,
+    TRACE_MAX_BYTES,
+    ReplayClient,
+    TraceRecord,
+    TraceRecorder,
+    pack_bits,
+)
+from .transport import NativeResponse, NativeTcpClient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +54,15 @@ _CONN_ERRORS = (TimeoutError, ModbusException, OSError)
 DEFAULT_TIMEOUT = 2.0
 DEFAULT_RETRIES = 1
 DEFAULT_REQUEST_DELAY = 0.0
+DEFAULT_PIPELINE_DEPTH = 1
+
+# Bus-turn priority classes, most urgent first (see ModbusBlockClient.turn): a
+# user's write and its confirming read-back; quarantine re-probes and an entry's
+# first refresh (entities still without any value); regular polling.
+PRIORITY_WRITE = 0
+PRIORITY_URGENT = 1
+PRIORITY_POLL = 2
+PRIORITY_NAMES = ("write", "urgent", "poll")
 
 # Serial line defaults (Modbus's own default is 19200 8E1, but nearly every
 # real device ships 9600 8N1)
@@ -42,7 +71,55 @@ DEFAULT_BYTESIZE = 8
 DEFAULT_PARITY = "N"
 DEFAULT_STOPBITS = 1
 
-_InnerClient = AsyncModbusTcpClient | AsyncModbusSerialClient
+_InnerClient = AsyncModbusTcpClient | AsyncModbusSerialClient | NativeTcpClient
+
+
+# Function code per read table, and the framing bytes around each PDU (the MBAP
+# header; RTU's device address and CRC) — for the transaction metrics.
+_READ_FUNCTION_CODES = {TABLE_COIL: 1, TABLE_DISCRETE: 2, TABLE_HOLDING: 3, TABLE_INPUT: 4}
+_FRAMING_BYTES = {"socket": 7, "rtu": 3}
+
+
+def _pdu_sizes(
+    function_code: int, kwargs: dict[str, Any], exception_code: int | None
+) -> tuple[int, int]:
+    """Request and response PDU bytes of one transaction."""
+    sent = 6 + 2 * len(kwargs["values"]) if function_code == 16 else 5
+    if exception_code is not None:
+        return sent, 2
+    if function_code in (1, 2):
+        return sent, 2 + (kwargs["count"] + 7) // 8
+    if function_code in (3, 4):
+        return sent, 2 + 2 * kwargs["count"]
+    return sent, 5  # writes echo the address and the value or count
+
+
+def _trace_count(function_code: int, kwargs: dict[str, Any]) -> int:
+    """Registers or bits a transaction read or wrote."""
+    if function_code == 16:
+        return len(kwargs["values"])
+    return int(kwargs.get("count", 1))
+
+
+def _response_pdu(
+    function_code: int, kwargs: dict[str, Any], response: Any, exception_code: int | None
+) -> bytes:
+    """The response PDU of an answered transaction, rebuilt for the wire trace."""
+    if response.isError():
+        return bytes([function_code | 0x80, exception_code or 0])
+    if function_code in (3, 4):
+        words = response.registers[: kwargs["count"]]
+        return struct.pack(f">BB{len(words)}H", function_code, 2 * len(words), *words)
+    if function_code in (1, 2):
+        data = pack_bits(response.bits[: kwargs["count"]])
+        return bytes([function_code, len(data)]) + data
+    if function_code == 5:
+        value = 0xFF00 if kwargs["value"] else 0
+    elif function_code == 6:
+        value = kwargs["value"]
+    else:
+        value = len(kwargs["values"])
+    return struct.pack(">BHH", function_code, kwargs["address"], value)
 
 
 def _read_funcs(client: _InnerClient) -> dict[str, Callable[..., Any]]:
@@ -56,8 +133,10 @@ def _read_funcs(client: _InnerClient) -> dict[str, Callable[..., Any]]:
 
 
 def _exception_code(response: Any) -> int | None:
-    """The Modbus exception code if ``response`` is an ExceptionResponse, else None."""
-    return response.exception_code if isinstance(response, ExceptionResponse) else None
+    """The Modbus exception code if ``response`` is an exception answer, else None."""
+    if isinstance(response, ExceptionResponse | NativeResponse):
+        return response.exception_code
+    return None
 
 
 def _serial_client(
@@ -81,12 +160,27 @@ def _serial_client(
     )
 
 
+class CircuitOpenError(TimeoutError):
+    """A request failed locally: its device's circuit breaker is open (breaker.py).
+
+    A TimeoutError because it stands in for the timeout the device has been
+    producing — only without the wait.
+    """
+
+
 class ReadError(Exception):
-    """A read request failed."""
+    """A read request failed.
 
-    def __init__(self, message: str, *, illegal_address: bool = False) -> None:
+    ``circuit_open`` marks a read that never went on the wire because the
+    device is known to be silent (see :class:`CircuitOpenError`).
+    """
+
+    def __init__(
+        self, message: str, *, illegal_address: bool = False, circuit_open: bool = False
+    ) -> None:
         super().__init__(message)
         self.illegal_address = illegal_address
+        self.circuit_open = circuit_open
 
 
 class WriteError(Exception):
@@ -213,15 +307,39 @@ class ModbusBlockClient:
         self.target = key  # human-readable in errors: "host:port" or "/dev/tty..."
         self.framer = framer
         self._line = line  # serial only: (baudrate, bytesize, parity, stopbits)
-        self.lock = asyncio.Lock()
         self._client = inner
         self._read_funcs = _read_funcs(self._client)
         self._refs: set[str] = set()
-        # Per-entry (timeout, retries, request_delay) requests; the effective
-        # values are the maxima — see _apply_settings.
-        self._settings: dict[str, tuple[float, int, float]] = {}
+        # Per-entry (timeout, retries, request_delay, pipeline_depth) requests;
+        # the effective values are the maxima (the depth: the minimum) — see
+        # _apply_settings.
+        self._settings: dict[str, tuple[float, int, float, int]] = {}
         self._request_delay = DEFAULT_REQUEST_DELAY
+        # Serial only: the RTU inter-frame gap of the line, and the extra
+        # silence each device id turned out to need (silence.py). The
+        # request_delay is a floor under both.
+        self.frame_gap = inter_frame_gap(*line) if line is not None else 0.0
+        self._guards: dict[int, GuardTime] = {}
+        self._timeout = DEFAULT_TIMEOUT  # the ceiling of every adaptive read timeout
+        # Per device id: measured round trips, for adaptive read timeouts.
+        self._round_trips: dict[int, RoundTripEstimator] = {}
+        # Per device id: fail requests to a silent unit fast (breaker.py).
+        self._breakers: dict[int, CircuitBreaker] = {}
+        self.depth = DEFAULT_PIPELINE_DEPTH  # turns allowed on the wire at once
         self._last_io = 0.0  # monotonic end time of the last wire transaction
+        # Bus turns (see turn): waiters as (priority, deadline, arrival, future),
+        # a heap so the most urgent class, then the earliest deadline, is granted
+        # next; ``depth`` at a time, a write turn alone.
+        self._turns: list[tuple[int, float, int, asyncio.Future[None]]] = []
+        self._arrivals = itertools.count()
+        self._turns_taken = 0
+        self._write_turn = False
+        # Seconds each entry held the bus, for its bus share.
+        self.bus_time: dict[str, float] = {}
+        # Latency, bytes and outcome of every transaction, and the turn waits.
+        self.metrics = TransactionMetrics(PRIORITY_NAMES)
+        # Every transaction on the wire, once an entry asks for it (trace.py).
+        self.trace: TraceRecorder | None = None
 
     # --- instance sharing ------------------------------------------------------
 
@@ -236,18 +354,36 @@ class ModbusBlockClient:
         timeout: float | None = None,
         retries: int | None = None,
         request_delay: float | None = None,
+        pipeline_depth: int | None = None,
+        native: bool = False,
     ) -> ModbusBlockClient:
-        """Get (or create) the shared client for a TCP gateway."""
+        """Get (or create) the shared client for a TCP gateway.
+
+        A new connection runs on the native transport (transport.py) instead
+        of pymodbus when ``native`` is set, or when a ``pipeline_depth`` above
+        1 asks for pipelining on ``socket`` framing — pymodbus runs one
+        transaction at a time. The first entry on a gateway picks its transport.
+        """
         key = f"{host}:{port}"
         client = cls._instances.get(key)
         if client is None:
-            inner = AsyncModbusTcpClient(
-                host,
-                port=port,
-                framer=FramerType(framer),
-                timeout=DEFAULT_TIMEOUT,
-                retries=DEFAULT_RETRIES,
-            )
+            inner: _InnerClient
+            if native or (framer == "socket" and (pipeline_depth or 1) > 1):
+                inner = NativeTcpClient(
+                    host,
+                    port,
+                    framer=framer,
+                    timeout=DEFAULT_TIMEOUT,
+                    retries=DEFAULT_RETRIES,
+                )
+            else:
+                inner = AsyncModbusTcpClient(
+                    host,
+                    port=port,
+                    framer=FramerType(framer),
+                    timeout=DEFAULT_TIMEOUT,
+                    retries=DEFAULT_RETRIES,
+                )
             client = cls(key, inner, framer)
             cls._instances[key] = client
         elif client.framer != framer:
@@ -259,7 +395,13 @@ class ModbusBlockClient:
                 client.target,
                 client.framer,
             )
-        client._register(entry_id, timeout, retries, request_delay)
+        elif framer == "socket" and (pipeline_depth or 1) > 1 and not client.pipelining:
+            _LOGGER.warning(
+                "Gateway %s is already connected without pipelining; its "
+                "requests stay one at a time",
+                client.target,
+            )
+        client._register(entry_id, timeout, retries, request_delay, pipeline_depth)
         return client
 
     @classmethod
@@ -298,21 +440,50 @@ class ModbusBlockClient:
                 par,
                 stop,
             )
-        client._register(entry_id, timeout, retries, request_delay)
+        client._register(entry_id, timeout, retries, request_delay, None)
         return client
 
+    @classmethod
+    def replay(
+        cls, records: Sequence[TraceRecord], *, speed: float = 1.0, framer: str = "socket"
+    ) -> ModbusBlockClient:
+        """A client whose wire is a recorded trace (trace.ReplayClient).
+
+        Not shared; ``speed`` 1 keeps the recorded timing, higher runs faster,
+        0 as fast as possible.
+        """
+        return cls("replay", ReplayClient(records, speed=speed), framer)
+
+    def start_trace(self, max_bytes: int = TRACE_MAX_BYTES) -> TraceRecorder:
+        """Record every transaction from now on, until the connection closes."""
+        if self.trace is None:
+            self.trace = TraceRecorder(max_bytes)
+        return self.trace
+
+    @property
+    def native(self) -> bool:
+        """Whether the connection runs on the native transport, not pymodbus."""
+        return isinstance(self._client, NativeTcpClient)
+
+    @property
+    def pipelining(self) -> bool:
+        """Whether the connection can carry several requests at once."""
+        return self.native and self.framer == "socket"
+
     def _register(
         self,
         entry_id: str,
         timeout: float | None,
         retries: int | None,
         request_delay: float | None,
+        pipeline_depth: int | None,
     ) -> None:
         self._refs.add(entry_id)
         self._settings[entry_id] = (
             timeout if timeout is not None else DEFAULT_TIMEOUT,
             retries if retries is not None else DEFAULT_RETRIES,
             request_delay if request_delay is not None else DEFAULT_REQUEST_DELAY,
+            pipeline_depth if pipeline_depth is not None else DEFAULT_PIPELINE_DEPTH,
         )
         self._apply_settings()
 
@@ -320,6 +491,7 @@ class ModbusBlockClient:
         """Drop a config entry's reference; close when the last one goes."""
         self._refs.discard(entry_id)
         self._settings.pop(entry_id, None)
+        self.bus_time.pop(entry_id, None)
         if not self._refs:
             self._instances.pop(self.key, None)
             self._client.close()
@@ -331,14 +503,98 @@ class ModbusBlockClient:
 
         pymodbus reads both values per request; there is no public setter, so
         this writes the attributes the transaction manager actually consults
-        rather than recreating the (shared, possibly in-use) connection.
+        rather than recreating the (shared, possibly in-use) connection. The
+        pipeline is as deep as every entry allows, and one request deep with
+        any enforced silence — frames in flight together cannot be spaced.
         """
         settings = self._settings.values()
-        timeout = max((s[0] for s in settings), default=DEFAULT_TIMEOUT)
+        timeout = self._timeout = max((s[0] for s in settings), default=DEFAULT_TIMEOUT)
         retries = max((s[1] for s in settings), default=DEFAULT_RETRIES)
         self._request_delay = max((s[2] for s in settings), default=DEFAULT_REQUEST_DELAY)
-        self._client.comm_params.timeout_connect = timeout
-        self._client.ctx.retries = retries
+        if isinstance(self._client, NativeTcpClient):
+            self._client.timeout = timeout
+            self._client.retries = retries
+        else:
+            self._client.comm_params.timeout_connect = timeout
+            self._client.ctx.retries = retries
+        if self.pipelining:
+            depth = min((s[3] for s in settings), default=DEFAULT_PIPELINE_DEPTH)
+            self.depth = 1 if self._request_delay > 0 else depth
+        self._grant_turn()  # a deeper pipeline may admit waiting turns now
+
+    # --- bus scheduling ----------------------------------------------------------
+
+    @asynccontextmanager
+    async def turn(
+        self, entry_id: str, deadline: float, priority: int = PRIORITY_POLL
+    ) -> AsyncIterator[None]:
+        """Hold the bus for one transaction (or a write with its read-back).
+
+        Every transaction on a shared client queues here. The most urgent
+        ``priority`` class goes first — a write never waits behind queued
+        polls, only behind the turns already on the wire — and within a class
+        the soonest ``deadline`` (monotonic seconds: when the caller's cycle
+        must be done), ties in arrival order, so entries sharing the bus are
+        served fairly rather than by who asked most often. A pipelining
+        connection runs up to ``depth`` turns at once; a write turn always runs
+        alone.
+        """
+        queued = time.monotonic()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._turns, (priority, deadline, next(self._arrivals), future))
+        self._grant_turn()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._end_turn(priority)  # granted just as the waiter was cancelled
+            raise
+        started = time.monotonic()
+        self.metrics.wait(PRIORITY_NAMES[priority], started - queued, started)
+        try:
+            yield
+        finally:
+            self.bus_time[entry_id] = (
+                self.bus_time.get(entry_id, 0.0) + time.monotonic() - started
+            )
+            self._end_turn(priority)
+
+    def _grant_turn(self) -> None:
+        """Hand free turns to the most urgent waiters still waiting."""
+        while self._turns and not self._write_turn:
+            priority, _, _, future = self._turns[0]
+            if future.done():  # cancelled waiters are skipped
+                heapq.heappop(self._turns)
+                continue
+            if priority == PRIORITY_WRITE:
+                if self._turns_taken:
+                    return  # the wire drains first; nothing overtakes the write
+                self._write_turn = True
+            elif self._turns_taken >= self.depth:
+                return
+            heapq.heappop(self._turns)
+            self._turns_taken += 1
+            future.set_result(None)
+
+    def _end_turn(self, priority: int) -> None:
+        self._turns_taken -= 1
+        if priority == PRIORITY_WRITE:
+            self._write_turn = False
+        self._grant_turn()
+
+    def wait_times(self) -> dict[str, dict[str, float]]:
+        """Per priority class: recent turns and their mean / longest queue wait (s)."""
+        now = time.monotonic()
+        waits = {name: h.summary(now) for name, h in self.metrics.waits.items()}
+        return {
+            name: {"turns": w["count"], "mean_wait": w["mean"], "max_wait": w["max"]}
+            for name, w in waits.items()
+        }
+
+    def bus_share(self) -> dict[str, float]:
+        """Each entry's fraction of the time spent on this bus so far."""
+        total = sum(self.bus_time.values())
+        return {e: t / total for e, t in self.bus_time.items()} if total else {}
 
     # --- I/O ---------------------------------------------------------------------
 
@@ -350,50 +606,214 @@ class ModbusBlockClient:
         except _CONN_ERRORS:
             return False
 
-    async def _transact(self, func: Any, **kwargs: Any) -> Any:
+    def read_timeout(self, device_id: int, span: Span) -> float:
+        """Seconds to wait for ``span`` from ``device_id``: adaptive, capped.
+
+        Derived from the device's measured round trips (see timeouts.py) once
+        there are enough; until then, and never more than, the configured
+        timeout.
+        """
+        _, response_bytes = _pdu_sizes(
+            _READ_FUNCTION_CODES[span.table], {"count": span.count}, None
+        )
+        estimator = self._round_trips.get(device_id)
+        if estimator is None:
+            return self._timeout
+        return estimator.timeout(response_bytes, self._timeout)
+
+    def round_trips(self) -> dict[int, dict[str, Any]]:
+        """Per device id: the round-trip estimate, a one-register read's timeout,
+        and (serial only) the learned guard time."""
+        return {
+            device_id: {
+                **estimator.as_dict(),
+                "read_timeout": round(
+                    self.read_timeout(device_id, Span(TABLE_HOLDING, 0, 1)), 4
+                ),
+                **(
+                    {"guard_time": round(self._guards[device_id].seconds, 4)}
+                    if device_id in self._guards
+                    else {}
+                ),
+            }
+            for device_id, estimator in sorted(self._round_trips.items())
+        }
+
+    def circuit_breakers(self) -> dict[int, dict[str, Any]]:
+        """Per device id: the circuit breaker's state."""
+        now = time.monotonic()
+        return {
+            device_id: breaker.as_dict(now)
+            for device_id, breaker in sorted(self._breakers.items())
+        }
+
+    def _answered(self, device_id: int, breaker: CircuitBreaker) -> None:
+        if breaker.answered():
+            _LOGGER.info("Device %d on %s answers again", device_id, self.target)
+
+    def _unanswered(self, device_id: int, breaker: CircuitBreaker, now: float) -> None:
+        if breaker.unanswered(now):
+            _LOGGER.warning(
+                "Device %d on %s stopped answering (%d requests in a row); failing "
+                "its requests at once and re-probing it every %d s or more",
+                device_id,
+                self.target,
+                breaker.failures,
+                breaker.window,
+            )
+
+    async def _transact(
+        self, function_code: int, func: Any, *, timeout: float | None = None, **kwargs: Any
+    ) -> Any:
         """One wire transaction; enforces the configured inter-request silence.
 
-        Serialized by the caller-held lock, so waiting here delays every
+        Serialized by the caller-held turn, so waiting here delays every
         queued transaction — which is the point: picky RS-485 gateways need
-        the bus quiet between any two frames, including retries of ours.
+        the bus quiet between any two frames, including retries of ours. On a
+        serial line the silence is at least the RTU inter-frame gap plus the
+        device's learned guard time, never less than the ``request_delay``.
+        ``timeout`` overrides the connection's for this transaction only.
+        Records the transaction in :attr:`metrics`, in :attr:`trace` when
+        recording, and in the device's round trip, and raises
+        :class:`CircuitOpenError` at once, without touching the wire, while
+        the device's circuit breaker is open.
         """
-        if self._request_delay > 0:
-            wait = self._last_io + self._request_delay - time.monotonic()
+        device_id = kwargs["device_id"]
+        breaker = self._breakers.setdefault(device_id, CircuitBreaker())
+        if not breaker.allow(time.monotonic()):
+            raise CircuitOpenError(f"device {device_id} is not answering")
+        silence = max(self._request_delay, self.frame_gap)
+        guard = None
+        if self._line is not None:
+            guard = self._guards.setdefault(device_id, GuardTime())
+            silence = max(silence, guard.seconds)
+        if silence > 0:
+            wait = self._last_io + silence - time.monotonic()
             if wait > 0:
                 await asyncio.sleep(wait)
+        estimator = self._round_trips.setdefault(device_id, RoundTripEstimator())
+        inner = self._client
+        if timeout is not None:
+            if isinstance(inner, NativeTcpClient):
+                kwargs["timeout"] = timeout
+            else:
+                # Turns are exclusive on a pymodbus connection, so the shared
+                # setting can be lent to this one transaction.
+                inner.comm_params.timeout_connect = timeout
+        framing = _FRAMING_BYTES.get(self.framer, 0)
+        started = time.monotonic()
+        quiet = started - self._last_io
         try:
-            return await func(**kwargs)
-        finally:
+            response = await func(**kwargs)
+        except _CONN_ERRORS as exc:
             self._last_io = time.monotonic()
+            sent, _ = _pdu_sizes(function_code, kwargs, None)
+            timed_out = isinstance(exc, TimeoutError | ModbusIOException)
+            if timed_out:
+                estimator.timed_out()
+                self._unanswered(device_id, breaker, self._last_io)
+                if guard is not None:
+                    guard.timed_out(quiet)
+            else:
+                breaker.abandoned()
+            self.metrics.record(
+                function_code,
+                device_id,
+                self._last_io - started,
+                self._last_io,
+                sent=framing + sent,
+                received=0,
+                outcome="timeout" if timed_out else "connection_error",
+            )
+            if self.trace is not None:
+                self.trace.record(
+                    self._last_io,
+                    self._last_io - started,
+                    device_id,
+                    function_code,
+                    kwargs["address"],
+                    _trace_count(function_code, kwargs),
+                    TIMEOUT if timed_out else CONNECTION_ERROR,
+                )
+            raise
+        except asyncio.CancelledError:
+            breaker.abandoned()
+            raise
+        finally:
+            if timeout is not None and not isinstance(inner, NativeTcpClient):
+                inner.comm_params.timeout_connect = self._timeout
+        self._last_io = time.monotonic()
+        code = _exception_code(response)
+        sent, received = _pdu_sizes(function_code, kwargs, code)
+        estimator.observe(self._last_io - started, received)
+        if guard is not None:
+            guard.answered()
+        if code in _GATEWAY_EXCEPTIONS:
+            # The gateway answered for the device: it got nothing either.
+            self._unanswered(device_id, breaker, self._last_io)
+        else:
+            self._answered(device_id, breaker)
+        self.metrics.record(
+            function_code,
+            device_id,
+            self._last_io - started,
+            self._last_io,
+            sent=framing + sent,
+            received=framing + received,
+            exception_code=code,
+        )
+        if self.trace is not None:
+            self.trace.record(
+                self._last_io,
+                self._last_io - started,
+                device_id,
+                function_code,
+                kwargs["address"],
+                _trace_count(function_code, kwargs),
+                ANSWERED,
+                code,
+                _response_pdu(function_code, kwargs, response, code),
+            )
+        return response
+
+    async def read_block(self, device_id: int, span: Span) -> Sequence[int] | Sequence[bool]:
+        """Read one planned block; caller holds a turn (see :meth:`turn`).
 
-    async def read_block(self, device_id: int, span: Span) -> list[int] | list[bool]:
-        """Read one planned block; caller holds ``self.lock``."""
+        Registers come back as a list from pymodbus, as an ``array('H')`` from
+        the native transport.
+        """
         try:
             response = await self._transact(
+                _READ_FUNCTION_CODES[span.table],
                 self._read_funcs[span.table],
+                timeout=self.read_timeout(device_id, span),
                 address=span.start,
                 count=span.count,
                 device_id=device_id,
             )
         except _CONN_ERRORS as exc:
-            raise ReadError(f"{span}: {exc}") from exc
+            raise ReadError(
+                f"{span}: {exc}", circuit_open=isinstance(exc, CircuitOpenError)
+            ) from exc
 
         if response.isError():
             illegal = _exception_code(response) == _ILLEGAL_DATA_ADDRESS
             raise ReadError(f"{span}: {response}", illegal_address=illegal)
 
-        values: list[int] | list[bool] = (
+        values: Sequence[int] | Sequence[bool] = (
             response.bits if span.table in BIT_TABLES else response.registers
         )
         if len(values) < span.count:
             raise ReadError(f"{span}: short response ({len(values)} values)")
+        if len(values) == span.count:
+            return values
         # Bit responses are padded to full bytes; trim to what was asked for.
         return values[: span.count]
 
     async def write_registers(
         self, device_id: int, address: int, words: list[int], *, multiple: bool = False
     ) -> None:
-        """Write holding registers; caller holds ``self.lock``.
+        """Write holding registers; caller holds a write turn (see :meth:`turn`).
 
         Uses FC6 for a single register, FC16 for several — or for one when
         ``multiple`` is set, which some devices require even for a single
@@ -403,6 +823,7 @@ class ModbusBlockClient:
         try:
             if len(words) == 1 and not multiple:
                 response = await self._transact(
+                    6,
                     self._client.write_register,
                     address=address,
                     value=words[0],
@@ -410,6 +831,7 @@ class ModbusBlockClient:
                 )
             else:
                 response = await self._transact(
+                    16,
                     self._client.write_registers,
                     address=address,
                     values=words,
@@ -421,6 +843,7 @@ class ModbusBlockClient:
                     )
                     for i, word in enumerate(words):
                         response = await self._transact(
+                            6,
                             self._client.write_register,
                             address=address + i,
                             value=word,
@@ -434,9 +857,10 @@ class ModbusBlockClient:
             raise WriteError(f"{Span(TABLE_HOLDING, address, len(words))}: {exc}") from exc
 
     async def write_coil(self, device_id: int, address: int, value: bool) -> None:
-        """Write one coil; caller holds ``self.lock``."""
+        """Write one coil; caller holds a write turn (see :meth:`turn`)."""
         try:
             response = await self._transact(
+                5,
                 self._client.write_coil,
                 address=address,
                 value=value,
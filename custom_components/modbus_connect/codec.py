@@ -9,14 +9,21 @@ Decode pipeline for word tables (each step only if configured):
     words -> swap -> assemble (type / string / sum_scale over typed elements)
           -> mask -> map | flags | (multiplier -> offset)
 
-``encode`` runs the same pipeline backwards.
+``encode`` runs the same pipeline backwards. :func:`compile` specializes both
+for one entity, settling once what depends only on its definition, and
+:func:`decode_block` decodes the plain numbers of a whole block in bulk.
 """
 
 from __future__ import annotations
 
 import math
 import struct
+import sys
+from array import array
+from collections.abc import Callable, Container, Iterable, Sequence
 from datetime import time as dt_time
+from functools import partial
+from typing import Any, NamedTuple
 
 from .models import (
     BIT_TABLES,
@@ -28,6 +35,7 @@ from .models import (
     TYPE_WIDTH,
     UNSIGNED_INT_TYPES,
     EntityDef,
+    Span,
     reverse_value_map,
 )
 
@@ -361,3 +369,281 @@ def _encode_masked(defn: EntityDef, num: int, current_raw: int | None) -> int:
     if (num << shift) & ~defn.mask:
         raise CodecError(f"{defn.key}: {num} does not fit into mask {defn.mask:#x}")
     return ((current_raw & 0xFFFF) & ~defn.mask) | ((num << shift) & defn.mask)
+
+
+# struct codes of the types that fill whole registers, for compiled codecs
+_STRUCT_CODE = {
+    "uint16": "H",
+    "int16": "h",
+    "uint32": "I",
+    "int32": "i",
+    "uint64": "Q",
+    "int64": "q",
+    "float16": "e",
+    "float32": "f",
+    "float64": "d",
+}
+
+
+class CompiledCodec(NamedTuple):
+    """``decode`` and ``encode`` specialized for one entity (see :func:`compile`)."""
+
+    decode: Callable[[Any], object]
+    encode: Callable[..., list[int] | bool]
+
+
+def compile(defn: EntityDef) -> CompiledCodec:
+    """Specialize :func:`decode` and :func:`encode` for one entity.
+
+    Everything that depends only on the definition is settled once: the
+    ``struct.Struct`` of the type and the byte order, the word order, the mask
+    shift, the sorted flags and the reverse ``map``. Numbers of a whole
+    register type then decode in two C calls plus the configured steps.
+    Strings, times, ``sum_scale`` and sub-word types keep the general
+    pipeline. Results, errors included, are those of ``decode``/``encode``.
+    """
+    return CompiledCodec(_compile_decode(defn), _compile_encode(defn))
+
+
+def _compile_decode(defn: EntityDef) -> Callable[[Any], object]:
+    if defn.table in BIT_TABLES:
+        def decode_bit(raw: Any) -> object:
+            return bool(raw[0] if isinstance(raw, (list, tuple)) else raw)
+
+        return decode_bit
+
+    code = _STRUCT_CODE.get(defn.type)
+    if code is None or defn.sum_scale is not None:
+        return partial(decode, defn)
+    width = TYPE_WIDTH[defn.type]
+    swap = defn.swap or ""
+    pack = struct.Struct(("<" if "byte" in swap else ">") + "H" * width).pack
+    unpack = struct.Struct(">" + code).unpack
+    reverse = swap in ("word", "word_byte")
+    is_float = defn.type in FLOAT_TYPES
+    finish = _compile_finish(defn)
+
+    def decode_number(raw: Any) -> object:
+        try:
+            num = unpack(pack(*(raw[-1 : -width - 1 : -1] if reverse else raw[:width])))[0]
+        except struct.error:  # a word out of 0..0xFFFF, or too few: the general path
+            return decode(defn, raw)
+        if is_float and not math.isfinite(num):
+            return None
+        return num if finish is None else finish(num)
+
+    return decode_number
+
+
+def _compile_finish(defn: EntityDef) -> Callable[[Any], object] | None:
+    """The steps after assembling the number; None when there are none."""
+    mask = defn.mask
+    shift = 0 if mask is None else _mask_shift(mask)
+
+    if defn.value_map is not None:
+        value_map = defn.value_map
+        if mask is None:
+            return lambda num: value_map.get(int(num))
+        return lambda num: value_map.get((int(num) & mask) >> shift)
+
+    if defn.flags is not None:
+        flags = sorted(defn.flags.items())
+
+        def join_flags(num: Any) -> object:
+            n = int(num) if mask is None else (int(num) & mask) >> shift
+            return ", ".join(name for bit, name in flags if (n >> bit) & 1)
+
+        return join_flags
+
+    multiplier, offset = defn.multiplier, defn.offset
+    if mask is None and multiplier is None and offset is None and defn.type not in FLOAT_TYPES:
+        return None
+
+    def scale(num: Any) -> object:
+        if mask is not None:
+            num = (int(num) & mask) >> shift
+        if multiplier is not None:
+            num = num * multiplier
+        if offset is not None:
+            num = num + offset
+        if isinstance(num, float):
+            num = round(num, 10)
+        return _int_if_whole(num)
+
+    return scale
+
+
+def _compile_encode(defn: EntityDef) -> Callable[..., list[int] | bool]:
+    if (
+        defn.table in BIT_TABLES
+        or defn.flags is not None
+        or (defn.value_map is None and defn.type in (TYPE_STRING, TYPE_TIME))
+    ):
+        return partial(encode, defn)
+    pack_number = _compile_pack(defn)
+
+    if defn.value_map is None:
+        def encode_number(value: object, current_raw: int | None = None) -> list[int]:
+            return pack_number(_invert_conversions(defn, value), value, current_raw)
+
+        return encode_number
+
+    try:
+        reverse = reverse_value_map(defn.value_map, require_unique=True)
+    except ValueError:
+        return partial(encode, defn)  # raises NotWritableError when written
+
+    def encode_mapped(value: object, current_raw: int | None = None) -> list[int]:
+        if value not in reverse:
+            raise CodecError(f"{defn.key}: {value!r} is not a mapped value")
+        return pack_number(reverse[value], value, current_raw)
+
+    return encode_mapped
+
+
+def _compile_pack(defn: EntityDef) -> Callable[[float | int, object, int | None], list[int]]:
+    """:func:`_pack_number` for one entity; whole register types pack via struct."""
+    code = _STRUCT_CODE.get(defn.type)
+    if code is None or defn.sum_scale is not None or defn.mask is not None:
+        return partial(_pack_number, defn)
+    width = TYPE_WIDTH[defn.type]
+    swap = defn.swap or ""
+    pack = struct.Struct(">" + code).pack
+    unpack = struct.Struct(("<" if "byte" in swap else ">") + "H" * width).unpack
+    reverse = swap in ("word", "word_byte")
+    is_float = defn.type in FLOAT_TYPES
+    bits = TYPE_BITS[defn.type]
+    if defn.type in SIGNED_TYPES:
+        lo, hi = -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+    else:
+        lo, hi = 0, (1 << bits) - 1
+
+    def pack_number(num: float | int, value: object, current_raw: int | None) -> list[int]:
+        if is_float:
+            try:
+                packed = pack(float(num))
+            except (OverflowError, struct.error) as err:
+                raise CodecError(f"{defn.key}: {value!r} out of range for {defn.type}") from err
+        else:
+            int_num = _whole_number(defn, num, value)
+            if not lo <= int_num <= hi:
+                raise CodecError(f"{defn.key}: {int_num} out of range for {defn.type}")
+            packed = pack(int_num)
+        words = list(unpack(packed))
+        if reverse:
+            words.reverse()
+        return words
+
+    return pack_number
+
+
+class _Lane(NamedTuple):
+    """Entities of a block that one struct call decodes: non-overlapping, in
+    address order, of one byte order."""
+
+    unpack: Callable[[bytes], tuple[Any, ...]]
+    keys: tuple[str, ...]
+    floats: tuple[bool, ...]
+    finishes: tuple[Callable[[Any], object] | None, ...]
+
+
+class BlockLayout(NamedTuple):
+    """Where a block's bulk-decodable entities sit (see :func:`block_layout`)."""
+
+    size: int  # registers in the block
+    lanes: tuple[_Lane, ...]
+
+
+def _byte_order(defn: EntityDef) -> str | None:
+    """The struct byte order a plain number reads in from the block's bytes,
+    or None when its swap has none (a word swap of a multi-register type)."""
+    if defn.table in BIT_TABLES or defn.sum_scale is not None or defn.type not in _STRUCT_CODE:
+        return None
+    width = TYPE_WIDTH[defn.type]
+    if defn.count != width:  # swaps reverse all of an entity's registers
+        return None
+    swap = defn.swap or ""
+    if width == 1:
+        return "<" if "byte" in swap else ">"
+    # word_byte reverses the words and the bytes in each: the block's bytes
+    # read little-endian. A plain word or byte swap of wider types is neither.
+    return {"": ">", "word_byte": "<"}.get(swap)
+
+
+def block_layout(block: Span, defns: Iterable[EntityDef]) -> BlockLayout:
+    """Plan :func:`decode_block` for the entities inside ``block``.
+
+    Whole register numbers are grouped by byte order into lanes of
+    non-overlapping entities, each lane one ``struct.Struct`` whose pad bytes
+    skip the registers between them. Everything else (strings, times,
+    ``sum_scale``, sub-word types, word swaps, bit tables, entities reaching
+    past the block) is left out, to be decoded one by one.
+    """
+    placed: dict[str, list[tuple[int, EntityDef]]] = {"<": [], ">": []}
+    for defn in defns:
+        order = _byte_order(defn)
+        inside = defn.table == block.table and block.start <= defn.address
+        if order is not None and inside and defn.address + defn.count <= block.end:
+            placed[order].append((defn.address - block.start, defn))
+    lanes: list[_Lane] = []
+    for order, entities in placed.items():
+        # Each entity joins the first lane it does not overlap; overlapping
+        # entities (masks over one register) open further lanes.
+        formats: list[list[str]] = []
+        ends: list[int] = []
+        members: list[list[EntityDef]] = []
+        for offset, defn in sorted(entities, key=lambda item: item[0]):
+            width = TYPE_WIDTH[defn.type]
+            lane = next((i for i, end in enumerate(ends) if end <= offset), len(ends))
+            if lane == len(ends):
+                formats.append([])
+                ends.append(0)
+                members.append([])
+            gap = offset - ends[lane]
+            code = _STRUCT_CODE[defn.type]
+            formats[lane].append(f"{2 * gap}x{code}" if gap else code)
+            ends[lane] = offset + width
+            members[lane].append(defn)
+        for fmt, lane_defns in zip(formats, members, strict=True):
+            lanes.append(
+                _Lane(
+                    struct.Struct(order + "".join(fmt)).unpack_from,
+                    tuple(d.key for d in lane_defns),
+                    tuple(d.type in FLOAT_TYPES for d in lane_defns),
+                    tuple(_compile_finish(d) for d in lane_defns),
+                )
+            )
+    return BlockLayout(block.count, tuple(lanes))
+
+
+def decode_block(
+    block_words: Sequence[int], layout: BlockLayout, keys: Container[str] | None = None
+) -> dict[str, object]:
+    """Decode a block's entities in bulk, as :func:`decode` would one by one.
+
+    ``block_words`` are the block's registers as read; ``layout`` comes from
+    :func:`block_layout`. The block becomes big-endian bytes once, and each
+    lane unpacks all its entities in one call; only the configured steps
+    after that (mask, map, multiplier, ...) run per entity. With ``keys``,
+    only those entities are finished and returned. Entities the layout left
+    out are never in the result.
+    """
+    try:
+        words = array("H", block_words[: layout.size])
+    except (OverflowError, TypeError):  # not register words: decode one by one
+        return {}
+    if sys.byteorder == "little":
+        words.byteswap()
+    data = words.tobytes()
+    out: dict[str, object] = {}
+    for lane in layout.lanes:
+        for key, num, is_float, finish in zip(
+            lane.keys, lane.unpack(data), lane.floats, lane.finishes, strict=True
+        ):
+            if keys is not None and key not in keys:
+                continue
+            if is_float and not math.isfinite(num):
+                out[key] = None
+            else:
+                out[key] = num if finish is None else finish(num)
+    return out
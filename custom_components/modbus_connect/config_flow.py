@@ -52,9 +52,12 @@ from .const import (
     FRAMER_SOCKET,
     MODBUS_ID_MAX,
     MODBUS_ID_MIN,
+    OPTION_AUTO_TUNE,
     OPTION_ENABLED_GROUPS,
     OPTION_MIN_SCAN_INTERVAL,
+    OPTION_NATIVE_TRANSPORT,
     OPTION_SHOW_ALL,
+    OPTION_WIRE_TRACE,
     PARITY_OPTIONS,
     STOPBITS_OPTIONS,
 )
@@ -526,7 +529,9 @@ class ModbusConnectConfigFlow(ConfigFlow, domain=DOMAIN):
 
 
 class ModbusConnectOptionsFlow(OptionsFlow):
-    """Set the minimum poll interval (a floor the device file / entities sit above)."""
+    """Set the minimum poll interval (a floor the device file / entities sit above)
+    and opt in to read-limit auto-tuning, the wire trace and, for network
+    entries, the native transport."""
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -540,16 +545,27 @@ class ModbusConnectOptionsFlow(OptionsFlow):
         current = self.config_entry.options.get(OPTION_MIN_SCAN_INTERVAL)
         if current is None:
             current = await self._device_default() or DEFAULT_SCAN_INTERVAL
-        return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(OPTION_MIN_SCAN_INTERVAL, default=current): vol.All(
-                        vol.Coerce(int), vol.Range(min=1, max=86400)
-                    )
-                }
+        options = self.config_entry.options
+        fields: dict[Any, Any] = {
+            vol.Required(OPTION_MIN_SCAN_INTERVAL, default=current): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=86400)
             ),
-        )
+            vol.Required(
+                OPTION_AUTO_TUNE, default=options.get(OPTION_AUTO_TUNE, False)
+            ): bool,
+        }
+        if CONF_SERIAL_PORT not in self.config_entry.data:
+            # Serial ports always go through pymodbus.
+            fields[
+                vol.Required(
+                    OPTION_NATIVE_TRANSPORT,
+                    default=options.get(OPTION_NATIVE_TRANSPORT, False),
+                )
+            ] = bool
+        fields[
+            vol.Required(OPTION_WIRE_TRACE, default=options.get(OPTION_WIRE_TRACE, False))
+        ] = bool
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(fields))
 
     async def _device_default(self) -> int | None:
         """The device's current poll-interval floor, if the file still loads.
@@ -66,6 +66,14 @@ OPTION_ENABLED_GROUPS: Final = "enabled_groups"
 # Bypass group handling entirely while true: every non-internal entity is shown,
 # whatever the group selection says (the "Show all entities" switch).
 OPTION_SHOW_ALL: Final = "show_all_entities"
+# Opt-in: grow max_register_read / max_read_gap from live polling (tuning.py).
+OPTION_AUTO_TUNE: Final = "auto_tune_read_limits"
+# Opt-in: talk to a TCP gateway through the native transport (transport.py)
+# instead of pymodbus.
+OPTION_NATIVE_TRANSPORT: Final = "native_transport"
+# Opt-in: record every transaction of the connection for the diagnostics
+# download (trace.py).
+OPTION_WIRE_TRACE: Final = "record_wire_trace"
 
 # The one reserved group name: always enabled, no toggle switch. Tagging an
 # entity ``groups: [basic]`` keeps it out of other groups without ever hiding it.
@@ -101,3 +109,8 @@ QUARANTINE_AFTER: Final = 3
 # ... and are re-probed standalone this often (seconds); success lifts the
 # quarantine, as does reloading the entry.
 QUARANTINE_RETRY_SECONDS: Final = 600
+
+# Holding-register writes arriving within this window (seconds) are coalesced:
+# contiguous registers of one device go out as one FC16 write and are
+# confirmed by one read (see ModbusConnectCoordinator.async_write).
+WRITE_COALESCE_SECONDS: Final = 0.02
@@ -8,21 +8,34 @@ import math
 import re
 import struct
 import time
-from collections import deque
-from collections.abc import Callable, Iterator
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import timedelta
-from typing import Any
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, NamedTuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, TemplateError
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from jinja2 import Environment, TemplateSyntaxError, nodes
+from jinja2.defaults import DEFAULT_NAMESPACE
+from jinja2.filters import FILTERS
+from jinja2.tests import TESTS
 
 from . import codec
-from .client import ModbusBlockClient, ReadError, WriteError
+from .client import (
+    PRIORITY_POLL,
+    PRIORITY_URGENT,
+    PRIORITY_WRITE,
+    ModbusBlockClient,
+    ReadError,
+    WriteError,
+)
 from .const import (
     BASIC_GROUP,
     CONF_PREFIX,
@@ -32,13 +45,18 @@ from .const import (
     DOMAIN,
     HEALTH_WINDOW_SECONDS,
     MAX_BACKOFF_SECONDS,
+    OPTION_AUTO_TUNE,
     OPTION_ENABLED_GROUPS,
     OPTION_MIN_SCAN_INTERVAL,
     OPTION_SHOW_ALL,
     QUARANTINE_AFTER,
     QUARANTINE_RETRY_SECONDS,
+    WRITE_COALESCE_SECONDS,
 )
 from .models import (
+    BIT_TABLES,
+    DEFAULT_READ_COST,
+    PROTOCOL_MAX_WRITE_REGISTERS,
     TABLE_COIL,
     DeviceDef,
     EntityDef,
@@ -47,7 +65,18 @@ from .models import (
     TemplateDef,
     reverse_value_map,
 )
-from .planner import bridged_addresses, plan_blocks, spans_in_block
+from .planner import (
+    AddressIndex,
+    absorb_spans,
+    bridged_ranges,
+    covering_block,
+    estimate_read_time,
+    plan_blocks,
+    spans_in_block,
+)
+from .rawcache import RawCache
+from .schedule import due_periods, horizon, period_ticks, stagger_phases
+from .tuning import ReadLimitTuner
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +87,93 @@ type ModbusConnectConfigEntry = ConfigEntry[ModbusConnectCoordinator]
 # as-is, which keeps non-string values (a time readback's datetime.time) intact.
 _DIRECT_LINK = re.compile(r"\s*\{\{\s*([A-Za-z_]\w*)\s*\}\}\s*\Z")
 
+# What a template may use besides the device's keys and still depend on
+# nothing but them: Jinja's own globals, filters and tests, the helpers
+# render_over_values adds, and Home Assistant's pure ones. Any other name —
+# states, the time, areas, devices, labels, a helper of a later release —
+# makes the template render on every update, not only when a key it reads
+# changed.
+_JINJA = Environment(extensions=["jinja2.ext.loopcontrols", "jinja2.ext.do"])
+_PURE_GLOBALS = frozenset(
+    {*DEFAULT_NAMESPACE, "loop", "caller", "varargs", "kwargs"}
+    | {"values", "key"}
+    | {
+        "float", "int", "bool", "min", "max", "average", "median", "statistical_mode",
+        "pi", "e", "tau", "inf", "log", "sin", "cos", "tan", "asin", "acos", "atan",
+        "atan2", "sqrt", "as_datetime", "as_timestamp", "as_local", "as_timedelta",
+        "strptime", "timedelta", "iif", "pack", "unpack", "urlencode", "slugify", "zip",
+        "set", "tuple", "typeof", "bitwise_and", "bitwise_or", "bitwise_xor",
+        "version", "is_number",
+    }
+)
+_PURE_FILTERS = frozenset(
+    (FILTERS.keys() - {"random"})
+    | {
+        "multiply", "add", "round", "float", "int", "bool", "log", "sin", "cos", "tan",
+        "asin", "acos", "atan", "atan2", "sqrt", "average", "median", "statistical_mode",
+        "timestamp_custom", "timestamp_local", "timestamp_utc", "as_datetime",
+        "as_timestamp", "as_local", "as_timedelta", "regex_match", "regex_search",
+        "regex_replace", "regex_findall", "regex_findall_index", "to_json", "from_json",
+        "pack", "unpack", "ord", "base64_encode", "base64_decode", "slugify", "iif",
+        "md5", "sha1", "sha256", "sha512", "bitwise_and", "bitwise_or", "bitwise_xor",
+        "ordinal", "is_number", "version", "urlencode", "contains", "flatten", "typeof",
+        "set", "tuple",
+    }
+)
+_PURE_TESTS = frozenset(
+    TESTS.keys()
+    | {
+        "match", "search", "is_number", "contains", "datetime", "list", "set", "tuple",
+        "string_like", "boolean",
+    }
+)
+
+# Memoized read plans kept per coordinator. The due set takes one shape per
+# cadence combination, plus the odd retry or quarantine variant; past this many
+# the cache starts over rather than growing without bound.
+_PLAN_CACHE_SIZE = 64
+# Bulk-decode layouts are kept per block read; the planned blocks, their
+# fallback sub-blocks and the odd isolated span stay well below this.
+_LAYOUT_CACHE_SIZE = 256
+
+# Learned read limits (see tuning.py) persist per config entry; saves are
+# batched, the limits settle within a few cycles of each change.
+_READ_LIMITS_STORE_VERSION = 1
+_READ_LIMITS_SAVE_DELAY = 60
+
+
+class _PendingWrite(NamedTuple):
+    """A holding-register write waiting for its batch (see async_write)."""
+
+    defn: EntityDef
+    value: Any
+    future: asyncio.Future[None]
+    latest_wins: bool
+
+
+def _reads_back(defn: EntityDef) -> bool:
+    """Whether a write to ``defn`` is confirmed by reading its own register.
+
+    read_register entities are read through another entity, static_value ones
+    not at all; both echo the written value instead.
+    """
+    return defn.read_register is None and defn.static_value is None
+
+
+def _settle(future: asyncio.Future[None], error: BaseException | None = None) -> None:
+    """Resolve a pending write's future, unless its caller already gave up."""
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+def read_limits_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """The storage file holding one config entry's auto-tuned read limits."""
+    return Store(hass, _READ_LIMITS_STORE_VERSION, f"{DOMAIN}.{entry_id}.read_limits")
+
 
 def render_over_values(
     template: Template,
@@ -166,28 +282,10 @@ def referenced_read_keys(
     seeded from the visible items and from the device-info templates (which always
     render), so nothing a shown value depends on gets pruned from the read plan.
     """
-    sources: dict[str, list[str]] = {}
-    for e in device.entities:
-        if e.read_register is not None:
-            sources.setdefault(e.key, []).append(e.read_register)
-        if isinstance(e.write_value, str):
-            sources.setdefault(e.key, []).append(e.write_value)
-        elif isinstance(e.write_value, tuple):
-            sources.setdefault(e.key, []).extend(
-                item for item in e.write_value if isinstance(item, str)
-            )
-    for t in device.templates:
-        strings = [v for v in t.config.values() if isinstance(v, str)]
-        strings += [v.selector for v in t.config.values() if isinstance(v, SwitchTarget)]
-        if strings:
-            sources.setdefault(t.key, []).extend(strings)
-
-    all_keys = {e.key for e in device.entities} | {t.key for t in device.templates}
-    if not all_keys:
+    sources = _template_sources(device, writes=True)
+    pattern = _key_pattern(device)
+    if pattern is None:
         return set()
-    pattern = re.compile(
-        r"\b(" + "|".join(re.escape(k) for k in sorted(all_keys, key=len, reverse=True)) + r")\b"
-    )
 
     referenced: set[str] = set()
     stack: list[str] = []
@@ -212,6 +310,100 @@ def referenced_read_keys(
     return referenced
 
 
+def _template_sources(device: DeviceDef, *, writes: bool) -> dict[str, list[str]]:
+    """The Jinja strings of each ``read_register`` entity and template.
+
+    With ``writes``, also those rendered only when writing: a button's
+    ``write_value`` and an action's ``by:`` selector.
+    """
+    sources: dict[str, list[str]] = {}
+    for e in device.entities:
+        if e.read_register is not None:
+            sources.setdefault(e.key, []).append(e.read_register)
+        if not writes:
+            continue
+        if isinstance(e.write_value, str):
+            sources.setdefault(e.key, []).append(e.write_value)
+        elif isinstance(e.write_value, tuple):
+            sources.setdefault(e.key, []).extend(
+                item for item in e.write_value if isinstance(item, str)
+            )
+    for t in device.templates:
+        strings = [v for v in t.config.values() if isinstance(v, str)]
+        if writes:
+            strings += [v.selector for v in t.config.values() if isinstance(v, SwitchTarget)]
+        if strings:
+            sources.setdefault(t.key, []).extend(strings)
+    return sources
+
+
+def _key_pattern(device: DeviceDef) -> re.Pattern[str] | None:
+    """A regex finding the device's keys in template text (longest first)."""
+    all_keys = {e.key for e in device.entities} | {t.key for t in device.templates}
+    if not all_keys:
+        return None
+    return re.compile(
+        r"\b(" + "|".join(re.escape(k) for k in sorted(all_keys, key=len, reverse=True)) + r")\b"
+    )
+
+
+def _volatile(text: str, keys: frozenset[str]) -> bool:
+    """Whether a template may use anything besides ``keys`` and pure helpers.
+
+    Judged from the parsed template: every global it loads, filter and test
+    it applies must be known. One that does not parse renders every time.
+    """
+    try:
+        tree = _JINJA.parse(text)
+    except TemplateSyntaxError:
+        return True
+    local = {n.name for n in tree.find_all(nodes.Name) if n.ctx != "load"}
+    local.update(m.name for m in tree.find_all(nodes.Macro))
+    for node in tree.find_all((nodes.Name, nodes.Filter, nodes.Test)):
+        if isinstance(node, nodes.Name):
+            pure = node.name in keys or node.name in local or node.name in _PURE_GLOBALS
+        elif isinstance(node, nodes.Filter):
+            pure = node.name in _PURE_FILTERS
+        else:
+            pure = node.name in _PURE_TESTS
+        if not pure:
+            return True
+    return False
+
+
+def template_reads(device: DeviceDef) -> tuple[dict[str, frozenset[str]], frozenset[str]]:
+    """The keys each ``read_register`` entity and template renders from, and
+    the items that must render on every update regardless.
+
+    Those are the items that may read anything besides the device's values —
+    Home Assistant state, the time — which changes without the device (see
+    :func:`_volatile`), or no key at all (nothing to go by).
+    """
+    pattern = _key_pattern(device)
+    all_keys = frozenset({e.key for e in device.entities} | {t.key for t in device.templates})
+    reads: dict[str, frozenset[str]] = {}
+    volatile: set[str] = set()
+    for item, texts in _template_sources(device, writes=False).items():
+        keys = frozenset(k for text in texts for k in (pattern.findall(text) if pattern else ()))
+        reads[item] = keys - {item}
+        if not reads[item] or any(_volatile(text, all_keys) for text in texts):
+            volatile.add(item)
+    return reads, frozenset(volatile)
+
+
+def link_order(
+    linked: list[EntityDef], reads: dict[str, frozenset[str]]
+) -> list[EntityDef]:
+    """``read_register`` entities in an order that renders each after the
+    others it reads; the given order if they read each other in a cycle."""
+    by_key = {e.key: e for e in linked}
+    graph = {e.key: reads.get(e.key, frozenset()) & by_key.keys() for e in linked}
+    try:
+        return [by_key[key] for key in TopologicalSorter(graph).static_order()]
+    except CycleError:
+        return linked
+
+
 class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """One coordinator per configured device (gateway + Modbus device id).
 
@@ -232,6 +424,7 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.device_def = device
         self.device_id: int = entry.data[CONF_SLAVE_ID]
         self.entry_id = entry.entry_id
+        self._entry = entry
 
         # Group visibility. Only entities/templates in an enabled group are created,
         # and only the registers those (and their data dependencies) need are polled.
@@ -272,6 +465,17 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             e for e in device.entities if e.static_value is not None and e.key in needed
         ]
         self._link_templates: dict[str, Any] = {}
+        # Who renders from each key: a refresh re-renders the read_register
+        # entities and templates its changed values reach, not all of them
+        # (see _async_update_data and affects). Links render in dependency order.
+        reads, self._volatile = template_reads(device)
+        self._dependents: dict[str, list[str]] = {}
+        for item, keys in reads.items():
+            for key in keys:
+                self._dependents.setdefault(key, []).append(item)
+        self._linked = link_order(self._linked, reads)
+        # The data a refresh published, and the items it left stale.
+        self._render_scope: tuple[dict[str, Any], frozenset[str]] | None = None
         # Per-refresh hooks (see async_add_refresh_callback). Separate from the
         # coordinator listeners, which always_update=False skips on unchanged data.
         self._refresh_callbacks: list[Callable[[dict[str, Any]], None]] = []
@@ -289,19 +493,71 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._interval_for = {e.key: interval_for[e.key] for e in self._readers}
         self._tick: int = min(self._interval_for.values(), default=floor)
         self._next_due: dict[str, float] = dict.fromkeys(self._interval_for, 0.0)
-        # Device-declared dead registers seed the same set the planner grows from
-        # failed reads, so they are never read or bridged across.
-        self.holes: set[tuple[str, int]] = set(device.bad_addresses)
-        self._cache: dict[tuple[str, int], int | bool] = {}
+        # Device-declared dead registers seed the same index the planner grows
+        # from failed reads, so they are never read or bridged across. Both are
+        # range indexes built once; the planner queries them by bisect.
+        self.holes = AddressIndex(device.bad_addresses)
+        self._boundaries = AddressIndex(device.boundaries)
+        # Read limits to plan with: the device file's, unless the opt-in tuner
+        # grows them from live measurements (restored per entry by
+        # async_restore_read_limits; see _step_tuner).
+        self.max_read = device.max_read
+        self.max_gap = device.max_gap
+        self.tuner = (
+            ReadLimitTuner(device.max_read, device.max_gap)
+            if entry.options.get(OPTION_AUTO_TUNE)
+            else None
+        )
+        self._read_limits_store = read_limits_store(hass, entry.entry_id)
+        # Read plans memoized per due set (see _plan_for), the cadence
+        # classes' among them (_stagger plans those up front). The generation
+        # counts hole learning — the only runtime change to the planner's
+        # inputs; the entity set and boundaries are fixed until a reload.
+        self._plan_cache: dict[
+            frozenset[str], tuple[int, list[Span], list[Span], tuple[EntityDef, ...]]
+        ] = {}
+        self._plan_generation = 0
+        # Cadence classes (entities sharing a period in ticks) run on staggered
+        # phases so their reads do not all pile onto the same ticks; see
+        # _stagger. A key's first delay after its initial read moves it onto
+        # its phase — popped once used, later reads follow plain intervals (and
+        # a reader read early moves on along its phase; see _async_update_data).
+        self._period_for = {
+            key: period_ticks(interval, self._tick)
+            for key, interval in self._interval_for.items()
+        }
+        self._phases = self._stagger()
+        self._phase_delay: dict[str, float] = {
+            key: self._phases[period] * self._tick
+            for key, period in self._period_for.items()
+            if self._phases[period]
+        }
+        # Raw values as last read (or written), with when: a masked
+        # read-modify-write may start from a word younger than rmw_max_age.
+        self._cache = RawCache()
+        # Each entity's last decoded value, and the entities over each
+        # (table, address): a store drops the decodes of just the entities
+        # whose words it changed, so a cycle decodes what moved, not what is due.
+        self._decoded: dict[str, Any] = {}
+        # Every entity's codec, specialized once for its definition.
+        self._codecs = {e.key: codec.compile(e) for e in device.entities}
+        # Where the plain numbers of each block read sit, to decode them in bulk.
+        self._layouts: dict[Span, codec.BlockLayout] = {}
+        self._covering: dict[tuple[str, int], list[str]] = {}
+        for e in device.entities:
+            for a in range(e.span.start, e.span.end):
+                self._covering.setdefault((e.table, a), []).append(e.key)
         # Keys whose last read failed and that already got their one quick retry;
         # see _async_update_data.
         self._retried: set[str] = set()
-        self._full_plan_cache: tuple[int, int] | None = None
         self.consecutive_failures = 0
         # Read efficiency (diagnostic): block merging lets one Modbus read cover many
         # entities, so these are typically far below read_entity_count.
         self.last_read_count = 0    # block reads issued in the last refresh
         self.last_polled_count = 0  # entities that refresh actually covered
+        self.last_piggybacked_count = 0  # ...of which rode along before falling due
+        self.last_decoded_count = 0  # ...of which changed words had to be decoded
+        self._decodes = 0
         # Read health (diagnostic): unrecovered polling failures — failed read
         # transactions and failed connection attempts. The deque feeds the
         # "failed in the last 5 minutes" indicator, the total its counter, and
@@ -317,6 +573,20 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.quarantined: dict[str, float] = {}
         self._fail_streak: dict[str, int] = {}
         self._cycle_illegal: set[str] = set()
+        # Holding-register writes waiting for their batch, and the timer that
+        # ends the coalescing window (see _write_coalesced).
+        self._pending_writes: list[_PendingWrite] = []
+        self._write_flush: asyncio.TimerHandle | None = None
+        # Write queue health (diagnostic): the deepest the queue got, writes
+        # superseded by a newer value before reaching the wire, and writes
+        # skipped because the register already held the value.
+        self.max_pending_writes = 0
+        self.collapsed_writes = 0
+        self.unchanged_writes = 0
+        self.rmw_cache_hits = 0  # masked writes that started from a fresh cached word
+        # Writes shown optimistically until their deferred read-back (see
+        # _confirm_later): entity key → the write awaiting confirmation.
+        self._unconfirmed: dict[str, _PendingWrite] = {}
 
         # The prefix drives entity ids; the name is the device/entry title.
         # Old entries stored their device name in CONF_PREFIX.
@@ -448,6 +718,47 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._trim_failure_window()
         return len(self._failure_times)
 
+    @property
+    def bus_share(self) -> float:
+        """This entry's fraction of the polling time on its (shared) bus."""
+        return round(self.client.bus_share().get(self.entry_id, 0.0), 3)
+
+    @property
+    def bus_wait_times(self) -> dict[str, dict[str, float]]:
+        """Queue waits per priority class on this entry's (shared) bus."""
+        return self.client.wait_times()
+
+    @property
+    def request_latency(self) -> dict[str, Any]:
+        """This device's recent answer latencies and failure counts on the wire."""
+        return self.client.metrics.device_summary(self.device_id, time.monotonic())
+
+    @property
+    def round_trip(self) -> dict[str, Any] | None:
+        """This device's round-trip estimate and adaptive read timeout, once measured."""
+        return self.client.round_trips().get(self.device_id)
+
+    @property
+    def circuit_breaker(self) -> dict[str, Any] | None:
+        """This device's circuit-breaker state on its (shared) bus, once it was asked."""
+        return self.client.circuit_breakers().get(self.device_id)
+
+    @property
+    def transaction_metrics(self) -> dict[str, Any]:
+        """Latency histograms, bytes and outcomes of the whole (shared) bus."""
+        return self.client.metrics.as_dict(time.monotonic())
+
+    @property
+    def write_queue(self) -> dict[str, int]:
+        """Queued register writes now, at most, and those that never hit the wire."""
+        return {
+            "pending": len(self._pending_writes),
+            "max_pending": self.max_pending_writes,
+            "collapsed": self.collapsed_writes,
+            "unchanged": self.unchanged_writes,
+            "rmw_cache_hits": self.rmw_cache_hits,
+        }
+
     @property
     def quarantine_status(self) -> dict[str, int]:
         """Quarantined entity keys → seconds until their next re-probe."""
@@ -502,23 +813,134 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         ids.add(f"{self.entry_id}_remove_hidden_entities")
         ids.add(f"{self.entry_id}_read_failures")
         ids.add(f"{self.entry_id}_failed_reads")
+        ids.add(f"{self.entry_id}_request_latency")
+        ids.add(f"{self.entry_id}_bus_wait")
         return ids
 
-    def _plan(self, spans: set[Span]) -> list[Span]:
+    def _plan(self, spans: Sequence[Span]) -> list[Span]:
         """Plan read blocks with this device's read limits and current holes.
 
-        The two full-refresh planners; the unbridged per-span fallback in
+        Reached through the memoizing :meth:`_plan_for`; the unbridged per-span fallback in
         ``_read_with_fallback`` deliberately calls ``plan_blocks`` with only
         ``max_read`` (no gap bridging), so it is not routed through here.
         """
         return plan_blocks(
             spans,
-            max_read=self.device_def.max_read,
-            max_gap=self.device_def.max_gap,
+            max_read=self.max_read,
+            max_gap=self.max_gap,
             holes=self.holes,
-            boundaries=self.device_def.boundaries,
+            boundaries=self._boundaries,
+            cost=self.device_def.read_cost,
         )
 
+    def _plan_for(
+        self, entities: list[EntityDef]
+    ) -> tuple[list[Span], list[Span], tuple[EntityDef, ...]]:
+        """The sorted spans of ``entities``, their read plan, and its free riders.
+
+        The riders are the other readers whose registers the planned blocks
+        already cover — reading them costs nothing extra (see
+        _async_update_data). Every tick with the same due entities plans the
+        same blocks, so the sorting, merging and rider search run once per
+        shape and generation. The returned values are shared with the cache —
+        callers must not mutate them.
+        """
+        key = frozenset(e.key for e in entities)
+        cached = self._plan_cache.get(key)
+        if cached is None or cached[0] != self._plan_generation:
+            if len(self._plan_cache) >= _PLAN_CACHE_SIZE:
+                self._plan_cache.clear()
+            spans = sorted({e.span for e in entities})
+            blocks = self._plan(spans)
+            riders = tuple(
+                e
+                for e in self._readers
+                if e.key not in key and covering_block(blocks, e.span) is not None
+            )
+            cached = self._plan_cache[key] = (self._plan_generation, spans, blocks, riders)
+        return cached[1], cached[2], cached[3]
+
+    def _class_readers(self, periods: Iterable[int]) -> list[EntityDef]:
+        """Every reader in the given cadence classes."""
+        return [e for e in self._readers if self._period_for[e.key] in periods]
+
+    def _stagger(self) -> dict[int, int]:
+        """Phase offsets (in ticks) per cadence class, weighted by planned reads."""
+        return stagger_phases(
+            {
+                p: len(self._plan_for(self._class_readers({p}))[1])
+                for p in set(self._period_for.values())
+            }
+        )
+
+    @property
+    def predicted_reads_per_tick(self) -> dict[int, int]:
+        """Block reads per tick over one schedule cycle → how many ticks issue that many.
+
+        A prediction from the staggered phases and the current read plans;
+        retries, quarantine probes and read-ahead are not in it. The largest
+        key is the busiest tick the bus has to absorb.
+        """
+        reads: dict[frozenset[int], int] = {}
+        histogram: Counter[int] = Counter()
+        for tick in range(horizon(self._phases.keys())):
+            due = due_periods(self._phases, tick)
+            if due not in reads:
+                reads[due] = len(self._plan_for(self._class_readers(due))[1]) if due else 0
+            histogram[reads[due]] += 1
+        return dict(sorted(histogram.items()))
+
+    def _learn_holes(self, ranges: list[Span]) -> None:
+        """Add unreadable address ranges to the planner's holes; stale plans drop out."""
+        for hole in ranges:
+            self.holes.add_range(hole.table, hole.start, hole.end)
+        self._invalidate_plans()
+
+    def _invalidate_plans(self) -> None:
+        """Drop every memoized plan after a change to the planner's inputs."""
+        self._plan_generation += 1
+        self._plan_cache.clear()
+
+    async def async_restore_read_limits(self) -> None:
+        """Resume auto-tuning from the limits an earlier run learned.
+
+        Stored limits belong to one device file; after switching files they
+        no longer apply and tuning starts over from the new file's limits.
+        """
+        if self.tuner is None:
+            return
+        stored = await self._read_limits_store.async_load()
+        if not stored or stored.get("filename") != self.device_def.filename:
+            return
+        self.tuner = ReadLimitTuner(**stored["limits"])
+        self.max_read, self.max_gap = self.tuner.max_read, self.tuner.max_gap
+        self._invalidate_plans()
+
+    def _step_tuner(self, tuner: ReadLimitTuner) -> None:
+        """Close the tuner's cycle; replan and persist when the limits move."""
+        capped = any(b.count >= self.max_read for b in self._full_plan())
+        learned = tuner.as_dict()
+        if tuner.step(capped):
+            _LOGGER.debug(
+                "%s: read limits %d/%d -> %d/%d (max_read/max_gap)",
+                self.name,
+                self.max_read,
+                self.max_gap,
+                tuner.max_read,
+                tuner.max_gap,
+            )
+            self.max_read, self.max_gap = tuner.max_read, tuner.max_gap
+            self._invalidate_plans()
+        if tuner.as_dict() != learned:
+            self._read_limits_store.async_delay_save(
+                lambda: {"filename": self.device_def.filename, "limits": tuner.as_dict()},
+                _READ_LIMITS_SAVE_DELAY,
+            )
+
+    def _full_plan(self) -> list[Span]:
+        """The blocks of a complete refresh — every reader due at once."""
+        return self._plan_for(self._readers)[1]
+
     @property
     def full_refresh_read_count(self) -> int:
         """Modbus block reads a complete refresh issues — every reader due at once.
@@ -529,14 +951,17 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         reload, or a rejected bridge address teaching the planner a new hole. That
         stability is what keeps the diagnostic sensor cheap for the recorder.
         """
-        if not self._readers:
-            return 0
-        # The plan only shifts when a hole is learned; cache on the hole count so
-        # the sensor's state reads don't re-plan every cycle.
-        if self._full_plan_cache is None or self._full_plan_cache[0] != len(self.holes):
-            blocks = self._plan({e.span for e in self._readers})
-            self._full_plan_cache = (len(self.holes), len(blocks))
-        return self._full_plan_cache[1]
+        return len(self._full_plan())
+
+    @property
+    def full_refresh_read_time(self) -> float:
+        """Estimated wire time of a complete refresh, in seconds.
+
+        Priced with the device file's ``read_cost`` model, else a typical
+        RS-485 gateway's; as stable as :attr:`full_refresh_read_count`.
+        """
+        cost = self.device_def.read_cost or DEFAULT_READ_COST
+        return round(estimate_read_time(self._full_plan(), cost), 3)
 
     # --- device info ----------------------------------------------------------
 
@@ -613,22 +1038,43 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._notify_refresh(data)
             return data
 
-        spans = {e.span for e in due}
-        blocks = self._plan(spans)
-        async with self.client.lock:
+        spans, blocks, riders = self._plan_for(due)
+        riders = tuple(e for e in riders if e.key not in self.quarantined)
+        if self.device_def.read_ahead:
+            blocks, ahead = self._read_ahead(due, blocks, riders, now)
+            if ahead:
+                riders += ahead
+                # The grown blocks need these spans too: a failed block's
+                # fallback must retry them, not learn them as bridged filler.
+                spans = sorted({*spans, *(e.span for e in ahead)})
+        # Turns on a shared bus go earliest deadline first; this cycle's is the
+        # next tick, when the following cycle starts. Until the entry has any
+        # data its entities show nothing, so the first refresh jumps the polls.
+        deadline = now + self._tick
+        priority = PRIORITY_POLL if self.data is not None else PRIORITY_URGENT
+        async with self.client.turn(self.entry_id, deadline, priority):
             if not await self.client.ensure_connected():
                 self._record_read_failure()
                 self._register_failure()
                 raise UpdateFailed(f"cannot connect to {self.client.target}")
-        ok_blocks = 0
-        reads = 0
-        # The lock is taken per block, not around the whole refresh, so a user
-        # write never waits behind a long (or timing-out) poll cycle.
-        for block in blocks:
-            async with self.client.lock:
-                yielded, n = await self._read_with_fallback(block, spans)
-            ok_blocks += yielded
-            reads += n
+
+        decodes = self._decodes  # the stores below decode in bulk
+        # The bus is taken per block, not around the whole refresh, so a user
+        # write never waits behind a long (or timing-out) poll cycle, and other
+        # entries on the same gateway interleave by deadline.
+        async def read(block: Span) -> tuple[int, int]:
+            async with self.client.turn(self.entry_id, deadline, priority):
+                return await self._read_with_fallback(block, spans)
+
+        if self.client.depth > 1:
+            # A pipelining gateway takes the blocks all at once; the turns keep
+            # at most ``depth`` of them in flight. Blocks never overlap, so
+            # their stores (and fallbacks) cannot collide.
+            results = await asyncio.gather(*(read(block) for block in blocks))
+        else:
+            results = [await read(block) for block in blocks]
+        ok_blocks = sum(yielded for yielded, _ in results)
+        reads = sum(n for _, n in results)
         # Quarantined registers re-probe standalone on their own slow cadence,
         # never inside the healthy blocks; a recovered entity rejoins ``due``
         # and decodes below like any other.
@@ -637,8 +1083,16 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 ok_blocks += 1
                 due.append(self.entity_defs[key])
             reads += 1
+        # Riders ride along only on blocks that actually came back: a failed
+        # block's fallback reads just the due spans, and an entity that was not
+        # due must not pick up a failure (or a retry) from a read it never needed.
+        rode = [e for e in riders if not self.missing(e)]
+        due.extend(rode)
         self.last_read_count = reads
         self.last_polled_count = len(due)
+        self.last_piggybacked_count = len(rode)
+        if self.tuner is not None:
+            self._step_tuner(self.tuner)
 
         # Failing probes alone are no outage: with no regular block due, the
         # cycle leaves the device's health untouched.
@@ -652,6 +1106,7 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # and push its confirmed value into self.data — a copy taken at refresh
         # start would revert that value for every entity not due this cycle.
         data = self._seeded_data()
+        changed: set[str] = set()
         for defn in due:
             value = self._decode(defn)
             unread = value is None and self.missing(defn)
@@ -661,7 +1116,10 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._fail_streak.pop(defn.key, None)
             if value is None and defn.optimistic_default is not None:
                 value = defn.optimistic_default  # keep the control usable
-            data[defn.key] = self._postprocess(defn, data.get(defn.key), value)
+            value = self._postprocess(defn, data.get(defn.key), value)
+            if defn.key not in data or data[defn.key] != value:
+                changed.add(defn.key)
+            data[defn.key] = value
             # An entity whose block read failed gets one quick retry on the next
             # tick instead of waiting out its whole interval (which can be long);
             # if the retry fails too, it falls back to the normal cadence. A
@@ -672,23 +1130,100 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._retried.add(defn.key)
             else:
                 self._retried.discard(defn.key)
-                self._next_due[defn.key] = now + self._interval_for[defn.key]
-        # read_register entities take their value from other (just-decoded) values
+                delay = self._phase_delay.pop(defn.key, None)
+                slot = self._next_due[defn.key]
+                interval = self._interval_for[defn.key]
+                if delay or slot <= now:
+                    self._next_due[defn.key] = now + (delay or interval)
+                else:
+                    # Read early, riding along or read ahead: on to the first
+                    # slot a whole interval away. Its own read is saved, and
+                    # the cadence class keeps the phase _stagger gave it.
+                    slots = math.ceil((now + interval - slot) / interval)
+                    self._next_due[defn.key] = slot + slots * interval
+        self.last_decoded_count = self._decodes - decodes
+        # A write awaiting its deferred read-back keeps its optimistic value:
+        # the device may not have applied it yet when this poll read it.
+        for key in self._unconfirmed.keys() & data.keys():
+            data[key] = self._unconfirmed[key].value
+        # read_register entities take their value from other (just-decoded)
+        # values. Only those a changed value reaches render again, each after
+        # the links it reads; templates go by the same reach (see affects).
+        # After a failure, or on the first refresh, everything renders.
+        render_all = self.data is None or not self.last_update_success
+        stale = set(self._volatile)
+        for key in changed:
+            stale.update(self._dependents.get(key, ()))
         for defn in self._linked:
-            data[defn.key] = self._render_link(defn, data)
+            if not render_all and defn.key not in stale:
+                continue
+            value = self._render_link(defn, data)
+            if defn.key not in data or data[defn.key] != value:
+                stale.update(self._dependents.get(defn.key, ()))
+            data[defn.key] = value
+        self._render_scope = None if render_all else (data, frozenset(stale))
         self._notify_refresh(data)
         return data
 
+    def affects(self, key: str) -> bool:
+        """Whether the last update may change what template ``key`` renders.
+
+        After a refresh, only the templates its changed values reach (and
+        those reading Home Assistant state or the time) render again. Any
+        other update — a write's confirmed value, a failure — reaches all.
+        """
+        scope = self._render_scope
+        if scope is None or scope[0] is not self.data or not self.last_update_success:
+            return True
+        return key in scope[1]
+
+    def _read_ahead(
+        self,
+        due: list[EntityDef],
+        blocks: list[Span],
+        riders: tuple[EntityDef, ...],
+        now: float,
+    ) -> tuple[list[Span], tuple[EntityDef, ...]]:
+        """Pull in readers falling due within ``read_ahead`` seconds — when they fit.
+
+        A soon-due entity joins this cycle only if a planned block can grow to
+        cover it without another request (same cap, gap, hole and boundary
+        rules); the soonest due claim the room first. Returns the grown blocks
+        and the entities they took in.
+        """
+        assert self.device_def.read_ahead is not None
+        horizon = now + self.device_def.read_ahead
+        skip = {e.key for e in due} | {e.key for e in riders}
+        soon = sorted(
+            (
+                e
+                for e in self._readers
+                if e.key not in skip
+                and e.key not in self.quarantined
+                and self._next_due[e.key] <= horizon
+            ),
+            key=lambda e: self._next_due[e.key],
+        )
+        if not soon:
+            return blocks, ()
+        grown, taken = absorb_spans(
+            blocks,
+            [e.span for e in soon],
+            max_read=self.max_read,
+            max_gap=self.max_gap,
+            holes=self.holes,
+            boundaries=self._boundaries,
+        )
+        fits = set(taken)
+        return grown, tuple(e for e in soon if e.span in fits)
+
     def missing(self, defn: EntityDef) -> bool:
         """Whether any of the entity's addresses is absent from the raw cache
         (i.e. its last block read failed, as opposed to a decode error).
 
         Public: entity availability uses this to tell a real outage apart
         from an answered read whose value merely fails to decode or map."""
-        return any(
-            (defn.table, a) not in self._cache
-            for a in range(defn.span.start, defn.span.end)
-        )
+        return self._cache.missing(defn.span)
 
     def key_lookup(self, data: dict[str, Any] | None) -> Callable[[str], Any]:
         """Build the template ``key(name)`` helper bound to ``data``.
@@ -723,7 +1258,9 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             template = self._link_templates[defn.key] = Template(source, self.hass)
         return render_over_values(template, data, key_fn=self.key_lookup(data))
 
-    async def _read_with_fallback(self, block: Span, spans: set[Span]) -> tuple[int, int]:
+    async def _read_with_fallback(
+        self, block: Span, spans: Sequence[Span]
+    ) -> tuple[int, int]:
         """Read one block; on failure retry its spans without gap bridging.
 
         Returns ``(yielded, reads)``: ``yielded`` is 1 if anything was read (else
@@ -733,19 +1270,31 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         several spans is isolated once more into one read per span, so a single
         dead register cannot take its readable neighbours down with it.
         """
+        started = time.monotonic()
         try:
             self._store(block, await self.client.read_block(self.device_id, block))
-            return 1, 1
         except ReadError as err:
+            if err.circuit_open:
+                # The device is known to be silent and nothing hit the wire:
+                # no fallback to try, nothing for the tuner or hole learning.
+                self._clear(block)
+                self._record_read_failure()
+                return 0, 0
+            self._observe_read(block, spans, started, ok=False)
             # Drop the whole failed range before retrying: successful sub-reads
             # re-store their part, and whatever stays failed must not decode from
             # a previous cycle's words (a mixed-generation value).
             self._clear(block)
             block_illegal = err.illegal_address
             _LOGGER.debug("Block %s failed (%s), retrying unbridged", block, err)
+        else:
+            self._observe_read(block, spans, started, ok=True)
+            return 1, 1
 
         needed = spans_in_block(block, spans)
-        sub_blocks = plan_blocks(needed, max_read=self.device_def.max_read)
+        # A read-limit trial that failed must not fail the fallback too.
+        safe_read = self.tuner.good_read if self.tuner else self.max_read
+        sub_blocks = plan_blocks(needed, max_read=safe_read)
         # No unbridged sub-plan to fall back to: the block was a single span, a
         # run of adjacent spans that merge straight back into it, or a
         # max_read-sized chunk of a larger span (no span fully inside it).
@@ -761,9 +1310,11 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         any_ok = False
         reads = 1 + len(sub_blocks)  # initial try + each sub-read
         for sub in sub_blocks:
+            started = time.monotonic()
             try:
                 self._store(sub, await self.client.read_block(self.device_id, sub))
                 any_ok = True
+                self._observe_read(sub, needed, started, ok=True)
             except ReadError as err:
                 all_ok = False
                 _LOGGER.debug("Fallback read %s failed: %s", sub, err)
@@ -775,22 +1326,44 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 else:
                     self._record_read_failure(sub, illegal=err.illegal_address)
 
-        if any_ok and all_ok:
+        if any_ok and all_ok and not self._is_limit_trial(block, needed):
             # Every real span read fine on retry: the initial failure was only
             # bridged filler (learned as holes below, so it will not repeat) —
             # a planning artifact, not a device problem, so it is not recorded.
-            new_holes = bridged_addresses(block, needed)
+            # A read-limit trial may have failed for its size or gap alone; the
+            # tuner, fed the failure above, backs off from it instead.
+            new_holes = bridged_ranges(block, needed)
             if new_holes:
-                self.holes |= new_holes
+                self._learn_holes(new_holes)
                 _LOGGER.info(
                     "%s: device rejects %d bridged filler address(es) in the %s table; "
                     "not bridging them again",
                     self.name,
-                    len(new_holes),
+                    sum(hole.count for hole in new_holes),
                     block.table,
                 )
         return (1 if any_ok else 0), reads
 
+    def _is_limit_trial(self, block: Span, spans: Sequence[Span]) -> bool:
+        """Whether ``block`` goes beyond the read limits every read has accepted."""
+        if self.tuner is None:
+            return False
+        gap = max((g.count for g in bridged_ranges(block, spans)), default=0)
+        return block.count > self.tuner.good_read or gap > self.tuner.good_gap
+
+    def _observe_read(
+        self, block: Span, spans: Sequence[Span], started: float, *, ok: bool
+    ) -> None:
+        """Feed a block read to the read-limit tuner, if on.
+
+        A planned block's first attempt, or an unbridged fallback read that
+        answered (the device is up, so a failed trial was refused for its limits).
+        """
+        if self.tuner is None:
+            return
+        gap = max((g.count for g in bridged_ranges(block, spans)), default=0)
+        self.tuner.observe(block, gap, time.monotonic() - started, ok)
+
     async def _read_spans_isolated(self, needed: list[Span]) -> tuple[bool, int]:
         """Read each span on its own to tell a dead register from its neighbours.
 
@@ -816,7 +1389,7 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         probe and stays out of the health window (see _record_read_failure).
         """
         span = self.entity_defs[key].span
-        async with self.client.lock:
+        async with self.client.turn(self.entry_id, now + self._tick, PRIORITY_URGENT):
             try:
                 self._store(span, await self.client.read_block(self.device_id, span))
             except ReadError as err:
@@ -828,26 +1401,57 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         _LOGGER.info("%s: %s reads again; lifting its quarantine", self.name, key)
         return True
 
-    def _store(self, block: Span, values: list[int] | list[bool]) -> None:
-        for i, addr in enumerate(range(block.start, block.end)):
-            self._cache[(block.table, addr)] = values[i]
+    def _store(self, block: Span, values: Sequence[int] | Sequence[bool]) -> None:
+        changed = self._cache.store(block, values, time.monotonic())
+        if not changed:
+            return
+        stale = self._invalidate(block.table, changed)
+        if len(stale) > 1 and block.table not in BIT_TABLES:
+            # Several values moved: decode the block's plain numbers in bulk
+            # while its words are at hand; the rest decode one by one on use.
+            decoded = codec.decode_block(values, self._layout(block), stale)
+            self._decoded.update(decoded)
+            self._decodes += len(decoded)
 
     def _clear(self, block: Span) -> None:
-        for addr in range(block.start, block.end):
-            self._cache.pop((block.table, addr), None)
+        self._cache.clear(block)
+        self._invalidate(block.table, range(block.start, block.end))
+
+    def _invalidate(self, table: str, addresses: Iterable[int]) -> set[str]:
+        """Drop the decoded values of the entities over these addresses;
+        their keys."""
+        stale: set[str] = set()
+        for address in addresses:
+            stale.update(self._covering.get((table, address), ()))
+        for key in stale:
+            self._decoded.pop(key, None)
+        return stale
+
+    def _layout(self, block: Span) -> codec.BlockLayout:
+        layout = self._layouts.get(block)
+        if layout is None:
+            if len(self._layouts) >= _LAYOUT_CACHE_SIZE:
+                self._layouts.clear()
+            layout = codec.block_layout(block, self.entity_defs.values())
+            self._layouts[block] = layout
+        return layout
 
     def _decode(self, defn: EntityDef) -> Any:
-        raw = [
-            self._cache.get((defn.table, a))
-            for a in range(defn.span.start, defn.span.end)
-        ]
-        if any(v is None for v in raw):
+        """The entity's value from the raw cache; decoded again only after a
+        store changed one of its words (see _invalidate)."""
+        if defn.key in self._decoded:
+            return self._decoded[defn.key]
+        raw = self._cache.read(defn.span)
+        if raw is None:
             return None
+        self._decodes += 1
         try:
-            return codec.decode(defn, raw)  # type: ignore[arg-type]
+            value = self._codecs[defn.key].decode(raw)
         except (codec.CodecError, ValueError, struct.error) as err:
             _LOGGER.debug("Decoding %s failed: %s", defn.key, err)
-            return None
+            value = None
+        self._decoded[defn.key] = value
+        return value
 
     def _postprocess(self, defn: EntityDef, old: Any, new: Any) -> Any:
         """Value sanity filters: max_change spike rejection, never_resets guard."""
@@ -922,7 +1526,7 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return words
 
     async def _perform_write(self, defn: EntityDef, value: Any) -> Any:
-        """Write ``value`` for ``defn``; the client lock is held and connected.
+        """Write ``value`` for ``defn``; a write turn is held and connected.
 
         Returns the value to confirm with — a single-template button resolves its
         template here so the caller can echo the rendered value back.
@@ -947,9 +1551,8 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
         current_raw: int | None = None
         if defn.mask is not None and defn.read_modify_write:
-            raw = await self.client.read_block(self.device_id, defn.span)
-            current_raw = int(raw[0])
-        payload = codec.encode(defn, value, current_raw=current_raw)
+            current_raw = await self._current_word(defn)
+        payload = self._codecs[defn.key].encode(value, current_raw)
         # `== TABLE_COIL`, not `in BIT_TABLES`: coil is the only writable bit table
         # (discrete inputs are read-only), so the else-branch is always holding.
         if defn.table == TABLE_COIL:
@@ -959,50 +1562,360 @@ class ModbusConnectCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await self.client.write_registers(
                 self.device_id, defn.address, payload, multiple=defn.write_multiple
             )
+            self._store(Span(defn.table, defn.address, len(payload)), payload)
         return value
 
+    async def _current_word(self, defn: EntityDef) -> int:
+        """The register a masked read-modify-write starts from (turn held).
+
+        A cached word no older than the device's ``rmw_max_age`` is reused —
+        several mask entities often share one control register, and a scene
+        toggling them would otherwise read it before every write. Anything
+        older is read, and cached for the next one.
+        """
+        key = (defn.table, defn.address)
+        max_age = self.device_def.rmw_max_age
+        stored_at = self._cache.stored_at(key)
+        if (
+            max_age is not None
+            and stored_at is not None
+            and time.monotonic() - stored_at <= max_age
+        ):
+            self.rmw_cache_hits += 1
+            return int(self._cache[key])
+        raw = await self.client.read_block(self.device_id, defn.span)
+        self._store(defn.span, raw)
+        return int(raw[0])
+
     async def _confirm_write(self, defn: EntityDef, value: Any) -> Any:
-        """Read a just-written non-button entity back to confirm it (lock held).
+        """Read a just-written non-button entity back to confirm it (turn held).
 
         Entities with no own read-back (read_register / static_value) echo the
         written value instead.
         """
-        if defn.read_register is not None or defn.static_value is not None:
+        if not _reads_back(defn):
             return value  # no read-back; read elsewhere or not at all
         if defn.confirm_delay is not None:
-            # The device is still applying the write; holding the lock keeps
+            # The device is still applying the write; holding the turn keeps
             # the bus quiet until the read-back.
             await asyncio.sleep(defn.confirm_delay)
         self._store(defn.span, await self.client.read_block(self.device_id, defn.span))
+        return self._confirmed(defn)
+
+    def _confirmed(self, defn: EntityDef) -> Any:
+        """The value read back for ``defn``, or its optimistic_default."""
         confirmed = self._decode(defn)
         if confirmed is None and defn.optimistic_default is not None:
             confirmed = defn.optimistic_default
         return confirmed
 
-    async def async_write(self, defn: EntityDef, value: Any) -> None:
-        """Encode and write a value, then read it back to confirm."""
+    def _cannot_connect(self) -> HomeAssistantError:
+        return HomeAssistantError(
+            f"Cannot connect to {self.client.target}",
+            translation_domain=DOMAIN,
+            translation_key="cannot_connect",
+            translation_placeholders={"target": self.client.target},
+        )
+
+    @staticmethod
+    def _write_failed(defn: EntityDef, err: Exception) -> HomeAssistantError:
+        error = HomeAssistantError(
+            f"Writing {defn.key} failed: {err}",
+            translation_domain=DOMAIN,
+            translation_key="write_failed",
+            translation_placeholders={"key": defn.key, "error": str(err)},
+        )
+        error.__cause__ = err
+        return error
+
+    async def async_write(
+        self, defn: EntityDef, value: Any, *, latest_wins: bool = False
+    ) -> None:
+        """Encode and write a value, then read it back to confirm.
+
+        Holding-register writes are coalesced (see :meth:`_write_coalesced`);
+        coils and buttons are written on their own. ``latest_wins`` marks a
+        setting rather than a command: a newer value for the entity may
+        replace it before it is written, and it is skipped when the register
+        already holds it.
+        """
+        if defn.table != TABLE_COIL and defn.platform != "button":
+            await self._write_coalesced(defn, value, latest_wins)
+            return
         confirmed: Any = None
+        defer = (
+            defn.confirm_delay is not None
+            and not self.device_def.confirm_holds_bus
+            and _reads_back(defn)
+        )
         try:
-            async with self.client.lock:
+            # The write and its read-back share one turn that overtakes every
+            # queued poll on the bus (see ModbusBlockClient.turn).
+            async with self.client.turn(self.entry_id, time.monotonic(), PRIORITY_WRITE):
                 if not await self.client.ensure_connected():
-                    raise HomeAssistantError(
-                        f"Cannot connect to {self.client.target}",
-                        translation_domain=DOMAIN,
-                        translation_key="cannot_connect",
-                        translation_placeholders={"target": self.client.target},
-                    )
+                    raise self._cannot_connect()
                 value = await self._perform_write(defn, value)
                 if defn.platform != "button":
-                    confirmed = await self._confirm_write(defn, value)
+                    confirmed = value if defer else await self._confirm_write(defn, value)
         except (ReadError, WriteError, codec.CodecError) as err:
-            raise HomeAssistantError(
-                f"Writing {defn.key} failed: {err}",
-                translation_domain=DOMAIN,
-                translation_key="write_failed",
-                translation_placeholders={"key": defn.key, "error": str(err)},
-            ) from err
+            raise self._write_failed(defn, err) from err
 
         if defn.platform != "button":
             data = dict(self.data) if self.data else {}
             data[defn.key] = confirmed
             self.async_set_updated_data(data)
+            if defer:
+                future: asyncio.Future[None] = self.hass.loop.create_future()
+                future.set_result(None)
+                self._confirm_later([_PendingWrite(defn, value, future, False)])
+
+    async def _write_coalesced(self, defn: EntityDef, value: Any, latest_wins: bool) -> None:
+        """Queue a holding-register write and wait until its batch is written.
+
+        Writes arriving within ``WRITE_COALESCE_SECONDS`` of the first — a
+        climate action setting several registers, an automation setting a
+        schedule — are written together by one write turn, which also takes
+        the writes queued while it waited for the bus.
+
+        With ``latest_wins``, a write to an entity that still has one queued
+        replaces it, and both callers wait for the newer value — a dragged
+        slider or a ramp automation puts one value per batch on the wire,
+        not every step. The wait is shielded, so a caller giving up does not
+        take the queued value with it.
+        """
+        future: asyncio.Future[None] | None = None
+        for queued in self._pending_writes if latest_wins else ():
+            if queued.latest_wins and queued.defn.key == defn.key:
+                self._pending_writes.remove(queued)
+                future = queued.future
+                self.collapsed_writes += 1
+                break
+        if future is None:
+            future = self.hass.loop.create_future()
+        self._pending_writes.append(_PendingWrite(defn, value, future, latest_wins))
+        self.max_pending_writes = max(self.max_pending_writes, len(self._pending_writes))
+        if self._write_flush is None:
+            self._write_flush = self.hass.loop.call_later(
+                WRITE_COALESCE_SECONDS, self._start_write_flush
+            )
+        await asyncio.shield(future)
+
+    def _start_write_flush(self) -> None:
+        # An entry task: unloading the entry cancels a batch still in flight.
+        self._entry.async_create_background_task(
+            self.hass, self._flush_writes(), f"{self.name} write batch"
+        )
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and drop the write queue; queued writes fail."""
+        await super().async_shutdown()
+        if self._write_flush is not None:
+            self._write_flush.cancel()
+            self._write_flush = None
+        batch, self._pending_writes = self._pending_writes, []
+        for write in batch:
+            _settle(
+                write.future,
+                self._write_failed(write.defn, ConnectionError(f"{self.name} is unloading")),
+            )
+
+    async def _flush_writes(self) -> None:
+        async with self.client.turn(self.entry_id, time.monotonic(), PRIORITY_WRITE):
+            batch, self._pending_writes = self._pending_writes, []
+            self._write_flush = None
+            if not batch:
+                return
+            try:
+                await self._write_batch(batch)
+            except asyncio.CancelledError:
+                for write in batch:
+                    write.future.cancel()
+                raise
+            except Exception as err:
+                # e.g. cannot connect: every caller in the batch raises it
+                for write in batch:
+                    _settle(write.future, err)
+
+    async def _write_batch(self, batch: list[_PendingWrite]) -> None:
+        """Write a batch of holding-register writes and confirm them (turn held).
+
+        Every write is encoded first — a masked read-modify-write starts from
+        an earlier write to the same register when the batch has one — and
+        a later write to a register wins. Contiguous registers then go out as
+        one FC16 write (FC6 for a lone register, unless its entity sets
+        ``write_multiple``), and the entities that read back are confirmed
+        after the longest ``confirm_delay`` among them, by as few block reads
+        as the read limits allow. A failing write or read-back fails only the
+        callers it concerns; ``self.data`` is updated once.
+
+        Unless the device file sets ``confirm_holds_bus``, entities with a
+        ``confirm_delay`` are not read back in this turn: they show the
+        written value at once and are confirmed later (see
+        :meth:`_confirm_later`), so the delay does not keep the bus from
+        every other device on the gateway.
+
+        A ``latest_wins`` write whose registers the raw cache already shows
+        holding the value is skipped, unless an earlier write in the batch
+        changes them. The cached words must be no older than the entity's
+        scan interval; an older word may no longer be what the device holds.
+        """
+        if not await self.client.ensure_connected():
+            raise self._cannot_connect()
+        now = time.monotonic()
+        words: dict[int, int] = {}
+        spans: dict[Span, list[_PendingWrite]] = {}
+        unchanged: list[_PendingWrite] = []
+        for write in batch:
+            defn = write.defn
+            try:
+                current_raw: int | None = None
+                if defn.mask is not None and defn.read_modify_write:
+                    current_raw = words.get(defn.address)
+                    if current_raw is None:
+                        current_raw = await self._current_word(defn)
+                payload = self._codecs[defn.key].encode(write.value, current_raw)
+            except (ReadError, codec.CodecError) as err:
+                _settle(write.future, self._write_failed(defn, err))
+                continue
+            assert isinstance(payload, list)
+            addresses = range(defn.address, defn.address + len(payload))
+            max_age = self._interval_for.get(defn.key)
+            if (
+                write.latest_wins
+                and _reads_back(defn)
+                and max_age is not None
+                and defn.key not in self._unconfirmed  # the device may not have it yet
+                and not any(a in words for a in addresses)
+                and all(
+                    self._cache.get((defn.table, a)) == word
+                    and now - (self._cache.stored_at((defn.table, a)) or 0.0) <= max_age
+                    for a, word in zip(addresses, payload, strict=True)
+                )
+            ):
+                unchanged.append(write)
+                continue
+            for address, word in zip(addresses, payload, strict=True):
+                words[address] = word
+            span = Span(defn.table, defn.address, len(payload))
+            spans.setdefault(span, []).append(write)
+
+        runs = plan_blocks(
+            spans, max_read=PROTOCOL_MAX_WRITE_REGISTERS, boundaries=self._boundaries
+        )
+        by_run: dict[Span, list[_PendingWrite]] = {}
+        for span, writes in spans.items():
+            run = covering_block(runs, span)
+            assert run is not None
+            by_run.setdefault(run, []).extend(writes)
+        written: list[_PendingWrite] = []
+        for run, in_run in by_run.items():
+            run_words = [words[a] for a in range(run.start, run.end)]
+            try:
+                await self.client.write_registers(
+                    self.device_id,
+                    run.start,
+                    run_words,
+                    multiple=any(w.defn.write_multiple for w in in_run),
+                )
+            except WriteError as err:
+                for write in in_run:
+                    _settle(write.future, self._write_failed(write.defn, err))
+                continue
+            # the registers now hold what was written (until a read says otherwise)
+            self._store(run, run_words)
+            written.extend(in_run)
+
+        confirm = [w for w in written if _reads_back(w.defn)]
+        deferred: list[_PendingWrite] = []
+        if not self.device_def.confirm_holds_bus:
+            deferred = [w for w in confirm if w.defn.confirm_delay is not None]
+            confirm = [w for w in confirm if w.defn.confirm_delay is None]
+        delays = [w.defn.confirm_delay for w in confirm if w.defn.confirm_delay is not None]
+        if delays:
+            # The device is still applying the writes; holding the turn keeps
+            # the bus quiet until the read-back.
+            await asyncio.sleep(max(delays))
+        errors = await self._read_back([w.defn for w in confirm])
+        for write in confirm:
+            if write.defn.key in errors:
+                _settle(write.future, self._write_failed(write.defn, errors[write.defn.key]))
+
+        deferred_keys = {w.defn.key for w in deferred}
+        data = dict(self.data) if self.data else {}
+        for write in written:
+            if write.future.done() and not write.future.cancelled():
+                continue  # its read-back failed
+            if _reads_back(write.defn) and write.defn.key not in deferred_keys:
+                data[write.defn.key] = self._confirmed(write.defn)
+            else:
+                data[write.defn.key] = write.value
+            _settle(write.future)
+        if deferred:
+            self._confirm_later(deferred)
+        for write in unchanged:
+            data[write.defn.key] = self._confirmed(write.defn)
+            _settle(write.future)
+        self.unchanged_writes += len(unchanged)
+        if written or unchanged:
+            self.async_set_updated_data(data)
+
+    async def _read_back(self, defns: list[EntityDef]) -> dict[str, ReadError]:
+        """Read just-written entities into the cache, in as few blocks as allowed.
+
+        Returns the read error per entity key whose block failed (turn held).
+        """
+        blocks = self._plan([d.span for d in defns])
+        by_block: dict[Span, list[EntityDef]] = {}
+        for defn in defns:
+            block = covering_block(blocks, defn.span)
+            assert block is not None
+            by_block.setdefault(block, []).append(defn)
+        errors: dict[str, ReadError] = {}
+        for block, in_block in by_block.items():
+            try:
+                self._store(block, await self.client.read_block(self.device_id, block))
+            except ReadError as err:
+                errors.update((d.key, err) for d in in_block)
+        return errors
+
+    def _confirm_later(self, writes: list[_PendingWrite]) -> None:
+        for write in writes:
+            self._unconfirmed[write.defn.key] = write
+        self._entry.async_create_background_task(
+            self.hass, self._confirm_deferred(writes), f"{self.name} write confirmation"
+        )
+
+    async def _confirm_deferred(self, writes: list[_PendingWrite]) -> None:
+        """Read back writes to a slow device once their confirm_delay has passed.
+
+        The bus is free in between; the read-back then takes a write turn. A
+        device reporting something other than what was written corrects the
+        optimistic state; a failed read-back leaves it to the next poll. A
+        write superseded by a newer one in the meantime is left to that one.
+        """
+        await asyncio.sleep(max(w.defn.confirm_delay or 0 for w in writes))
+        async with self.client.turn(self.entry_id, time.monotonic(), PRIORITY_WRITE):
+            current = [w for w in writes if self._unconfirmed.get(w.defn.key) is w]
+            connected = bool(current) and await self.client.ensure_connected()
+            errors = await self._read_back([w.defn for w in current]) if connected else {}
+        data = dict(self.data) if self.data else {}
+        corrected = False
+        for write in current:
+            key = write.defn.key
+            if self._unconfirmed.get(key) is not write:
+                continue  # written again meanwhile
+            del self._unconfirmed[key]
+            if not connected or key in errors:
+                _LOGGER.debug("%s: confirming %s failed", self.name, key)
+                continue
+            confirmed = self._confirmed(write.defn)
+            if confirmed != write.value:
+                _LOGGER.info(
+                    "%s: wrote %s to %s, the device reports %s",
+                    self.name, write.value, key, confirmed,
+                )
+            if key not in data or data[key] != confirmed:
+                data[key] = confirmed
+                corrected = True
+        if corrected:  # a read-back agreeing with the shown state changes nothing
+            self.async_set_updated_data(data)
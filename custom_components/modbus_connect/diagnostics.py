@@ -34,11 +34,20 @@ async def async_get_config_entry_diagnostics(
             "max_read_gap": device.max_gap,
             "bad_addresses": sorted(device.bad_addresses),
             "split_before": sorted(device.boundaries),
+            "read_cost": (
+                {"request": device.read_cost.request, "register": device.read_cost.register}
+                if device.read_cost
+                else None
+            ),
             "scan_interval": device.scan_interval,
             "min_scan_interval": device.min_scan_interval,
+            "read_ahead": device.read_ahead,
             "timeout": device.timeout,
             "retries": device.retries,
             "request_delay": device.request_delay,
+            "pipeline_depth": device.pipeline_depth,
+            "confirm_holds_bus": device.confirm_holds_bus,
+            "rmw_max_age": device.rmw_max_age,
             "entity_count": len(device.entities),
             "template_count": len(device.templates),
             "groups": list(device.group_names),
@@ -56,9 +65,34 @@ async def async_get_config_entry_diagnostics(
             ),
             "consecutive_failures": coordinator.consecutive_failures,
             "learned_holes": sorted(coordinator.holes),
+            "read_limits": {"max_read": coordinator.max_read, "max_gap": coordinator.max_gap},
+            "learned_read_limits": (
+                coordinator.tuner.as_dict() if coordinator.tuner is not None else None
+            ),
             "last_read_count": coordinator.last_read_count,
             "last_polled_count": coordinator.last_polled_count,
+            "last_piggybacked_count": coordinator.last_piggybacked_count,
+            "last_decoded_count": coordinator.last_decoded_count,
             "read_entity_count": coordinator.read_entity_count,
+            "full_refresh_read_count": coordinator.full_refresh_read_count,
+            "estimated_cycle_time": coordinator.full_refresh_read_time,
+            # The first entry on a shared gateway picks it, so it may differ
+            # from this entry's own option.
+            "transport": "native" if coordinator.client.native else "pymodbus",
+            "bus_share": coordinator.bus_share,
+            "bus_wait_times": coordinator.bus_wait_times,
+            "transactions": coordinator.transaction_metrics,
+            "round_trip": coordinator.round_trip,
+            "inter_frame_gap": round(coordinator.client.frame_gap, 5),
+            "circuit_breaker": coordinator.circuit_breaker,
+            # The shared connection's, once any entry on it asked for one.
+            "wire_trace": (
+                coordinator.client.trace.as_dict()
+                if coordinator.client.trace is not None
+                else None
+            ),
+            "write_queue": coordinator.write_queue,
+            "predicted_reads_per_tick": coordinator.predicted_reads_per_tick,
             "failed_read_total": coordinator.failed_read_total,
             "read_failures_in_window": coordinator.read_failures_in_window,
             "failed_reads_by_key": dict(
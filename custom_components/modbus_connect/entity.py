@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from homeassistant.components.sensor import SensorStateClass
+from homeassistant.core import callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity import Entity, EntityDescription
 from homeassistant.helpers.template import Template, result_as_boolean
@@ -191,7 +192,8 @@ class ModbusConnectEntity(CoordinatorEntity[ModbusConnectCoordinator]):
         return not self.coordinator.missing(self._defn)
 
     async def _write(self, value: Any) -> None:
-        await self.coordinator.async_write(self._defn, value)
+        # an entity's own value: a newer one supersedes it, an unchanged one is moot
+        await self.coordinator.async_write(self._defn, value, latest_wins=True)
 
 
 def build_template_description(tdef: TemplateDef) -> EntityDescription:
@@ -200,7 +202,7 @@ def build_template_description(tdef: TemplateDef) -> EntityDescription:
 
 
 class ModbusConnectTemplateEntity(CoordinatorEntity[ModbusConnectCoordinator]):
-    """Base for template: entities — re-renders on every device poll.
+    """Base for template: entities — re-renders when a value it reads changes.
 
     The device's entity keys are injected as plain Jinja variables (plus a
     ``values`` dict for keys that are not valid identifiers); all normal Home
@@ -223,6 +225,13 @@ class ModbusConnectTemplateEntity(CoordinatorEntity[ModbusConnectCoordinator]):
         self._compiled: dict[str, Template] = {}
         suggest_entity_id(self, coordinator, tdef.platform, tdef.key)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Most refreshes change a few values; a template reading none of them
+        # would render the same state again.
+        if self.coordinator.affects(self._tdef.key):
+            super()._handle_coordinator_update()
+
     def render(self, field: str, data: dict[str, Any] | None = None) -> Any:
         """Render one of the configured templates; None if absent or failing.
 
@@ -316,4 +325,6 @@ class ModbusConnectTemplateEntity(CoordinatorEntity[ModbusConnectCoordinator]):
         else:
             payload = value
         defn = self.coordinator.entity_defs[target.entity]
-        await self.coordinator.async_write(defn, payload)
+        # A fixed value is a command (open, stop, ...) that must reach the
+        # device every time; a value from the UI is a setting like any other.
+        await self.coordinator.async_write(defn, payload, latest_wins=target.value is None)
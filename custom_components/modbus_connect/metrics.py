@@ -0,0 +1,169 @@
+"""Transaction metrics: rolling latency histograms and wire counters per bus.
+
+Pure logic, no Home Assistant imports.
+
+Every wire transaction of a shared :class:`~.client.ModbusBlockClient` lands
+in one :class:`TransactionMetrics`: its latency in a histogram per function
+code and per device id, the bytes it moved, and how it ended — an answer, a
+Modbus exception code, a timeout, or a connection error. The bus-turn waits
+land in a histogram per priority class. Together they tell a slow cycle's
+cause apart: a slow device shows in its own device id's latency, a slow
+gateway in every device's, and our own queueing in the turn waits.
+
+The histograms are cheap (a bisect and an increment per sample) and rolling:
+they cover the current and the previous ``WINDOW``, so old outliers age out.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from typing import Any
+
+# Latency bucket upper bounds in seconds; one more bucket takes everything slower.
+BUCKETS = (0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+WINDOW = 900.0  # seconds per histogram generation
+
+
+class _Generation:
+    __slots__ = ("buckets", "count", "longest", "started", "total")
+
+    def __init__(self, started: float) -> None:
+        self.started = started
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.longest = 0.0
+
+
+class LatencyHistogram:
+    """Bucketed latencies over the last one to two ``WINDOW``s."""
+
+    __slots__ = ("_current", "_previous")
+
+    def __init__(self, now: float = 0.0) -> None:
+        self._current = _Generation(now)
+        self._previous: _Generation | None = None
+
+    def _roll(self, now: float) -> None:
+        age = now - self._current.started
+        if age >= WINDOW:
+            # A generation older than two windows has nothing left to say.
+            self._previous = self._current if age < 2 * WINDOW else None
+            self._current = _Generation(now)
+
+    def observe(self, seconds: float, now: float) -> None:
+        self._roll(now)
+        gen = self._current
+        gen.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        gen.count += 1
+        gen.total += seconds
+        gen.longest = max(gen.longest, seconds)
+
+    def summary(self, now: float) -> dict[str, Any]:
+        """Count, mean, bucket-resolution p50/p95, and max, in seconds."""
+        self._roll(now)
+        gens = [g for g in (self._previous, self._current) if g is not None]
+        buckets = [sum(counts) for counts in zip(*(g.buckets for g in gens), strict=True)]
+        count = sum(g.count for g in gens)
+        longest = max(g.longest for g in gens)
+        return {
+            "count": count,
+            "mean": round(sum(g.total for g in gens) / count, 4) if count else 0.0,
+            "p50": self._quantile(buckets, count, 0.5, longest),
+            "p95": self._quantile(buckets, count, 0.95, longest),
+            "max": round(longest, 4),
+            "buckets": {
+                str(bound): n for bound, n in zip((*BUCKETS, "inf"), buckets, strict=True)
+            },
+        }
+
+    @staticmethod
+    def _quantile(buckets: list[int], count: int, q: float, longest: float) -> float:
+        """The upper bound of the bucket holding the ``q`` quantile (never past max)."""
+        if not count:
+            return 0.0
+        seen = 0
+        for bound, n in zip(BUCKETS, buckets, strict=False):
+            seen += n
+            if seen >= q * count:
+                return round(min(bound, longest), 4)
+        return round(longest, 4)
+
+
+class TransactionMetrics:
+    """Latencies, bytes and outcomes of one bus's transactions, plus its turn waits."""
+
+    def __init__(self, wait_classes: tuple[str, ...] = ()) -> None:
+        self.by_function: dict[int, LatencyHistogram] = {}
+        self.by_device: dict[int, LatencyHistogram] = {}
+        self.waits = {name: LatencyHistogram() for name in wait_classes}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.timeouts: Counter[int] = Counter()  # per device id
+        self.connection_errors: Counter[int] = Counter()
+        self.exception_codes: dict[int, Counter[int]] = {}  # device id -> code -> count
+
+    def record(
+        self,
+        function_code: int,
+        device_id: int,
+        seconds: float,
+        now: float,
+        *,
+        sent: int,
+        received: int,
+        outcome: str = "answer",
+        exception_code: int | None = None,
+    ) -> None:
+        """One transaction; ``outcome`` is "answer", "timeout" or "connection_error".
+
+        Only answers (exception answers included) time the device; a timeout
+        measures the timeout setting, not the device.
+        """
+        self.bytes_sent += sent
+        self.bytes_received += received
+        if outcome == "timeout":
+            self.timeouts[device_id] += 1
+            return
+        if outcome == "connection_error":
+            self.connection_errors[device_id] += 1
+            return
+        if exception_code is not None:
+            self.exception_codes.setdefault(device_id, Counter())[exception_code] += 1
+        for table, key in ((self.by_function, function_code), (self.by_device, device_id)):
+            histogram = table.get(key)
+            if histogram is None:
+                histogram = table[key] = LatencyHistogram(now)
+            histogram.observe(seconds, now)
+
+    def wait(self, wait_class: str, seconds: float, now: float) -> None:
+        """How long one bus turn of ``wait_class`` queued before it was granted."""
+        self.waits.setdefault(wait_class, LatencyHistogram(now)).observe(seconds, now)
+
+    def device_summary(self, device_id: int, now: float) -> dict[str, Any]:
+        """One device's answer latencies and failure counts."""
+        histogram = self.by_device.get(device_id)
+        return {
+            **(histogram or LatencyHistogram(now)).summary(now),
+            "timeouts": self.timeouts[device_id],
+            "connection_errors": self.connection_errors[device_id],
+            "exception_codes": dict(self.exception_codes.get(device_id, {})),
+        }
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Everything, for diagnostics."""
+        return {
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "function_codes": {
+                fc: h.summary(now) for fc, h in sorted(self.by_function.items())
+            },
+            "devices": {
+                device_id: self.device_summary(device_id, now)
+                for device_id in sorted(
+                    {*self.by_device, *self.timeouts, *self.connection_errors}
+                )
+            },
+            "turn_waits": {name: h.summary(now) for name, h in self.waits.items()},
+        }
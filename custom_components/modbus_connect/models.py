@@ -28,6 +28,8 @@ ALL_TABLES = frozenset(TABLES)
 # Modbus protocol limits per read request
 PROTOCOL_MAX_REGISTERS = 125
 PROTOCOL_MAX_BITS = 2000
+# ... and per FC16 write request
+PROTOCOL_MAX_WRITE_REGISTERS = 123
 
 # Device-level read-planning defaults, defined here (the HA-import-free module)
 # so the DeviceDef fields below and const.py agree on one value; const.py
@@ -144,6 +146,29 @@ class Span:
         return f"{self.table}@{self.start}+{self.count}"
 
 
+@dataclass(frozen=True)
+class ReadCost:
+    """Wire-time model of one read request, in seconds.
+
+    ``request`` is the fixed cost of a round trip (framing, gateway turnaround,
+    device latency), ``register`` the cost of each register it returns. Bits
+    pack sixteen to a register's worth of payload.
+    """
+
+    request: float
+    register: float
+
+    def block_time(self, block: Span) -> float:
+        """Estimated wire time of reading ``block``."""
+        units = -(-block.count // 16) if block.table in BIT_TABLES else block.count
+        return self.request + units * self.register
+
+
+# Estimate used for the cycle-time diagnostic when a device file declares no
+# read_cost: a typical RS-485 gateway at 9600 baud.
+DEFAULT_READ_COST = ReadCost(request=0.04, register=0.002)
+
+
 @dataclass(frozen=True)
 class EntityDef:
     """One entity as defined in a device YAML file."""
@@ -186,7 +211,7 @@ class EntityDef:
     write_multiple: bool = False
     # Seconds to wait between a write and its confirming read-back — for devices
     # that apply writes slowly, where an immediate read still returns the old
-    # value. The connection lock is held while waiting (the bus stays quiet).
+    # value. The write's bus turn is held while waiting (the bus stays quiet).
     confirm_delay: float | None = None
     # time entities only: show an out-of-range time (e.g. 24:00) as 23:59 instead
     # of nothing, so the slot stays usable.
@@ -295,11 +320,18 @@ class DeviceDef:
     # new read block (a forced boundary between two otherwise-mergeable spans).
     bad_addresses: frozenset[tuple[str, int]] = frozenset()
     boundaries: frozenset[tuple[str, int]] = frozenset()
+    # Optional wire-time model; set, the planner picks the cheapest set of blocks
+    # under it instead of merging greedily within max_gap.
+    read_cost: ReadCost | None = None
     # Poll cadence. ``scan_interval`` is the device default that entities without
     # their own inherit; ``min_scan_interval`` is a hard floor the config-entry
     # option can raise further but never lower.
     scan_interval: int | None = None
     min_scan_interval: int | None = None
+    # Seconds of look-ahead: entities falling due within it join an earlier cycle
+    # when a planned block can take them in without another request. (Entities
+    # a planned block already covers always ride along, whatever their cadence.)
+    read_ahead: int | None = None
     # Connection tuning for slow devices and picky RS-485 gateways. ``timeout``
     # (seconds per request) and ``retries`` feed the gateway connection;
     # ``request_delay`` (seconds) enforces silence between any two transactions
@@ -308,6 +340,19 @@ class DeviceDef:
     timeout: float | None = None
     retries: int | None = None
     request_delay: float | None = None
+    # Modbus/TCP requests kept in flight at once on a ``socket``-framed gateway
+    # that matches answers by transaction id; unset (or 1) sends one at a time.
+    # Entries sharing a gateway pipeline only as deep as all of them allow.
+    pipeline_depth: int | None = None
+    # Whether a write with a ``confirm_delay`` keeps the bus until its
+    # read-back, as slow devices that must not be polled while applying a
+    # write need. Unset, the write shows optimistically and is read back
+    # after the delay, the bus free for other devices in between.
+    confirm_holds_bus: bool = False
+    # Seconds a polled (or written) register word stays fresh enough for a
+    # masked read_modify_write to start from; unset reads it before every
+    # such write.
+    rmw_max_age: float | None = None
     modbus_id: int | None = None  # factory-default Modbus device id
     prefix: str | None = None  # default entity-id prefix
     # Device-info templates, rendered once from the first read (see coordinator).
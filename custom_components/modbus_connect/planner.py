@@ -10,22 +10,123 @@ registers is far cheaper than an extra round trip). Blocks never exceed
 are known to be unreadable (``holes``, learned from failed reads or declared in
 the device file), and never span a forced ``boundary`` address (which must
 always begin a new block).
+
+Holes and boundaries are kept in an :class:`AddressIndex` — sorted, coalesced
+ranges per table, queried with bisect — so planning cost follows the number of
+spans, not the width of the address ranges a block bridges.
+
+With a :class:`~.models.ReadCost` model the merge is no longer greedy: each
+table's blocks are the cheapest set under that model, found by exact dynamic
+programming over the sorted spans. ``max_gap`` then no longer applies — the
+model itself decides which holes are worth bridging — while holes, boundaries
+and the size cap still do.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence, Set
 
 from .models import (
     BIT_TABLES,
     PROTOCOL_MAX_BITS,
     PROTOCOL_MAX_REGISTERS,
+    ReadCost,
     Span,
 )
 
 Hole = tuple[str, int]  # (table, address)
 
 
+class AddressIndex(Set[Hole]):
+    """A set of (table, address) pairs stored as coalesced ranges per table.
+
+    Behaves as a read-only set of pairs (membership, iteration, comparison with
+    plain sets) and grows through :meth:`add_range` / :meth:`update`. Its point
+    is :meth:`any_in`: whether a whole address range holds a member costs one
+    bisect, however wide the range or however many members there are.
+    """
+
+    def __init__(self, addresses: Iterable[Hole] = ()) -> None:
+        # table -> (range starts, range ends), both sorted; ends are exclusive
+        # and ranges never touch (adjacent ones are coalesced).
+        self._ranges: dict[str, tuple[list[int], list[int]]] = {}
+        self.update(addresses)
+
+    def add_range(self, table: str, start: int, end: int) -> None:
+        """Add the addresses ``start`` up to (excluding) ``end`` of ``table``."""
+        if start >= end:
+            return
+        starts, ends = self._ranges.setdefault(table, ([], []))
+        # Every range that overlaps or touches [start, end) merges into it.
+        i = bisect_left(ends, start)
+        j = bisect_right(starts, end)
+        if i < j:
+            start = min(start, starts[i])
+            end = max(end, ends[j - 1])
+        starts[i:j] = [start]
+        ends[i:j] = [end]
+
+    def update(self, addresses: Iterable[Hole]) -> None:
+        """Add single addresses, coalescing runs before touching the index."""
+        by_table: dict[str, list[int]] = {}
+        for table, address in addresses:
+            by_table.setdefault(table, []).append(address)
+        for table, found in by_table.items():
+            found.sort()
+            run_start = prev = found[0]
+            for address in found[1:]:
+                if address > prev + 1:
+                    self.add_range(table, run_start, prev + 1)
+                    run_start = address
+                prev = address
+            self.add_range(table, run_start, prev + 1)
+
+    def any_in(self, table: str, start: int, end: int) -> bool:
+        """Whether any address in ``start`` up to (excluding) ``end`` is a member."""
+        ranges = self._ranges.get(table)
+        if ranges is None or start >= end:
+            return False
+        starts, ends = ranges
+        i = bisect_right(ends, start)  # the first range ending past ``start``
+        return i < len(starts) and starts[i] < end
+
+    def ranges(self, table: str) -> list[tuple[int, int]]:
+        """The table's members as sorted ``(start, end)`` ranges, end exclusive."""
+        starts, ends = self._ranges.get(table, ([], []))
+        return list(zip(starts, ends, strict=True))
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, tuple) or len(item) != 2:
+            return False
+        table, address = item
+        return isinstance(address, int) and self.any_in(table, address, address + 1)
+
+    def __iter__(self) -> Iterator[Hole]:
+        for table in sorted(self._ranges):
+            for start, end in self.ranges(table):
+                for address in range(start, end):
+                    yield table, address
+
+    def __len__(self) -> int:
+        return sum(
+            end - start
+            for starts, ends in self._ranges.values()
+            for start, end in zip(starts, ends, strict=True)
+        )
+
+    def __repr__(self) -> str:
+        return f"AddressIndex({ {t: self.ranges(t) for t in sorted(self._ranges)} })"
+
+
+AddressSet = AddressIndex | frozenset[Hole] | set[Hole]
+
+
+def _as_index(addresses: AddressSet) -> AddressIndex:
+    return addresses if isinstance(addresses, AddressIndex) else AddressIndex(addresses)
+
+
 def _table_cap(table: str, max_read: int) -> int:
     protocol = PROTOCOL_MAX_BITS if table in BIT_TABLES else PROTOCOL_MAX_REGISTERS
     return max(1, min(max_read, protocol))
@@ -45,26 +146,42 @@ def plan_blocks(
     *,
     max_read: int,
     max_gap: int = 0,
-    holes: frozenset[Hole] | set[Hole] = frozenset(),
-    boundaries: frozenset[Hole] | set[Hole] = frozenset(),
+    holes: AddressSet = frozenset(),
+    boundaries: AddressSet = frozenset(),
+    cost: ReadCost | None = None,
 ) -> list[Span]:
-    """Plan the read requests covering all ``spans``."""
+    """Plan the read requests covering all ``spans``.
+
+    Greedy within ``max_gap`` by default; the cheapest plan under ``cost`` when
+    a cost model is given. ``holes`` and ``boundaries`` are best passed as an
+    :class:`AddressIndex` built once; plain sets are indexed on every call.
+    """
+    holes = _as_index(holes)
+    boundaries = _as_index(boundaries)
     blocks: list[Span] = []
     unique = sorted(set(spans))
     for table in sorted({s.table for s in unique}):
         table_spans = [s for s in unique if s.table == table]
         cap = _table_cap(table, max_read)
-        blocks.extend(_plan_table(table, table_spans, cap, max_gap, holes, boundaries))
+        if cost is None:
+            blocks.extend(_plan_table(table, table_spans, cap, max_gap, holes, boundaries))
+        else:
+            blocks.extend(_plan_table_optimal(table, table_spans, cap, cost, holes, boundaries))
     return blocks
 
 
+def estimate_read_time(blocks: Iterable[Span], cost: ReadCost) -> float:
+    """Estimated wire time, in seconds, of reading ``blocks`` one after another."""
+    return sum(cost.block_time(b) for b in blocks)
+
+
 def _plan_table(
     table: str,
     spans: list[Span],
     cap: int,
     max_gap: int,
-    holes: frozenset[Hole] | set[Hole],
-    boundaries: frozenset[Hole] | set[Hole],
+    holes: AddressIndex,
+    boundaries: AddressIndex,
 ) -> list[Span]:
     """Merge one table's sorted spans into blocks of at most ``cap`` addresses."""
     blocks: list[Span] = []
@@ -83,6 +200,49 @@ def _plan_table(
     return blocks
 
 
+def _plan_table_optimal(
+    table: str,
+    spans: list[Span],
+    cap: int,
+    cost: ReadCost,
+    holes: AddressIndex,
+    boundaries: AddressIndex,
+) -> list[Span]:
+    """The cheapest blocks under ``cost`` for one table's sorted spans.
+
+    Every plan the planner may emit reads runs of consecutive spans, so the
+    optimum follows from ``best[j]`` — the cheapest plan for ``spans[:j]`` —
+    extended by each valid run ``spans[i:j]``. A run stops growing at the
+    first span it may not take (cap, boundary or hole): every longer run
+    would contain the same violation.
+    """
+    n = len(spans)
+    best = [0.0] + [math.inf] * n
+    prev = [0] * (n + 1)  # start index of the run ending each best plan
+    for i in range(n):
+        start, end = spans[i].start, spans[i].end
+        for j in range(i, n):
+            if j > i:
+                if not _can_merge(table, start, end, spans[j], cap, cap, holes, boundaries):
+                    break
+                end = max(end, spans[j].end)
+            # A lone oversized span is chunked; a merged run is within the cap.
+            run = sum(cost.block_time(b) for b in _split(table, start, end, cap))
+            if best[i] + run < best[j + 1]:
+                best[j + 1] = best[i] + run
+                prev[j + 1] = i
+    runs: list[tuple[int, int]] = []
+    j = n
+    while j > 0:
+        runs.append((prev[j], j))
+        j = prev[j]
+    blocks: list[Span] = []
+    for i, j in reversed(runs):
+        end = max(s.end for s in spans[i:j])
+        blocks.extend(_split(table, spans[i].start, end, cap))
+    return blocks
+
+
 def _can_merge(
     table: str,
     cur_start: int,
@@ -90,43 +250,124 @@ def _can_merge(
     span: Span,
     cap: int,
     max_gap: int,
-    holes: frozenset[Hole] | set[Hole],
-    boundaries: frozenset[Hole] | set[Hole],
+    holes: AddressIndex,
+    boundaries: AddressIndex,
 ) -> bool:
     """Whether ``span`` may join the current block (size cap, gap, holes, boundaries)."""
     if max(cur_end, span.end) - cur_start > cap:
         return False
     # A boundary address must begin a block: reject a merge that would pull one
     # into the interior (anywhere after the current start, up to the new span).
-    if any((table, b) in boundaries for b in range(cur_start + 1, span.start + 1)):
+    if boundaries.any_in(table, cur_start + 1, span.start + 1):
         return False
-    bridged = range(cur_end, span.start) if span.start > cur_end else range(0)
-    return len(bridged) <= max_gap and not any((table, a) in holes for a in bridged)
+    return span.start - cur_end <= max_gap and not holes.any_in(table, cur_end, span.start)
+
+
+def covering_block(blocks: Sequence[Span], span: Span) -> Span | None:
+    """The planned block that already reads all of ``span``, if any.
+
+    ``blocks`` must be sorted, as :func:`plan_blocks` returns them; the
+    candidate is the last block starting at or before the span.
+    """
+    i = bisect_right(blocks, Span(span.table, span.start, PROTOCOL_MAX_BITS + 1)) - 1
+    if i >= 0 and blocks[i].table == span.table and blocks[i].end >= span.end:
+        return blocks[i]
+    return None
+
+
+def absorb_spans(
+    blocks: list[Span],
+    spans: Iterable[Span],
+    *,
+    max_read: int,
+    max_gap: int = 0,
+    holes: AddressSet = frozenset(),
+    boundaries: AddressSet = frozenset(),
+) -> tuple[list[Span], list[Span]]:
+    """Grow planned ``blocks`` to take in extra ``spans`` without adding a request.
+
+    Each span, in the given order, joins the first block of its table that can
+    reach it under the usual rules (cap, gap, holes, boundaries) without running
+    into another block; spans no block can take are left out. Returns the grown
+    blocks — a new sorted list, same length, still disjoint — and the spans they
+    took in.
+    """
+    holes = _as_index(holes)
+    boundaries = _as_index(boundaries)
+    grown = list(blocks)
+    taken: list[Span] = []
+    for span in spans:
+        cap = _table_cap(span.table, max_read)
+        for i, block in enumerate(grown):
+            if block.table != span.table:
+                continue
+            if span.start < block.start:
+                # The span leads: the block is the run that must merge into it.
+                fits = _can_merge(
+                    span.table, span.start, span.end, block, cap, max_gap, holes, boundaries
+                )
+            else:
+                fits = _can_merge(
+                    block.table, block.start, block.end, span, cap, max_gap, holes, boundaries
+                )
+            if not fits:
+                continue
+            start = min(block.start, span.start)
+            wider = Span(block.table, start, max(block.end, span.end) - start)
+            if any(
+                j != i
+                and other.table == wider.table
+                and other.start < wider.end
+                and wider.start < other.end
+                for j, other in enumerate(grown)
+            ):
+                continue  # blocks may be read concurrently: they must stay disjoint
+            grown[i] = wider
+            taken.append(span)
+            break
+    grown.sort()
+    return grown, taken
 
 
-def spans_in_block(block: Span, spans: Iterable[Span]) -> list[Span]:
-    """The needed spans a block was covering (for per-span fallback reads)."""
-    return sorted(
-        {
-            s
-            for s in spans
-            if s.table == block.table and s.start >= block.start and s.end <= block.end
-        }
-    )
+def _table_slice(block: Span, spans: Sequence[Span]) -> Sequence[Span]:
+    """The sorted ``spans`` of the block's table that start before its end."""
+    lo = bisect_left(spans, Span(block.table, 0, 0))
+    hi = bisect_left(spans, Span(block.table, block.end, 0), lo)
+    return spans[lo:hi]
 
 
-def bridged_addresses(block: Span, spans: Iterable[Span]) -> set[Hole]:
-    """Addresses inside ``block`` that no span needs (bridged filler).
+def spans_in_block(block: Span, spans: Sequence[Span]) -> list[Span]:
+    """The needed spans a block was covering (for per-span fallback reads).
+
+    ``spans`` must be sorted (plans keep them so); the block's share is found
+    by bisect instead of a scan over every span.
+    """
+    first = bisect_left(spans, Span(block.table, block.start, 0))
+    last = bisect_left(spans, Span(block.table, block.end, 0), first)
+    return list(dict.fromkeys(s for s in spans[first:last] if s.end <= block.end))
+
+
+def bridged_ranges(block: Span, spans: Sequence[Span]) -> list[Span]:
+    """The runs of addresses inside ``block`` that no span needs (bridged filler).
 
     When a bridged block fails but its individual spans read fine, these are
-    the addresses to remember as unreadable holes.
+    the ranges to remember as unreadable holes. ``spans`` must be sorted.
     """
-    covered: set[int] = set()
-    for s in spans:
-        if s.table != block.table:
-            continue
-        lo, hi = max(s.start, block.start), min(s.end, block.end)
-        covered.update(range(lo, hi))
+    gaps: list[Span] = []
+    pos = block.start
+    for s in _table_slice(block, spans):
+        if s.start > pos:
+            gaps.append(Span(block.table, pos, min(s.start, block.end) - pos))
+        pos = max(pos, s.end)
+        if pos >= block.end:
+            break
+    if pos < block.end:
+        gaps.append(Span(block.table, pos, block.end - pos))
+    return gaps
+
+
+def bridged_addresses(block: Span, spans: Sequence[Span]) -> set[Hole]:
+    """:func:`bridged_ranges` as single (table, address) pairs."""
     return {
-        (block.table, a) for a in range(block.start, block.end) if a not in covered
+        (gap.table, a) for gap in bridged_ranges(block, spans) for a in range(gap.start, gap.end)
     }
@@ -0,0 +1,170 @@
+"""The raw register cache: the last value read from every address, per table.
+
+No Home Assistant imports.
+
+A device can poll over a thousand registers a cycle. Keyed by (table,
+address) in a dict, every stored word cost a tuple, a hash and a boxed int,
+and every decode a lookup per register. Here each table is one contiguous
+run of addresses — an ``array('H')`` of words, or a bytearray of bits (one
+byte each, so they slice like the words) — with a presence byte per address
+alongside and the time each address was stored. Storing a block, and
+clearing or reading a span, are slice operations, and whether a span is
+complete is one ``bytearray.find`` in C. A store reports which addresses
+changed, so the coordinator decodes only what a block actually moved.
+
+The run grows to whatever is stored. Addresses between the blocks a device
+reads cost their slots (11 bytes each for words) but are never present.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from collections.abc import Mapping, Sequence
+
+from .models import BIT_TABLES, Span
+
+_PRESENT = b"\x01"
+
+
+class _Table:
+    """One table's run of addresses from ``base``."""
+
+    __slots__ = ("base", "bits", "present", "stamps", "values")
+
+    def __init__(self, bits: bool) -> None:
+        self.bits = bits
+        self.base = 0
+        self.values: array[int] | bytearray = bytearray() if bits else array("H")
+        self.present = bytearray()  # 1 where ``values`` holds a read value
+        self.stamps = array("d")  # monotonic time each address was stored
+
+    def cover(self, start: int, end: int) -> tuple[int, int]:
+        """Grow the run to hold [start, end); that range's slice indices."""
+        size = len(self.present)
+        if not size:
+            self.base = start
+        elif start < self.base:
+            self._insert(0, self.base - start)
+            size += self.base - start
+            self.base = start
+        if end > self.base + size:
+            self._insert(size, end - self.base - size)
+        return start - self.base, end - self.base
+
+    def _insert(self, at: int, n: int) -> None:
+        if isinstance(self.values, bytearray):
+            self.values[at:at] = bytes(n)
+        else:
+            self.values[at:at] = array("H", bytes(2 * n))
+        self.present[at:at] = bytes(n)
+        self.stamps[at:at] = array("d", bytes(8 * n))
+
+    def slice(self, start: int, end: int) -> tuple[int, int] | None:
+        """Slice indices of [start, end), or None unless every address is present."""
+        i, j = start - self.base, end - self.base
+        if i < 0 or j > len(self.present) or self.present.find(0, i, j) >= 0:
+            return None
+        return i, j
+
+
+class RawCache:
+    """Raw register words and coil bits as last read, per (table, address).
+
+    Whole spans go through :meth:`store`, :meth:`clear`, :meth:`read` and
+    :meth:`missing`; single addresses read like a mapping keyed by
+    ``(table, address)``.
+    """
+
+    def __init__(self) -> None:
+        self._tables: dict[str, _Table] = {}
+
+    def _table(self, table: str) -> _Table:
+        run = self._tables.get(table)
+        if run is None:
+            run = self._tables[table] = _Table(table in BIT_TABLES)
+        return run
+
+    def store(
+        self, span: Span, values: Sequence[int] | Sequence[bool], now: float | None = None
+    ) -> list[int]:
+        """Store a block's values (at least ``span.count`` of them), read at ``now``.
+
+        Returns the addresses whose value changed or was absent — none when
+        the block reads as before, which costs one slice comparison.
+        """
+        run = self._table(span.table)
+        i, j = run.cover(span.start, span.end)
+        n = j - i
+        old, was_present = run.values[i:j], run.present[i:j]
+        new: array[int] | bytes
+        if isinstance(run.values, bytearray):
+            new = run.values[i:j] = bytes(map(bool, values[:n]))
+        elif isinstance(values, array) and values.typecode == "H":
+            new = run.values[i:j] = values[:n]
+        else:
+            new = run.values[i:j] = array("H", values[:n])
+        run.present[i:j] = _PRESENT * n
+        run.stamps[i:j] = array("d", (time.monotonic() if now is None else now,)) * n
+        if old == new and was_present.find(0) < 0:
+            return []
+        return [
+            span.start + k
+            for k in range(n)
+            if not was_present[k] or old[k] != new[k]
+        ]
+
+    def clear(self, span: Span) -> None:
+        """Forget a span's values (its read failed)."""
+        run = self._tables.get(span.table)
+        if run is None:
+            return
+        i = max(span.start - run.base, 0)
+        j = min(span.end - run.base, len(run.present))
+        if i < j:
+            run.present[i:j] = bytes(j - i)
+
+    def read(self, span: Span) -> list[int] | list[bool] | None:
+        """A span's values, or None unless every address in it is present."""
+        run = self._tables.get(span.table)
+        if run is None or (where := run.slice(span.start, span.end)) is None:
+            return None
+        i, j = where
+        if isinstance(run.values, bytearray):
+            return [bool(b) for b in run.values[i:j]]
+        return run.values[i:j].tolist()
+
+    def missing(self, span: Span) -> bool:
+        """Whether any address of the span has no value."""
+        run = self._tables.get(span.table)
+        return run is None or run.slice(span.start, span.end) is None
+
+    def stored_at(self, key: tuple[str, int]) -> float | None:
+        """When an address was stored (monotonic), or None without a value."""
+        run = self._tables.get(key[0])
+        if run is None or run.slice(key[1], key[1] + 1) is None:
+            return None
+        return run.stamps[key[1] - run.base]
+
+    def get(self, key: tuple[str, int], default: int | bool | None = None) -> int | bool | None:
+        run = self._tables.get(key[0])
+        if run is None or run.slice(key[1], key[1] + 1) is None:
+            return default
+        value = run.values[key[1] - run.base]
+        return bool(value) if run.bits else value
+
+    def __getitem__(self, key: tuple[str, int]) -> int | bool:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: tuple[str, int], value: int | bool) -> None:
+        self.store(Span(key[0], key[1], 1), [value])
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, tuple) and self.get(key) is not None
+
+    def update(self, values: Mapping[tuple[str, int], int | bool]) -> None:
+        for key, value in values.items():
+            self[key] = value
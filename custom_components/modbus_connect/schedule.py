@@ -0,0 +1,67 @@
+"""Cadence scheduling: spread the polling classes over the coordinator's ticks.
+
+Pure functions, no Home Assistant imports.
+
+The coordinator polls on a single tick (its fastest interval); an entity falls
+due every :func:`period_ticks` ticks. Started in phase, every cadence class
+fires on the same ticks — a 10 s, 60 s and 300 s class all coincide every five
+minutes — and those cycles can overrun a slow bus while the ticks between them
+idle. :func:`stagger_phases` gives each class a phase offset that keeps the
+peak per-tick load as low as it can.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+
+# Longest schedule cycle (in ticks) the scheduler lays out. Co-prime cadences
+# can make the true cycle huge; beyond this the pattern is only approximated.
+MAX_HORIZON = 3600
+
+
+def period_ticks(interval: float, tick: float) -> int:
+    """Ticks between two reads of an entity polled every ``interval`` seconds.
+
+    A due time between two ticks waits for the next one, so the period rounds up.
+    """
+    return max(1, math.ceil(interval / tick))
+
+
+def horizon(periods: Iterable[int]) -> int:
+    """Ticks after which the schedule repeats — the periods' least common
+    multiple, capped at :data:`MAX_HORIZON`."""
+    return min(math.lcm(*periods), MAX_HORIZON)
+
+
+def stagger_phases(weights: Mapping[int, int]) -> dict[int, int]:
+    """Phase offsets (in ticks) for cadence classes given as ``period → weight``.
+
+    ``weights`` is each class's cost when due — typically the block reads its
+    entities plan into. A class with phase ``φ`` fires on every tick ``k`` with
+    ``k % period == φ``. The fastest classes are placed first (they have the
+    fewest choices), heavier ones before lighter ones; each takes the phase
+    whose ticks end up with the lowest peak load, then the lowest total, then
+    the earliest — so a class that cannot gain anything keeps phase 0.
+    """
+    ticks = horizon(weights)
+    load = [0] * ticks
+    phases: dict[int, int] = {}
+    for period, weight in sorted(weights.items(), key=lambda pw: (pw[0], -pw[1])):
+        best = min(
+            range(min(period, ticks)),
+            key=lambda phase: (
+                max(load[k] for k in range(phase, ticks, period)) + weight,
+                sum(load[k] for k in range(phase, ticks, period)),
+                phase,
+            ),
+        )
+        for k in range(best, ticks, period):
+            load[k] += weight
+        phases[period] = best
+    return phases
+
+
+def due_periods(phases: Mapping[int, int], tick: int) -> frozenset[int]:
+    """The cadence classes (by period) that fire on schedule tick ``tick``."""
+    return frozenset(p for p, phase in phases.items() if tick % p == phase)
@@ -60,6 +60,7 @@ from .models import (
     WRITABLE_TABLES,
     DeviceDef,
     EntityDef,
+    ReadCost,
     SwitchTarget,
     TemplateDef,
     WriteTarget,
@@ -316,11 +317,16 @@ def _parse_device_block(ctx: _Ctx, device: dict[str, Any]) -> dict[str, Any]:
         "max_read_gap",
         "bad_addresses",
         "split_before",
+        "read_cost",
         "scan_interval",
         "min_scan_interval",
+        "read_ahead",
         "timeout",
         "retries",
         "request_delay",
+        "pipeline_depth",
+        "confirm_holds_bus",
+        "rmw_max_age",
         "modbus_id",
         "prefix",
         "sw_version",
@@ -339,6 +345,9 @@ def _parse_device_block(ctx: _Ctx, device: dict[str, Any]) -> dict[str, Any]:
         min_scan_interval = _int_in_range(
             ctx, "device.min_scan_interval", min_scan_interval, 1, 86400
         )
+    read_ahead = device.get("read_ahead")
+    if read_ahead is not None:
+        read_ahead = _int_in_range(ctx, "device.read_ahead", read_ahead, 0, 86400)
     timeout = device.get("timeout")
     if timeout is not None:
         timeout = _number_in_range(ctx, "device.timeout", timeout, 0, 60, lo_exclusive=True)
@@ -348,8 +357,15 @@ def _parse_device_block(ctx: _Ctx, device: dict[str, Any]) -> dict[str, Any]:
     request_delay = device.get("request_delay")
     if request_delay is not None:
         request_delay = _number_in_range(ctx, "device.request_delay", request_delay, 0, 5)
+    pipeline_depth = device.get("pipeline_depth")
+    if pipeline_depth is not None:
+        pipeline_depth = _int_in_range(ctx, "device.pipeline_depth", pipeline_depth, 1, 16)
+    rmw_max_age = device.get("rmw_max_age")
+    if rmw_max_age is not None:
+        rmw_max_age = _number_in_range(ctx, "device.rmw_max_age", rmw_max_age, 0, 3600)
     bad_addresses = _parse_address_hints(ctx, device, "bad_addresses")
     boundaries = _parse_address_hints(ctx, device, "split_before")
+    read_cost = _parse_read_cost(ctx, device.get("read_cost"))
     modbus_id = device.get("modbus_id")
     if modbus_id is not None:
         modbus_id = _int_in_range(
@@ -376,11 +392,16 @@ def _parse_device_block(ctx: _Ctx, device: dict[str, Any]) -> dict[str, Any]:
                                  device.get("max_read_gap", DEFAULT_MAX_GAP), 0, 1000),
         "bad_addresses": bad_addresses,
         "boundaries": boundaries,
+        "read_cost": read_cost,
         "scan_interval": scan_interval,
         "min_scan_interval": min_scan_interval,
+        "read_ahead": read_ahead,
         "timeout": timeout,
         "retries": retries,
         "request_delay": request_delay,
+        "pipeline_depth": pipeline_depth,
+        "confirm_holds_bus": _bool(ctx, device, "confirm_holds_bus"),
+        "rmw_max_age": rmw_max_age,
         "modbus_id": modbus_id,
         "prefix": prefix,
         "default_groups": default_groups,
@@ -414,6 +435,23 @@ def _parse_address_hints(
     return frozenset(out)
 
 
+def _parse_read_cost(ctx: _Ctx, raw: Any) -> ReadCost | None:
+    """Parse ``read_cost: {request: s, register: s}`` (seconds) into the planner's model."""
+    if raw is None:
+        return None
+    if not isinstance(raw, dict) or set(raw) != {"request", "register"}:
+        raise ctx.fail(
+            "device.read_cost must be a mapping with exactly 'request' and 'register' "
+            "(seconds), e.g. {request: 0.04, register: 0.002}"
+        )
+    return ReadCost(
+        request=_number_in_range(
+            ctx, "device.read_cost.request", raw["request"], 0, 10, lo_exclusive=True
+        ),
+        register=_number_in_range(ctx, "device.read_cost.register", raw["register"], 0, 1),
+    )
+
+
 def _parse_sections(ctx: _Ctx, data: dict[str, Any], filename: str) -> list[EntityDef]:
     """Parse the four table sections into entity definitions."""
     entities: list[EntityDef] = []
@@ -6,8 +6,8 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
-from homeassistant.components.sensor import RestoreSensor, SensorEntity
-from homeassistant.const import EntityCategory
+from homeassistant.components.sensor import RestoreSensor, SensorDeviceClass, SensorEntity
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -59,6 +59,8 @@ async def async_setup_entry(
     )
     entities.append(ModbusConnectReadCountSensor(coordinator))
     entities.append(ModbusConnectFailedReadsSensor(coordinator))
+    entities.append(ModbusConnectRequestLatencySensor(coordinator))
+    entities.append(ModbusConnectBusWaitSensor(coordinator))
     async_add_entities(entities)
 
 
@@ -162,6 +164,7 @@ class ModbusConnectReadCountSensor(
 
     Block merging lets one read cover many entities, so this sits well below the
     ``read_entities`` attribute (the total that poll) — the gap is the merge win.
+    ``estimated_cycle_time`` prices that plan in seconds of wire time.
     It reports the full-refresh figure, which is stable (it moves only when the
     read plan does), so it stays near-silent in the recorder rather than churning
     every cycle; the live per-cycle read and poll counts are in Download
@@ -186,8 +189,11 @@ class ModbusConnectReadCountSensor(
         return self.coordinator.full_refresh_read_count
 
     @property
-    def extra_state_attributes(self) -> dict[str, int]:
-        return {"read_entities": self.coordinator.read_entity_count}
+    def extra_state_attributes(self) -> dict[str, int | float]:
+        return {
+            "read_entities": self.coordinator.read_entity_count,
+            "estimated_cycle_time": self.coordinator.full_refresh_read_time,
+        }
 
 
 class ModbusConnectFailedReadsSensor(SensorEntity):
@@ -215,3 +221,80 @@ class ModbusConnectFailedReadsSensor(SensorEntity):
     @property
     def native_value(self) -> int:
         return self._coordinator.failed_read_total
+
+
+class ModbusConnectRequestLatencySensor(SensorEntity):
+    """Diagnostic, off by default: this device's mean answer time on the wire.
+
+    From the client's rolling latency histogram (the last 15 to 30 minutes);
+    the attributes add the tail and the failures that never produced an
+    answer. Compared with the bus-wait sensor it tells a slow device (high
+    latency) from a crowded bus (long waits). Polled like the failed-reads
+    counter, and likewise without ``state_class``.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+    _attr_translation_key = "request_latency"
+
+    def __init__(self, coordinator: ModbusConnectCoordinator) -> None:
+        self._coordinator = coordinator
+        init_meta_entity(
+            self, coordinator, unique_suffix="request_latency", domain="sensor"
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        latency = self._coordinator.request_latency
+        return round(latency["mean"] * 1000, 1) if latency["count"] else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        latency = self._coordinator.request_latency
+        return {
+            "p95_ms": round(latency["p95"] * 1000, 1),
+            "max_ms": round(latency["max"] * 1000, 1),
+            "answers": latency["count"],
+            "timeouts": latency["timeouts"],
+            "exception_codes": latency["exception_codes"],
+        }
+
+
+class ModbusConnectBusWaitSensor(SensorEntity):
+    """Diagnostic, off by default: how long polls queue for the (shared) bus.
+
+    The mean wait of a polling turn, across every entry on this gateway or
+    serial port; the attributes add the longest poll wait and the writes'
+    mean wait. Near zero unless the bus is oversubscribed.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+    _attr_translation_key = "bus_wait"
+
+    def __init__(self, coordinator: ModbusConnectCoordinator) -> None:
+        self._coordinator = coordinator
+        init_meta_entity(self, coordinator, unique_suffix="bus_wait", domain="sensor")
+
+    @property
+    def native_value(self) -> float | None:
+        poll = self._coordinator.bus_wait_times.get("poll")
+        return round(poll["mean_wait"] * 1000, 1) if poll and poll["turns"] else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        waits = self._coordinator.bus_wait_times
+        poll = waits.get("poll", {})
+        write = waits.get("write", {})
+        return {
+            "max_poll_wait_ms": round(poll.get("max_wait", 0.0) * 1000, 1),
+            "mean_write_wait_ms": round(write.get("mean_wait", 0.0) * 1000, 1),
+        }
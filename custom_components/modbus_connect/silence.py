@@ -0,0 +1,56 @@
+"""Bus silence between RTU frames: the line's inter-frame gap and per-device guards.
+
+Pure logic, no Home Assistant imports.
+
+Modbus RTU ends a frame with 3.5 character times of silence, so that is all a
+serial bus needs between two requests — about 2 ms at 19200 baud, where a
+hand-set ``request_delay`` of 50-100 ms wastes most of the bus.
+:func:`inter_frame_gap` derives it from the line settings (fixed at 1.75 ms
+above 19200 baud, as the specification allows).
+
+Some devices need longer after answering before they listen again (a slow
+RS-485 driver turnaround, a busy firmware). :class:`GuardTime` learns that per
+device: a request that went unanswered after only a short silence doubles the
+device's guard, and a long run of answers halves it again, so a guard set by a
+one-off hiccup does not stick.
+"""
+
+from __future__ import annotations
+
+MAX_GUARD = 0.1  # seconds; a longer silence cannot be what a timeout was about
+MIN_GUARD = 0.002  # the first guard learned, and below which it drops back to none
+RELAX_AFTER = 50  # consecutive answers before the guard halves
+
+
+def character_bits(bytesize: int, parity: str, stopbits: int) -> int:
+    """Bits on the wire per character: start bit, data, parity, stop bits."""
+    return 1 + bytesize + (0 if parity.upper() == "N" else 1) + stopbits
+
+
+def inter_frame_gap(baudrate: int, bytesize: int, parity: str, stopbits: int) -> float:
+    """Seconds of silence RTU requires between frames (3.5 character times)."""
+    if baudrate > 19200:
+        return 0.00175
+    return 3.5 * character_bits(bytesize, parity, stopbits) / baudrate
+
+
+class GuardTime:
+    """Extra silence one device needs before a request, learned from its timeouts."""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self._answers = 0
+
+    def timed_out(self, silence: float) -> None:
+        """A request sent after ``silence`` seconds of quiet bus went unanswered."""
+        self._answers = 0
+        if silence < MAX_GUARD:
+            self.seconds = min(MAX_GUARD, max(MIN_GUARD, 2 * self.seconds))
+
+    def answered(self) -> None:
+        self._answers += 1
+        if self.seconds and self._answers >= RELAX_AFTER:
+            self._answers = 0
+            self.seconds /= 2
+            if self.seconds < MIN_GUARD:
+                self.seconds = 0.0
@@ -0,0 +1,79 @@
+"""Adaptive request timeouts from measured round trips (Jacobson/Karels).
+
+Pure logic, no Home Assistant imports.
+
+A fixed timeout must cover the slowest answer a device ever gives, so a
+register that never answers costs that much on every cycle even when the
+device normally replies within tens of milliseconds. :class:`RoundTripEstimator`
+keeps TCP's smoothed round-trip time and its mean deviation per device and
+derives a timeout from them — ``srtt + 4 * rttvar`` — that tracks the device
+instead. Samples are normalized by response size first, so one estimator
+serves a one-register read and a 125-register block alike.
+
+A timeout doubles the next timeouts (exponential backoff) until an answer
+arrives again; a burst of slow answers thus costs a failed read or two, not a
+string of them. The configured timeout stays the ceiling, and until enough
+answers were measured it is used as-is.
+"""
+
+from __future__ import annotations
+
+# Smoothing gains and deviation multiplier of RFC 6298.
+ALPHA = 1 / 8
+BETA = 1 / 4
+K = 4
+
+MIN_SAMPLES = 8  # answers measured before the timeout adapts
+MIN_TIMEOUT = 0.1  # seconds; below this, scheduling jitter alone would time out
+MAX_BACKOFF = 64
+
+# Response bytes that double a request's expected time: a gateway's fixed
+# turnaround dominates small reads, the serial transfer time large ones (about
+# 1 ms per byte at 9600 baud).
+SCALE_BYTES = 64
+
+
+def size_factor(response_bytes: int) -> float:
+    """Expected round trip of a response this large, relative to an empty one."""
+    return 1 + response_bytes / SCALE_BYTES
+
+
+class RoundTripEstimator:
+    """Smoothed round-trip time of one device and the timeout derived from it."""
+
+    def __init__(self) -> None:
+        self.srtt: float | None = None  # seconds, normalized to an empty response
+        self.rttvar = 0.0
+        self.samples = 0
+        self.backoff = 1
+
+    def observe(self, seconds: float, response_bytes: int) -> None:
+        """Feed one answered request's round trip."""
+        sample = seconds / size_factor(response_bytes)
+        if self.srtt is None:
+            self.srtt = sample
+            self.rttvar = sample / 2
+        else:
+            self.rttvar = (1 - BETA) * self.rttvar + BETA * abs(self.srtt - sample)
+            self.srtt = (1 - ALPHA) * self.srtt + ALPHA * sample
+        self.samples += 1
+        self.backoff = 1
+
+    def timed_out(self) -> None:
+        """A request went unanswered: be more patient until the next answer."""
+        self.backoff = min(MAX_BACKOFF, self.backoff * 2)
+
+    def timeout(self, response_bytes: int, ceiling: float) -> float:
+        """Seconds to wait for a response this large, never above ``ceiling``."""
+        if self.srtt is None or self.samples < MIN_SAMPLES:
+            return ceiling
+        rto = max(MIN_TIMEOUT, (self.srtt + K * self.rttvar) * size_factor(response_bytes))
+        return min(ceiling, rto * self.backoff)
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        return {
+            "srtt": round(self.srtt, 4) if self.srtt is not None else None,
+            "rttvar": round(self.rttvar, 4),
+            "samples": self.samples,
+            "backoff": self.backoff,
+        }
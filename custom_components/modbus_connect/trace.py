@@ -0,0 +1,273 @@
+"""Wire traces: record every Modbus transaction of a bus, and replay them.
+
+No Home Assistant or pymodbus imports.
+
+A slow customer bus usually comes with nothing but a debug log. With the
+entry's wire-trace option on, :class:`TraceRecorder` keeps every transaction
+of the shared connection — when it went out, the device id, function code,
+address and count, how long the answer took, and the response PDU (or
+whether it timed out) — in a compact binary ring of the most recent ones.
+The diagnostics download carries it base64-encoded, so it travels with the
+bug report.
+
+:class:`ReplayClient` plays such a trace back as the wire under a
+:class:`~.client.ModbusBlockClient` (``ModbusBlockClient.replay``): each
+request is answered by the next recorded transaction with the same device,
+function, address and count, after its recorded latency (or a fraction of it,
+to run faster than real time). A request the trace does not hold — a changed
+planner reads different blocks — is answered from the register values the
+trace saw, at the device's average latency, and counted, so planner and
+scheduler changes can be benchmarked offline against real device behaviour.
+
+File layout (big-endian): the 8-byte magic ``MBTRACE1``, the recording's
+start as Unix time (double), then one record per transaction: seconds since
+the start (double), latency (float), device id, function code, address,
+quantity, outcome, exception code (0 if none), response length, and the
+response PDU.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import struct
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
+
+from .transport import NativeTcpClient
+
+MAGIC = b"MBTRACE1"
+_HEADER = struct.Struct(">8sd")
+_RECORD = struct.Struct(">dfBBHHBBH")
+
+# Outcome of a recorded transaction; an exception answer is an answer.
+ANSWERED = 0
+TIMEOUT = 1
+CONNECTION_ERROR = 2
+OUTCOMES = ("answered", "timeout", "connection_error")
+
+TRACE_MAX_BYTES = 2 * 1024 * 1024  # ring size; at ~40 bytes a read, ~50000 transactions
+
+_ILLEGAL_DATA_ADDRESS = 2
+_BIT_READS = (1, 2)
+_WORD_READS = (3, 4)
+# The table each function code touches, to share one register image between
+# reads and writes.
+_TABLE_OF = {1: 0, 5: 0, 2: 1, 3: 2, 6: 2, 16: 2, 4: 3}
+
+
+class TraceRecord(NamedTuple):
+    """One recorded transaction."""
+
+    time: float  # seconds since the recording started
+    latency: float  # seconds until the answer, or until giving up
+    device_id: int
+    function_code: int
+    address: int
+    quantity: int  # registers or bits requested or written
+    outcome: int  # ANSWERED, TIMEOUT or CONNECTION_ERROR
+    exception_code: int  # 0 unless the answer was a Modbus exception
+    response: bytes  # the response PDU; empty when nothing came back
+
+
+def pack_bits(bits: Iterable[bool | int]) -> bytes:
+    """Bits as Modbus packs them: eight per byte, least significant first."""
+    data = bytearray()
+    for i, bit in enumerate(bits):
+        if i % 8 == 0:
+            data.append(0)
+        if bit:
+            data[-1] |= 1 << (i % 8)
+    return bytes(data)
+
+
+class TraceRecorder:
+    """The most recent transactions of one connection, as encoded records."""
+
+    def __init__(self, max_bytes: int = TRACE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.started = time.time()
+        self._origin = time.monotonic()
+        self._records: deque[bytes] = deque()
+        self.size = 0  # bytes held
+        self.dropped = 0  # oldest records pushed out of the ring
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(
+        self,
+        now: float,
+        latency: float,
+        device_id: int,
+        function_code: int,
+        address: int,
+        count: int,
+        outcome: int,
+        exception_code: int | None = None,
+        response: bytes = b"",
+    ) -> None:
+        """Add one transaction that ended at monotonic time ``now``."""
+        encoded = _RECORD.pack(
+            now - latency - self._origin,
+            latency,
+            device_id,
+            function_code,
+            address,
+            count,
+            outcome,
+            exception_code or 0,
+            len(response),
+        ) + response
+        self._records.append(encoded)
+        self.size += len(encoded)
+        while self.size > self.max_bytes:
+            self.size -= len(self._records.popleft())
+            self.dropped += 1
+
+    def dump(self) -> bytes:
+        """The trace as a file's bytes."""
+        return _HEADER.pack(MAGIC, self.started) + b"".join(self._records)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "started": self.started,
+            "records": len(self._records),
+            "dropped": self.dropped,
+            "bytes": self.size,
+            "data": base64.b64encode(self.dump()).decode("ascii"),
+        }
+
+
+def read_trace(data: bytes) -> list[TraceRecord]:
+    """Decode a trace file's bytes (or a diagnostics download's base64 ``data``)."""
+    if not data.startswith(MAGIC):
+        data = base64.b64decode(data, validate=True)
+    if not data.startswith(MAGIC):
+        raise ValueError("not a Modbus wire trace")
+    return list(_iter_records(data))
+
+
+def _iter_records(data: bytes) -> Iterator[TraceRecord]:
+    offset = _HEADER.size
+    while offset < len(data):
+        *fields, length = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        yield TraceRecord._make((*fields, data[offset : offset + length]))
+        offset += length
+
+
+def _request_key(pdu: bytes) -> tuple[int, int, int]:
+    """(function code, address, count) of a request PDU."""
+    function_code, address, value = struct.unpack_from(">BHH", pdu)
+    return function_code, address, 1 if function_code in (5, 6) else value
+
+
+class ReplayClient(NativeTcpClient):
+    """A wire made of a recorded trace: answers requests the way the trace did.
+
+    ``speed`` scales time: 1 waits the recorded latencies, 10 a tenth of
+    them, and 0 does not wait at all. ``matched`` and ``synthesized`` count
+    the requests answered from a recorded transaction and from the register
+    values the trace saw.
+    """
+
+    def __init__(self, records: Iterable[TraceRecord], *, speed: float = 1.0) -> None:
+        super().__init__("replay", 0, timeout=float("inf"), retries=0)
+        self.speed = speed
+        self._queues: dict[tuple[int, int, int, int], deque[TraceRecord]] = defaultdict(deque)
+        self._image: dict[tuple[int, int, int], int] = {}  # (device, table, address) -> value
+        latencies: dict[int, list[float]] = defaultdict(list)
+        records = list(records)
+        for record in records:
+            key = (record.device_id, record.function_code, record.address, record.quantity)
+            self._queues[key].append(record)
+            if record.outcome == ANSWERED and not record.exception_code:
+                latencies[record.device_id].append(record.latency)
+        for record in reversed(records):  # the first value seen of each register wins
+            self._learn(record)
+        self._latency = {d: sum(v) / len(v) for d, v in latencies.items()}
+        self._open = False
+        self.matched = 0
+        self.synthesized = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._open
+
+    async def connect(self) -> bool:
+        self._open = True
+        return True
+
+    def close(self) -> None:
+        self._open = False
+
+    async def execute(self, device_id: int, pdu: bytes, timeout: float | None = None) -> bytes:
+        if not self._open:
+            raise ConnectionError("replay is closed")
+        function_code, address, count = _request_key(pdu)
+        queue = self._queues.get((device_id, function_code, address, count))
+        if not queue:
+            self.synthesized += 1
+            await self._wait(self._latency.get(device_id, 0.0))
+            return self._synthesize(device_id, pdu)
+        record = queue.popleft()
+        self.matched += 1
+        if record.outcome == TIMEOUT:
+            await self._wait(record.latency if timeout is None else min(timeout, record.latency))
+            raise TimeoutError("no response (recorded)")
+        await self._wait(record.latency)
+        if record.outcome == CONNECTION_ERROR:
+            raise ConnectionError("connection lost (recorded)")
+        self._learn(record)
+        return record.response
+
+    async def _wait(self, seconds: float) -> None:
+        if self.speed > 0 and seconds > 0:
+            await asyncio.sleep(seconds / self.speed)
+
+    def _learn(self, record: TraceRecord) -> None:
+        """Take the register values a recorded answer shows into the image."""
+        response = record.response
+        if record.outcome != ANSWERED or record.exception_code or not response:
+            return
+        table = _TABLE_OF.get(record.function_code)
+        if table is None:
+            return
+        base = (record.device_id, table)
+        if record.function_code in _WORD_READS:
+            words = struct.unpack_from(f">{response[1] // 2}H", response, 2)
+            for i, word in enumerate(words):
+                self._image[(*base, record.address + i)] = word
+        elif record.function_code in _BIT_READS:
+            for i in range(min(record.quantity, 8 * response[1])):
+                bit = response[2 + i // 8] >> (i % 8) & 1
+                self._image[(*base, record.address + i)] = bit
+        elif record.function_code in (5, 6):
+            value = struct.unpack_from(">H", response, 3)[0]
+            bit_or_word = int(value == 0xFF00) if record.function_code == 5 else value
+            self._image[(*base, record.address)] = bit_or_word
+
+    def _synthesize(self, device_id: int, pdu: bytes) -> bytes:
+        """An answer from the register image; unknown registers are refused."""
+        function_code, address, count = _request_key(pdu)
+        table = _TABLE_OF.get(function_code)
+        if table is None:
+            return bytes([function_code | 0x80, 1])  # illegal function
+        keys = [(device_id, table, a) for a in range(address, address + count)]
+        if function_code in (5, 6, 16):
+            if function_code == 16:
+                values = struct.unpack_from(f">{count}H", pdu, 6)
+            else:
+                value = struct.unpack_from(">H", pdu, 3)[0]
+                values = (int(value == 0xFF00) if function_code == 5 else value,)
+            self._image.update(zip(keys, values, strict=True))
+            return pdu[:5]  # writes echo the address and the value or count
+        if any(key not in self._image for key in keys):
+            return bytes([function_code | 0x80, _ILLEGAL_DATA_ADDRESS])
+        held = [self._image[key] for key in keys]
+        bit_read = function_code in _BIT_READS
+        data = pack_bits(held) if bit_read else struct.pack(f">{count}H", *held)
+        return bytes([function_code, len(data)]) + data
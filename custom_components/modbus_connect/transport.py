@@ -0,0 +1,400 @@
+"""Native asyncio Modbus transport for TCP gateways: MBAP or RTU framing.
+
+No Home Assistant or pymodbus imports.
+
+pymodbus runs one transaction at a time per connection, so a gateway behind a
+slow link answers at most one request per round trip. Many Modbus/TCP
+gateways accept several outstanding requests and tell their answers apart by
+the MBAP transaction id; :class:`NativeTcpClient` keeps as many in flight as
+its callers start and matches each response to its request by that id.
+
+Even one request at a time, pymodbus spends most of a small read in its own
+layers — a transaction manager, a framer, a decoder building per-register
+Python objects. This client frames the request itself, cuts the response out
+of the stream once, and decodes the register payload straight from the
+frame's bytes into an ``array('H')``. RTU-over-TCP gateways get the same path
+with RTU framing (device address and CRC16, no transaction id — so one
+request at a time).
+
+The client mirrors the small slice of the pymodbus client API that
+:class:`~.client.ModbusBlockClient` uses — ``connect``, ``connected``,
+``close``, the four read methods and the three writes, all returning
+:class:`NativeResponse` — so the block client can swap it in unchanged.
+Limiting how many requests are in flight is the caller's job (the bus turns).
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import itertools
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+_MBAP = struct.Struct(">HHHB")  # transaction id, protocol id (0), length, unit id
+_READ_REQUEST = struct.Struct(">BHH")  # function code, address, count
+_CRC = struct.Struct("<H")  # RTU sends its CRC low byte first
+
+
+def _crc_table() -> tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC_TABLE = _crc_table()
+
+
+def crc16(data: bytes | memoryview) -> int:
+    """Modbus RTU CRC16 (polynomial 0xA001, reflected)."""
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def decode_words(data: bytes | memoryview) -> array[int]:
+    """Big-endian Modbus registers, without a Python int per register on the way."""
+    words = array("H")
+    words.frombytes(data)
+    if sys.byteorder == "little":
+        words.byteswap()
+    return words
+
+
+class NativeResponse:
+    """A decoded response PDU, duck-typed like a pymodbus response."""
+
+    __slots__ = ("bits", "exception_code", "registers")
+
+    def __init__(
+        self,
+        *,
+        registers: Sequence[int] = (),
+        bits: Sequence[bool] = (),
+        exception_code: int | None = None,
+    ) -> None:
+        self.registers = registers
+        self.bits = bits
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:
+        return self.exception_code is not None
+
+    def __repr__(self) -> str:
+        if self.exception_code is not None:
+            return f"NativeResponse(exception_code={self.exception_code})"
+        return f"NativeResponse({len(self.registers) or len(self.bits)} values)"
+
+
+class FramingError(ConnectionError):
+    """The byte stream no longer splits into frames; the connection is out of step."""
+
+
+class _FramingProtocol(asyncio.Protocol, abc.ABC):
+    """Splits the byte stream into response frames and resolves the waiting requests.
+
+    ``pending`` maps a request's key — the MBAP transaction id, or the RTU
+    device address — to the future awaiting its response PDU.
+    """
+
+    def __init__(self) -> None:
+        self.transport: asyncio.Transport | None = None
+        self.pending: dict[int, asyncio.Future[bytes]] = {}
+        self._buffer = bytearray()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+        while (frame := self._next_frame()) is not None:
+            key, pdu = frame
+            future = self.pending.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(pdu)  # late answers to abandoned requests are dropped
+
+    @abc.abstractmethod
+    def _next_frame(self) -> tuple[int, bytes] | None:
+        """Cut the next complete frame off the buffer as (key, PDU), if there is one."""
+
+    def _cut(self, start: int, end: int, frame_end: int) -> bytes:
+        """Copy ``[start:end]`` out of the buffer and drop everything up to ``frame_end``.
+
+        The one copy a response makes on its way to the decoder.
+        """
+        with memoryview(self._buffer) as view:
+            pdu = bytes(view[start:end])
+        del self._buffer[:frame_end]
+        return pdu
+
+    @abc.abstractmethod
+    def frame(self, device_id: int, pdu: bytes) -> tuple[int, bytes]:
+        """One request ready for the wire, as (its ``pending`` key, the frame)."""
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Fail every request still waiting for its response."""
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self.pending.clear()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.transport = None
+        self._fail_pending(ConnectionError(f"connection lost: {exc}"))
+
+
+class _MbapProtocol(_FramingProtocol):
+    """Modbus/TCP: frames carry a transaction id, so requests can overlap."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._tids = itertools.count(1)
+        # The unit each transaction id was last sent to: at most one entry per id.
+        self._units: dict[int, int] = {}
+
+    def frame(self, device_id: int, pdu: bytes) -> tuple[int, bytes]:
+        while True:
+            tid = next(self._tids) & 0xFFFF
+            if tid and tid not in self.pending:
+                break
+        self._units[tid] = device_id
+        return tid, _MBAP.pack(tid, 0, len(pdu) + 1, device_id) + pdu
+
+    def _next_frame(self) -> tuple[int, bytes] | None:
+        while len(self._buffer) >= _MBAP.size:
+            tid, protocol, length, unit = _MBAP.unpack_from(self._buffer)
+            if protocol != 0 or length < 2:
+                # Not an MBAP header, so the frame boundaries are lost: no
+                # answer still in flight can be cut out of what follows.
+                self._buffer.clear()
+                self._fail_pending(
+                    FramingError(f"bad MBAP header: protocol {protocol}, length {length}")
+                )
+                return None
+            end = 6 + length  # the length field counts the unit id and the PDU
+            if len(self._buffer) < end:
+                return None
+            pdu = self._cut(_MBAP.size, end, end)
+            sent_to = self._units.get(tid, unit)
+            if unit == sent_to:
+                return tid, pdu
+            # Well framed, but not the answer its transaction id was waiting for.
+            future = self.pending.pop(tid, None)
+            if future is not None and not future.done():
+                future.set_exception(FramingError(f"answer from unit {unit}, sent to {sent_to}"))
+        return None
+
+
+def _rtu_frame_length(buffer: bytearray) -> int | None:
+    """Bytes in the RTU response frame at the start of ``buffer``, once known."""
+    if len(buffer) < 3:
+        return None
+    function_code = buffer[1]
+    if function_code & 0x80:
+        return 5  # address, function code, exception code, CRC
+    if function_code in (1, 2, 3, 4):
+        return 5 + buffer[2]  # address, function code, byte count, data, CRC
+    return 8  # writes echo the address and the value or count
+
+
+class _RtuProtocol(_FramingProtocol):
+    """RTU over TCP: frames carry only the device address, one request at a time."""
+
+    def frame(self, device_id: int, pdu: bytes) -> tuple[int, bytes]:
+        body = bytes([device_id]) + pdu
+        return device_id, body + _CRC.pack(crc16(body))
+
+    def _next_frame(self) -> tuple[int, bytes] | None:
+        end = _rtu_frame_length(self._buffer)
+        if end is None or len(self._buffer) < end:
+            return None
+        with memoryview(self._buffer) as view:
+            intact = crc16(view[: end - 2]) == _CRC.unpack_from(view, end - 2)[0]
+        if not intact:
+            # Line noise: nothing after it can be trusted to start a frame.
+            # The request times out and is retransmitted.
+            self._buffer.clear()
+            return None
+        return self._buffer[0], self._cut(1, end - 2, end)
+
+
+_PROTOCOLS: dict[str, type[_FramingProtocol]] = {"socket": _MbapProtocol, "rtu": _RtuProtocol}
+
+
+class NativeTcpClient:
+    """A connection to a TCP gateway; with ``socket`` framing it can carry
+    several requests at once."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        framer: str = "socket",
+        timeout: float,
+        retries: int,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.framer = framer
+        self.timeout = timeout  # seconds per request (and for connecting)
+        self.retries = retries  # retransmits of an unanswered request
+        self._protocol: _FramingProtocol | None = None
+        self._connecting = asyncio.Lock()  # concurrent callers share one connect
+
+    @property
+    def connected(self) -> bool:
+        return self._protocol is not None and self._protocol.transport is not None
+
+    async def connect(self) -> bool:
+        async with self._connecting:
+            if self.connected:
+                return True
+            loop = asyncio.get_running_loop()
+            _, protocol = await asyncio.wait_for(
+                loop.create_connection(_PROTOCOLS[self.framer], self.host, self.port),
+                self.timeout,
+            )
+            self._protocol = protocol
+            return True
+
+    def close(self) -> None:
+        if self._protocol is not None and self._protocol.transport is not None:
+            self._protocol.transport.close()
+        self._protocol = None
+
+    async def execute(
+        self, device_id: int, pdu: bytes, timeout: float | None = None
+    ) -> bytes:
+        """Send one request PDU and return the response PDU.
+
+        An unanswered request is retransmitted (under a fresh transaction id) up
+        to ``retries`` times, each waiting ``timeout`` seconds (default: the
+        client's); raises TimeoutError when all stay silent, and
+        ConnectionError when there is (or stops being) no connection.
+        """
+        loop = asyncio.get_running_loop()
+        wait = self.timeout if timeout is None else timeout
+        for _ in range(self.retries + 1):
+            protocol = self._protocol
+            if protocol is None or protocol.transport is None:
+                raise ConnectionError(f"not connected to {self.host}:{self.port}")
+            key, frame = protocol.frame(device_id, pdu)
+            future: asyncio.Future[bytes] = loop.create_future()
+            protocol.pending[key] = future
+            protocol.transport.write(frame)
+            try:
+                return await asyncio.wait_for(future, wait)
+            except TimeoutError:
+                continue
+            finally:
+                protocol.pending.pop(key, None)  # also when the caller gave up
+        raise TimeoutError(f"no response after {self.retries + 1} attempt(s)")
+
+    @staticmethod
+    def _error(function_code: int, pdu: bytes) -> NativeResponse | None:
+        if pdu[0] == function_code | 0x80:
+            return NativeResponse(exception_code=pdu[1] if len(pdu) > 1 else 0)
+        return None
+
+    @staticmethod
+    def _data(function_code: int, pdu: bytes, size: int) -> memoryview:
+        """The ``size`` data bytes of a read answer, once its header matches the request.
+
+        A gateway's garbled or misrouted answer raises FramingError — one
+        failed read for the caller, not data decoded from the wrong bytes.
+        """
+        if pdu[0] != function_code or len(pdu) != 2 + size or pdu[1] != size:
+            raise FramingError(f"malformed answer to function {function_code}: {pdu.hex(' ')}")
+        return memoryview(pdu)[2:]
+
+    def _write_answer(self, function_code: int, pdu: bytes) -> NativeResponse:
+        """A write's answer: an exception, or the echo of address and value or count."""
+        if (error := self._error(function_code, pdu)) is not None:
+            return error
+        if pdu[0] != function_code or len(pdu) != 5:
+            raise FramingError(f"malformed answer to function {function_code}: {pdu.hex(' ')}")
+        return NativeResponse()
+
+    async def _read_words(
+        self,
+        function_code: int,
+        address: int,
+        count: int,
+        device_id: int,
+        timeout: float | None,
+    ) -> NativeResponse:
+        pdu = await self.execute(
+            device_id, _READ_REQUEST.pack(function_code, address, count), timeout
+        )
+        if (error := self._error(function_code, pdu)) is not None:
+            return error
+        return NativeResponse(registers=decode_words(self._data(function_code, pdu, 2 * count)))
+
+    async def _read_bits(
+        self,
+        function_code: int,
+        address: int,
+        count: int,
+        device_id: int,
+        timeout: float | None,
+    ) -> NativeResponse:
+        pdu = await self.execute(
+            device_id, _READ_REQUEST.pack(function_code, address, count), timeout
+        )
+        if (error := self._error(function_code, pdu)) is not None:
+            return error
+        data = self._data(function_code, pdu, (count + 7) // 8)
+        return NativeResponse(
+            bits=[bool(data[i >> 3] >> (i & 7) & 1) for i in range(len(data) * 8)]
+        )
+
+    # The reads take an optional per-request ``timeout`` (see execute).
+
+    async def read_coils(
+        self, address: int, count: int, device_id: int, timeout: float | None = None
+    ) -> NativeResponse:
+        return await self._read_bits(1, address, count, device_id, timeout)
+
+    async def read_discrete_inputs(
+        self, address: int, count: int, device_id: int, timeout: float | None = None
+    ) -> NativeResponse:
+        return await self._read_bits(2, address, count, device_id, timeout)
+
+    async def read_holding_registers(
+        self, address: int, count: int, device_id: int, timeout: float | None = None
+    ) -> NativeResponse:
+        return await self._read_words(3, address, count, device_id, timeout)
+
+    async def read_input_registers(
+        self, address: int, count: int, device_id: int, timeout: float | None = None
+    ) -> NativeResponse:
+        return await self._read_words(4, address, count, device_id, timeout)
+
+    async def write_coil(self, address: int, value: bool, device_id: int) -> NativeResponse:
+        pdu = await self.execute(
+            device_id, _READ_REQUEST.pack(5, address, 0xFF00 if value else 0)
+        )
+        return self._write_answer(5, pdu)
+
+    async def write_register(self, address: int, value: int, device_id: int) -> NativeResponse:
+        pdu = await self.execute(device_id, _READ_REQUEST.pack(6, address, value))
+        return self._write_answer(6, pdu)
+
+    async def write_registers(
+        self, address: int, values: list[int], device_id: int
+    ) -> NativeResponse:
+        count = len(values)
+        pdu = await self.execute(
+            device_id,
+            struct.pack(f">BHHB{count}H", 16, address, count, 2 * count, *values),
+        )
+        return self._write_answer(16, pdu)
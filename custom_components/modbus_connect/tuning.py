@@ -0,0 +1,153 @@
+"""Read-limit auto-tuning: learn a device's real max_read and max_gap online.
+
+Pure logic, no Home Assistant imports.
+
+Device files default to cautious limits (8-register reads, 8-address gaps),
+while many devices accept far more. :class:`ReadLimitTuner` watches the block
+reads of normal polling and moves the limits step by step:
+
+* ``max_read`` doubles while the read plan still splits runs at the cap, up to
+  the protocol limit or the smallest size the device has refused;
+* ``max_gap`` follows the measured wire costs — bridging ``g`` filler registers
+  pays while ``g`` register times cost less than one extra round trip — fitted
+  by least squares over the observed (size, latency) pairs.
+
+Every change is a trial: the first block that exceeds the last good value and
+fails (an exception answer or a timeout) reverts both limits to the last good
+pair and caps further growth below the failed size. A cycle where nothing
+answered reverts without capping — an unreachable device says nothing about
+its limits.
+"""
+
+from __future__ import annotations
+
+import math
+
+from .models import BIT_TABLES, PROTOCOL_MAX_REGISTERS, ReadCost, Span
+
+# Fitted costs need this many answered reads (of at least two sizes) before
+# they steer max_gap, and a gap target must differ from the current value by
+# more than this fraction to be tried — measured latencies jitter.
+MIN_SAMPLES = 20
+GAP_HYSTERESIS = 0.25
+
+
+def _units(block: Span) -> int:
+    """Register-equivalents of payload (bits pack sixteen to a register)."""
+    return -(-block.count // 16) if block.table in BIT_TABLES else block.count
+
+
+class ReadLimitTuner:
+    """Grows a device's read limits during polling and falls back on rejection.
+
+    Starts from known-good limits (the device file's, or restored from
+    :meth:`as_dict`). ``max_read`` / ``max_gap`` are the limits to plan with
+    now; ``good_read`` / ``good_gap`` the last pair every read accepted. Feed
+    each planned block's first attempt to :meth:`observe`, then close the cycle
+    with :meth:`step`.
+    """
+
+    def __init__(
+        self,
+        max_read: int,
+        max_gap: int,
+        *,
+        read_ceiling: int = PROTOCOL_MAX_REGISTERS,
+        gap_ceiling: int = PROTOCOL_MAX_REGISTERS,
+    ) -> None:
+        self.max_read = max_read
+        self.max_gap = max_gap
+        self.good_read = max_read
+        self.good_gap = max_gap
+        self.read_ceiling = read_ceiling
+        self.gap_ceiling = gap_ceiling
+        # Least-squares sums over answered reads: latency = request + units * register
+        self._n = 0
+        self._sx = self._sy = self._sxx = self._sxy = 0.0
+        self._reset_cycle()
+
+    def _reset_cycle(self) -> None:
+        self._answered = False
+        self._read_proved = self._gap_proved = False
+        self._rejected_read: int | None = None
+        self._rejected_gap: int | None = None
+
+    def observe(self, block: Span, gap: int, seconds: float, ok: bool) -> None:
+        """Record one block read: its widest bridged ``gap``, latency, outcome."""
+        if ok:
+            self._answered = True
+            self._read_proved |= block.count > self.good_read
+            self._gap_proved |= gap > self.good_gap
+            x = _units(block)
+            self._n += 1
+            self._sx += x
+            self._sy += seconds
+            self._sxx += x * x
+            self._sxy += x * seconds
+            return
+        if block.count > self.good_read:
+            self._rejected_read = min(block.count, self._rejected_read or block.count)
+        if gap > self.good_gap:
+            self._rejected_gap = min(gap, self._rejected_gap or gap)
+
+    @property
+    def cost(self) -> ReadCost | None:
+        """The fitted wire-cost model, once the samples support one."""
+        if self._n < MIN_SAMPLES:
+            return None
+        var = self._n * self._sxx - self._sx * self._sx
+        if var <= 0:
+            return None  # every read the same size: no slope to fit
+        register = (self._n * self._sxy - self._sx * self._sy) / var
+        request = (self._sy - register * self._sx) / self._n
+        if register <= 0 or request <= 0:
+            return None
+        return ReadCost(request=request, register=register)
+
+    def step(self, capped: bool) -> bool:
+        """Close a poll cycle; True if the limits to plan with changed.
+
+        ``capped``: whether the current read plan splits a run at ``max_read``
+        (only then can a larger read save a request).
+        """
+        before = (self.max_read, self.max_gap)
+        if self._rejected_read is not None or self._rejected_gap is not None:
+            if self._answered:  # the device is up: the trial limit itself failed
+                if self._rejected_read is not None:
+                    self.read_ceiling = min(self.read_ceiling, self._rejected_read - 1)
+                if self._rejected_gap is not None:
+                    self.gap_ceiling = min(self.gap_ceiling, self._rejected_gap - 1)
+            self.max_read, self.max_gap = self.good_read, self.good_gap
+        else:
+            if self._read_proved:
+                self.good_read = self.max_read
+            if self._gap_proved:
+                self.good_gap = self.max_gap
+            if capped and self.max_read == self.good_read < self.read_ceiling:
+                self.max_read = min(self.read_ceiling, 2 * self.good_read)
+            self._tune_gap()
+        self._reset_cycle()
+        return (self.max_read, self.max_gap) != before
+
+    def _tune_gap(self) -> None:
+        """Move max_gap toward the break-even gap of the fitted cost model."""
+        cost = self.cost
+        if cost is None or self.max_gap != self.good_gap:
+            return  # nothing measured yet, or a gap trial still pending
+        target = min(
+            math.floor(cost.request / cost.register), self.gap_ceiling, self.max_read
+        )
+        if abs(target - self.max_gap) <= max(1, self.max_gap * GAP_HYSTERESIS):
+            return
+        self.max_gap = target
+        if target < self.good_gap:
+            self.good_gap = target  # bridging less is always safe
+
+    def as_dict(self) -> dict[str, int]:
+        """The learned state, for storage and diagnostics."""
+        return {
+            "max_read": self.good_read,
+            "max_gap": self.good_gap,
+            "read_ceiling": self.read_ceiling,
+            "gap_ceiling": self.gap_ceiling,
+        }
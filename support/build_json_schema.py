@@ -298,11 +298,24 @@ def _device_block() -> dict[str, Any]:
             "max_read_gap": {"type": "integer", "minimum": 0, "maximum": 1000},
             "bad_addresses": _address_hints(),
             "split_before": _address_hints(),
+            "read_cost": {
+                "type": "object",
+                "required": ["request", "register"],
+                "properties": {
+                    "request": {"type": "number", "exclusiveMinimum": 0, "maximum": 10},
+                    "register": {"type": "number", "minimum": 0, "maximum": 1},
+                },
+                "additionalProperties": False,
+            },
             "scan_interval": {"type": "integer", "minimum": 1, "maximum": 86400},
             "min_scan_interval": {"type": "integer", "minimum": 1, "maximum": 86400},
+            "read_ahead": {"type": "integer", "minimum": 0, "maximum": 86400},
             "timeout": {"type": "number", "exclusiveMinimum": 0, "maximum": 60},
             "retries": {"type": "integer", "minimum": 0, "maximum": 10},
             "request_delay": {"type": "number", "minimum": 0, "maximum": 5},
+            "pipeline_depth": {"type": "integer", "minimum": 1, "maximum": 16},
+            "confirm_holds_bus": BOOLEAN,
+            "rmw_max_age": {"type": "number", "minimum": 0, "maximum": 3600},
             "modbus_id": {"type": "integer", "minimum": 0, "maximum": 255},
             "prefix": {"type": "string", "minLength": 1},
             "sw_version": STRING,
@@ -75,6 +75,7 @@ from custom_components.modbus_connect.models import (
     derive_name,
 )
 from custom_components.modbus_connect.planner import plan_blocks
+from custom_components.modbus_connect.rawcache import RawCache
 from custom_components.modbus_connect.schema import DeviceSchemaError, parse_device
 
 HERE = Path(__file__).resolve().parent
@@ -416,6 +417,7 @@ class Scanner:
         self._search_terms: list[tuple[Any, ...]] = []
         self.page_size = self.count   # rows per page (the UI keeps this equal to Count, in every view)
         self.cells: dict[tuple[str, int], Cell] = {}  # (table, address) -> stats, across all tables
+        self.raw = RawCache()  # every cell's last value, for decoding entity spans in slices
         # The dead-register list: (table, address) given up on -> always-on planner holes. One
         # concept across the layers: rows carry it as "dead", cells/exports as the error string
         # "not served" (a persistence contract — load_state rebuilds this set from it, so never
@@ -808,6 +810,7 @@ class Scanner:
                 cell.history.append({"value": value, "scan": self.scan_index, "t": time.time()})
                 del cell.history[:-HISTORY_MAX]  # keep only the most recent HISTORY_MAX
             cell.value = value
+            self.raw[(table, address)] = value
 
     # --- paging --------------------------------------------------------------
     def page(self, *, forward: bool, anchor: int, firm: bool = False) -> None:
@@ -1351,7 +1354,9 @@ class Scanner:
             cells[(table, addr)] = cell
             if cell.error == "not served":
                 bad.add((table, addr))
-        self.cells, self._bad, self._misses = cells, bad, {}
+        raw = RawCache()
+        raw.update({key: c.value for key, c in cells.items() if c.value is not None})
+        self.cells, self.raw, self._bad, self._misses = cells, raw, bad, {}
         mapping = data.get("mapping")
         if mapping:
             # JSON stringified the mapping's integer 'map'/'flags' keys — restore them, or the
@@ -1638,6 +1643,7 @@ class Scanner:
         earlier marked dead (they stay skipped for good until cleared here)."""
         self.clear_devices()
         self.cells.clear()
+        self.raw = RawCache()
         self._bad.clear()
         self._misses.clear()
         self.override, self._override_def = None, None
@@ -1755,12 +1761,9 @@ class Scanner:
         x-ray views pass ``value_table`` to decode a sibling table's entity against the
         *current* table's registers instead of its own."""
         table = value_table or defn.table
-        words: list[int] = []
-        for a in range(defn.span.start, defn.span.end):
-            cell = self.cells.get((table, a))
-            if cell is None or cell.value is None:
-                return None, "unread"
-            words.append(cell.value)
+        words = self.raw.read(Span(table, defn.span.start, defn.span.count))
+        if words is None:
+            return None, "unread"
         raw = [bool(w) for w in words] if defn.table in BIT_TABLES else words
         try:
             return codec.decode(defn, raw), None
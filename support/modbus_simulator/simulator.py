@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""Simulated Modbus devices built from device files — a gateway on your laptop.
+
+Loads any device YAML (a bundled ``device_configs/`` name or a path) and serves
+it over Modbus/TCP — MBAP (``socket``) or RTU-over-TCP framing — with a
+plausible value in every entity's registers: typical mains readings for
+voltage/current/power/frequency sensors, the midpoint of a number's min/max, a
+select's first option, the model name in a string, and so on. Each value is
+encoded by the integration's own ``codec``, so what the integration decodes is
+exactly what the simulator meant to serve (``SimulatedDevice.values``).
+Measurements wander around their value and counters count up while it runs.
+
+The device behaves the way its file says a real one does: reads touching a
+``bad_addresses`` entry answer *illegal data address*, and reads longer than
+the file's ``max_read`` (or the protocol limits) answer *illegal data value*.
+Writes land in the registers and read back. On top, :class:`Faults` injects
+what makes gateways slow or flaky — latency and jitter, serial transfer time
+per byte, unanswered requests, and exception answers (*device busy* by
+default) — and the server handles one request at a time, like the RS-485 bus
+behind a gateway, unless ``--pipelining`` lets MBAP requests overlap.
+
+Device IDs without a simulated device get *gateway target failed to respond*
+on ``socket`` framing and silence on ``rtu``, as a real gateway would.
+
+Reuses the integration's HA-free code (``schema`` + ``codec`` to build the
+registers, ``transport.crc16`` for RTU framing), so run it from the repo
+virtualenv:
+
+    .venv/bin/python support/modbus_simulator/simulator.py eastron-sdm630
+    .venv/bin/python support/modbus_simulator/simulator.py eastron-sdm630:1 finder-7m38:2 \\
+        --port 5020 --latency 0.03 --byte-time 0.001 --timeout-rate 0.01
+
+then point the integration, ``support/modbus_cli.py``, or the scanner at
+127.0.0.1:5020. Tests and benchmarks use :class:`Simulator` directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import math
+import random
+import struct
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, replace
+from datetime import time as dt_time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from custom_components.modbus_connect import codec
+from custom_components.modbus_connect.loader import BUILTIN_DIR, _load_file
+from custom_components.modbus_connect.models import (
+    BIT_TABLES,
+    FLOAT_TYPES,
+    PROTOCOL_MAX_BITS,
+    PROTOCOL_MAX_REGISTERS,
+    PROTOCOL_MAX_WRITE_REGISTERS,
+    TABLE_COIL,
+    TABLE_DISCRETE,
+    TABLE_HOLDING,
+    TABLE_INPUT,
+    TABLES,
+    TYPE_STRING,
+    TYPE_TIME,
+    DeviceDef,
+    EntityDef,
+)
+from custom_components.modbus_connect.schema import DeviceSchemaError
+from custom_components.modbus_connect.transport import crc16
+
+# Modbus exception codes the simulator answers with
+ILLEGAL_FUNCTION = 1
+ILLEGAL_DATA_ADDRESS = 2
+ILLEGAL_DATA_VALUE = 3
+DEVICE_BUSY = 6
+GATEWAY_TARGET_FAILED = 11
+
+READ_FUNCTIONS = {1: TABLE_COIL, 2: TABLE_DISCRETE, 3: TABLE_HOLDING, 4: TABLE_INPUT}
+PROTOCOL_MAX_WRITE_BITS = 1968  # per FC15 request
+
+_MBAP = struct.Struct(">HHHB")  # transaction id, protocol id (0), length, unit id
+_CRC = struct.Struct("<H")
+
+# A typical reading per unit, for sensors without a min/max to take one from.
+_TYPICAL: dict[str, float] = {
+    "V": 230.0,
+    "A": 4.2,
+    "W": 950.0,
+    "kW": 0.95,
+    "VA": 1000.0,
+    "kVA": 1.0,
+    "var": 120.0,
+    "kvar": 0.12,
+    "Hz": 50.0,
+    "°C": 21.5,
+    "K": 5.0,
+    "%": 45.0,
+    "Wh": 12345.0,
+    "kWh": 1234.5,
+    "kVArh": 56.7,
+    "h": 4321.0,
+    "min": 15.0,
+    "s": 30.0,
+    "ppm": 650.0,
+    "Pa": 101.0,
+    "bar": 1.5,
+    "m³/h": 120.0,
+    "rpm": 1450.0,
+}
+WANDER = 0.05  # measurements swing this share of their value around it
+WANDER_PERIOD = 60.0  # seconds per swing
+COUNT_RATE = 1 / 60  # counters gain one unit per minute
+
+
+class ModbusError(Exception):
+    """A request the simulated device answers with a Modbus exception."""
+
+    def __init__(self, code: int) -> None:
+        super().__init__(f"exception {code}")
+        self.code = code
+
+
+@dataclass
+class Faults:
+    """Misbehaviour injected into every answer, to reproduce slow or flaky gateways."""
+
+    latency: float = 0.0  # seconds before each answer
+    jitter: float = 0.0  # up to this many seconds more, uniformly random
+    byte_time: float = 0.0  # seconds per response byte (a serial line: ~0.001 at 9600 baud)
+    timeout_rate: float = 0.0  # share of requests never answered
+    exception_rate: float = 0.0  # share answered with ``exception_code`` instead
+    exception_code: int = DEVICE_BUSY
+
+
+@dataclass
+class _Live:
+    """An entity whose served value moves while the simulator runs."""
+
+    defn: EntityDef
+    base: float
+    counter: bool  # counts up; else wanders around ``base``
+    phase: float
+
+
+class SimulatedDevice:
+    """One device's registers, filled from its device file, and the PDUs it answers."""
+
+    def __init__(
+        self, device: DeviceDef, *, max_read: int | None = None, seed: int | None = 0
+    ) -> None:
+        self.device = device
+        self.max_read = max_read or device.max_read
+        self.tables: dict[str, dict[int, int]] = {table: {} for table in TABLES}
+        self.values: dict[str, object] = {}  # entity key -> the value its registers hold
+        self._rng = random.Random(seed)
+        self._live: list[_Live] = []
+        claimed: dict[tuple[str, int], int] = {}  # register -> bits taken by an entity
+        for defn in device.entities:
+            if not defn.polls or not _claim(claimed, defn):
+                continue  # write-only, or another entity's register already
+            value = self._plausible(defn)
+            if value is None:  # flags: every bit clear
+                self.values[defn.key] = codec.decode(defn, self._words(defn))
+            elif self._serve(defn, value):
+                self._track(defn, value)
+
+    def _plausible(self, defn: EntityDef) -> object:
+        ha = defn.ha
+        if defn.platform in ("switch", "binary_sensor", "valve"):
+            on = str(ha.get("device_class")) == "running"
+            configured = defn.on_value if on else defn.off_value
+            if configured is not None:
+                return configured
+            return on if defn.table in BIT_TABLES else int(on)
+        if defn.table in BIT_TABLES:
+            return False
+        if defn.flags is not None:
+            return None  # not encodable; the zeroed register reads as no flag set
+        if defn.value_map is not None:
+            return defn.value_map[min(defn.value_map)]
+        if defn.type == TYPE_STRING:
+            return self.device.model[: defn.count * 2]
+        if defn.type == TYPE_TIME:
+            return dt_time(6, 30)
+        low, high = ha.get("native_min_value"), ha.get("native_max_value")
+        if low is not None and high is not None:
+            return _snap(defn, (low + high) / 2)
+        typical = _TYPICAL.get(str(ha.get("native_unit_of_measurement")))
+        if typical is None:
+            typical = float(self._rng.randint(0, 100))
+        return _snap(defn, typical)
+
+    def _serve(self, defn: EntityDef, value: object) -> bool:
+        """Encode ``value`` into the entity's registers; False if it has no encoding."""
+        bank = self.tables[defn.table]
+        try:
+            if defn.table in BIT_TABLES:
+                bank[defn.address] = int(bool(codec.encode(defn, value)))
+                return True
+            if defn.mask is not None:
+                # share the register with the other fields masked into it
+                merged = replace(defn, read_modify_write=True)
+                words = codec.encode(merged, value, bank.get(defn.address, 0))
+            else:
+                words = codec.encode(defn, value)
+        except codec.CodecError:
+            return False
+        assert isinstance(words, list)
+        for offset, word in enumerate(words):
+            bank[defn.address + offset] = word
+        return True
+
+    def _track(self, defn: EntityDef, value: object) -> None:
+        self.values[defn.key] = codec.decode(defn, self._words(defn))
+        state_class = str(defn.ha.get("state_class"))
+        if (
+            defn.platform in ("sensor", "internal")
+            and state_class in ("measurement", "total", "total_increasing")
+            and isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and defn.value_map is None
+        ):
+            counter = state_class != "measurement"
+            self._live.append(_Live(defn, value, counter, self._rng.uniform(0, 2 * math.pi)))
+
+    def _words(self, defn: EntityDef) -> list[int]:
+        bank = self.tables[defn.table]
+        return [bank.get(a, 0) for a in range(defn.address, defn.address + defn.count)]
+
+    def update(self, elapsed: float) -> None:
+        """Move the live values to where they are ``elapsed`` seconds in."""
+        for live in self._live:
+            if live.counter:
+                value = live.base + elapsed * COUNT_RATE
+            else:
+                swing = math.sin(2 * math.pi * elapsed / WANDER_PERIOD + live.phase)
+                value = live.base * (1 + WANDER * swing)
+            if self._serve(live.defn, _snap(live.defn, value)):
+                self.values[live.defn.key] = codec.decode(live.defn, self._words(live.defn))
+
+    def read(self, table: str, address: int, count: int) -> list[int]:
+        limit = PROTOCOL_MAX_BITS if table in BIT_TABLES else PROTOCOL_MAX_REGISTERS
+        if not 1 <= count <= min(limit, self.max_read):
+            raise ModbusError(ILLEGAL_DATA_VALUE)
+        self._check(table, address, count)
+        bank = self.tables[table]
+        return [bank.get(a, 0) for a in range(address, address + count)]
+
+    def write(self, table: str, address: int, values: list[int]) -> None:
+        self._check(table, address, len(values))
+        self.tables[table].update(zip(range(address, address + len(values)), values, strict=True))
+
+    def _check(self, table: str, address: int, count: int) -> None:
+        if address + count > 0x10000:
+            raise ModbusError(ILLEGAL_DATA_ADDRESS)
+        bad = self.device.bad_addresses
+        if bad and any((table, a) in bad for a in range(address, address + count)):
+            raise ModbusError(ILLEGAL_DATA_ADDRESS)
+
+    def handle(self, pdu: bytes) -> bytes:
+        """The response PDU to a request PDU, exception answers included."""
+        function_code = pdu[0]
+        try:
+            return self._handle(function_code, pdu)
+        except ModbusError as err:
+            return bytes([function_code | 0x80, err.code])
+        except (struct.error, IndexError):  # truncated request
+            return bytes([function_code | 0x80, ILLEGAL_DATA_VALUE])
+
+    def _handle(self, function_code: int, pdu: bytes) -> bytes:
+        if function_code in READ_FUNCTIONS:
+            address, count = struct.unpack_from(">HH", pdu, 1)
+            values = self.read(READ_FUNCTIONS[function_code], address, count)
+            if function_code in (1, 2):
+                data = _pack_bits(values)
+            else:
+                data = struct.pack(f">{count}H", *values)
+            return bytes([function_code, len(data)]) + data
+        if function_code == 5:
+            address, value = struct.unpack_from(">HH", pdu, 1)
+            if value not in (0x0000, 0xFF00):
+                raise ModbusError(ILLEGAL_DATA_VALUE)
+            self.write(TABLE_COIL, address, [int(value == 0xFF00)])
+        elif function_code == 6:
+            address, value = struct.unpack_from(">HH", pdu, 1)
+            self.write(TABLE_HOLDING, address, [value])
+        elif function_code == 15:
+            address, count, _nbytes = struct.unpack_from(">HHB", pdu, 1)
+            if not 1 <= count <= PROTOCOL_MAX_WRITE_BITS:
+                raise ModbusError(ILLEGAL_DATA_VALUE)
+            self.write(TABLE_COIL, address, _unpack_bits(pdu[6:], count))
+        elif function_code == 16:
+            address, count, _nbytes = struct.unpack_from(">HHB", pdu, 1)
+            if not 1 <= count <= PROTOCOL_MAX_WRITE_REGISTERS:
+                raise ModbusError(ILLEGAL_DATA_VALUE)
+            self.write(TABLE_HOLDING, address, list(struct.unpack_from(f">{count}H", pdu, 6)))
+        else:
+            raise ModbusError(ILLEGAL_FUNCTION)
+        return pdu[:5]  # writes echo the address and the value or count
+
+
+def _claim(claimed: dict[tuple[str, int], int], defn: EntityDef) -> bool:
+    """Reserve the entity's register bits, unless an earlier entity holds any of them."""
+    bits = 0xFFFF if defn.mask is None or defn.table in BIT_TABLES else defn.mask & 0xFFFF
+    keys = [(defn.table, a) for a in range(defn.address, defn.address + defn.count)]
+    if any(claimed.get(key, 0) & bits for key in keys):
+        return False
+    for key in keys:
+        claimed[key] = claimed.get(key, 0) | bits
+    return True
+
+
+def _snap(defn: EntityDef, value: float) -> float:
+    """The nearest value the entity's register can hold exactly."""
+    if defn.type in FLOAT_TYPES:
+        return round(value, 2)
+    multiplier = defn.multiplier or 1
+    offset = defn.offset or 0
+    return round(round((value - offset) / multiplier) * multiplier + offset, 10)
+
+
+def _pack_bits(bits: list[int]) -> bytes:
+    data = bytearray((len(bits) + 7) // 8)
+    for i, bit in enumerate(bits):
+        if bit:
+            data[i // 8] |= 1 << (i % 8)
+    return bytes(data)
+
+
+def _unpack_bits(data: bytes, count: int) -> list[int]:
+    return [(data[i // 8] >> (i % 8)) & 1 for i in range(count)]
+
+
+class Simulator:
+    """An asyncio Modbus/TCP server answering for simulated devices by device ID."""
+
+    def __init__(
+        self,
+        devices: dict[int, SimulatedDevice],
+        *,
+        framer: str = "socket",
+        faults: Faults | None = None,
+        pipelining: bool = False,
+        live: bool = True,
+        seed: int | None = None,
+    ) -> None:
+        if framer not in ("socket", "rtu"):
+            raise ValueError(f"unknown framer {framer!r}")
+        self.devices = devices
+        self.framer = framer
+        self.faults = faults or Faults()
+        self.pipelining = pipelining and framer == "socket"
+        self.live = live  # measurements wander and counters count while serving
+        self.stats: Counter[str] = Counter()
+        self._rng = random.Random(seed)
+        self._bus = asyncio.Lock()  # one request at a time, unless pipelining
+        self._server: asyncio.Server | None = None
+        self._started = time.monotonic()
+        self.port: int | None = None  # set once listening
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start listening; returns the port (pick a free one with ``port=0``)."""
+        self._started = time.monotonic()
+        self._server = await asyncio.start_server(self._serve, host, port)
+        self.port = int(self._server.sockets[0].getsockname()[1])
+        return self.port
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> Simulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def answer(self, device_id: int, pdu: bytes) -> bytes | None:
+        """The response PDU after the injected delay, or None for silence."""
+        self.stats["requests"] += 1
+        device = self.devices.get(device_id)
+        if device is None:
+            self.stats["no_device"] += 1
+            if self.framer == "rtu":
+                return None  # nobody on the line has that address
+            return bytes([pdu[0] | 0x80, GATEWAY_TARGET_FAILED])
+        faults = self.faults
+        if faults.timeout_rate and self._rng.random() < faults.timeout_rate:
+            self.stats["timeouts"] += 1
+            return None
+        if faults.exception_rate and self._rng.random() < faults.exception_rate:
+            self.stats["exceptions"] += 1
+            response = bytes([pdu[0] | 0x80, faults.exception_code])
+        else:
+            if self.live:
+                device.update(time.monotonic() - self._started)
+            response = device.handle(pdu)
+        delay = faults.latency + faults.byte_time * len(response)
+        if faults.jitter:
+            delay += self._rng.uniform(0, faults.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                if self.framer == "rtu":
+                    await self._serve_rtu(reader, writer)
+                    continue
+                tid, _protocol, length, unit = _MBAP.unpack(await reader.readexactly(_MBAP.size))
+                pdu = await reader.readexactly(length - 1)
+                reply = self._reply_mbap(writer, tid, unit, pdu)
+                if self.pipelining:
+                    task = asyncio.create_task(reply)
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                else:
+                    async with self._bus:
+                        await reply
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _reply_mbap(
+        self, writer: asyncio.StreamWriter, tid: int, unit: int, pdu: bytes
+    ) -> None:
+        response = await self.answer(unit, pdu)
+        if response is not None and not writer.is_closing():
+            writer.write(_MBAP.pack(tid, 0, len(response) + 1, unit) + response)
+
+    async def _serve_rtu(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        head = await reader.readexactly(2)  # device address, function code
+        if head[1] in (15, 16):
+            rest = await reader.readexactly(5)  # address, count, byte count
+            rest += await reader.readexactly(rest[4] + 2)
+        else:
+            rest = await reader.readexactly(6)  # address, count or value, CRC
+        frame = head + rest
+        if crc16(frame[:-2]) != _CRC.unpack(frame[-2:])[0]:
+            self.stats["bad_crc"] += 1
+            return  # a garbled request goes unanswered
+        async with self._bus:
+            response = await self.answer(frame[0], frame[1:-2])
+        if response is not None:
+            body = frame[:1] + response
+            writer.write(body + _CRC.pack(crc16(body)))
+
+
+def load_device(name: str) -> DeviceDef:
+    """A device file by path, or by the name of a bundled one (``.yaml`` optional)."""
+    path = Path(name)
+    if not path.is_file():
+        path = BUILTIN_DIR / (name if name.endswith(".yaml") else f"{name}.yaml")
+    try:
+        return _load_file(path, path.name.lower())
+    except OSError as err:
+        raise DeviceSchemaError(f"{name}: cannot read: {err}") from err
+
+
+def _device_arg(value: str) -> tuple[str, int | None]:
+    """``FILE[:ID]`` as (file, device ID or None)."""
+    name, colon, device_id = value.rpartition(":")
+    if colon and device_id.isdigit():
+        return name, int(device_id)
+    return value, None
+
+
+async def _run(args: argparse.Namespace, devices: dict[int, SimulatedDevice]) -> None:
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        byte_time=args.byte_time,
+        timeout_rate=args.timeout_rate,
+        exception_rate=args.exception_rate,
+        exception_code=args.exception_code,
+    )
+    simulator = Simulator(
+        devices,
+        framer=args.framer,
+        faults=faults,
+        pipelining=args.pipelining,
+        live=not args.static,
+        seed=args.seed,
+    )
+    port = await simulator.start(args.host, args.port)
+    for device_id, sim in devices.items():
+        print(
+            f"device {device_id}: {sim.device.manufacturer} {sim.device.model} "
+            f"({len(sim.values)} entities served, max_read {sim.max_read})"
+        )
+    print(f"listening on {args.host}:{port} ({args.framer} framing); Ctrl-C stops")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+        print(dict(simulator.stats))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n", 1)[0], formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "devices", nargs="+", metavar="FILE[:ID]",
+        help="device file (bundled name or path), optionally with its device ID "
+             "(default: the file's modbus_id, else 1, 2, ... in order)",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5020)
+    parser.add_argument("--framer", choices=("socket", "rtu"), default="socket")
+    parser.add_argument("--pipelining", action="store_true",
+                        help="answer overlapping MBAP requests concurrently")
+    parser.add_argument("--static", action="store_true",
+                        help="keep every value where it starts (no wandering, no counting)")
+    parser.add_argument("--max-read", type=int,
+                        help="largest read the devices accept (default: each file's max_read)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each answer")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this much more, random")
+    parser.add_argument("--byte-time", type=float, default=0.0,
+                        help="seconds per response byte (serial line: ~0.001 at 9600 baud)")
+    parser.add_argument("--timeout-rate", type=float, default=0.0,
+                        help="share of requests never answered (0..1)")
+    parser.add_argument("--exception-rate", type=float, default=0.0,
+                        help="share of requests answered with --exception-code (0..1)")
+    parser.add_argument("--exception-code", type=int, default=DEVICE_BUSY)
+    parser.add_argument("--seed", type=int, help="random seed for values and faults")
+    args = parser.parse_args(argv)
+
+    devices: dict[int, SimulatedDevice] = {}
+    for spec in args.devices:
+        name, device_id = _device_arg(spec)
+        try:
+            device = load_device(name)
+        except DeviceSchemaError as err:
+            parser.error(str(err))
+        if device_id is None:
+            device_id = device.modbus_id or 1
+            while device_id in devices:
+                device_id += 1
+        if device_id in devices:
+            parser.error(f"device ID {device_id} given twice")
+        devices[device_id] = SimulatedDevice(device, max_read=args.max_read, seed=args.seed)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_run(args, devices))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
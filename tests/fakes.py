@@ -7,14 +7,19 @@ and read/write recording the coordinator tests need.
 """
 
 import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.modbus_connect.client import ReadError
+from custom_components.modbus_connect.client import PRIORITY_POLL, PRIORITY_WRITE, ReadError
 from custom_components.modbus_connect.const import CONF_FILENAME, CONF_SLAVE_ID, DOMAIN
 from custom_components.modbus_connect.coordinator import ModbusConnectCoordinator
+from custom_components.modbus_connect.metrics import TransactionMetrics
 from custom_components.modbus_connect.models import BIT_TABLES, DeviceDef, EntityDef, Span
+from custom_components.modbus_connect.rawcache import RawCache
+from custom_components.modbus_connect.trace import TraceRecorder
 
 
 class FakeTime:
@@ -28,7 +33,7 @@ class FakeTime:
 
 
 class FakeClient:
-    """Duck-typed ModbusBlockClient backed by a per-table value dict.
+    """Duck-typed ModbusBlockClient backed by a raw register cache.
 
     ``registers`` seeds holding registers (the common case); other tables are
     seeded through ``values[(table, address)]``. Reads, writes, and releases
@@ -40,10 +45,11 @@ class FakeClient:
         self, registers: dict[int, int] | None = None, *, target: str = "127.0.0.1:502"
     ) -> None:
         self.target = target
-        self.lock = asyncio.Lock()
-        self.values: dict[tuple[str, int], int | bool] = {
-            ("holding", address): value for address, value in (registers or {}).items()
-        }
+        self._bus = asyncio.Lock()  # turns go one at a time, in arrival order
+        self.values = RawCache()
+        self.values.update(
+            {("holding", address): value for address, value in (registers or {}).items()}
+        )
         self.reads: list[Span] = []
         self.written: list[tuple[int, list[int]]] = []
         self.write_multiple_flags: list[bool] = []
@@ -51,13 +57,51 @@ class FakeClient:
         self.fail_spans: set[Span] = set()
         self.fail_addresses: set[int] = set()
         self.illegal = False  # fail with the device's explicit illegal-address answer
+        self.circuit_open = False  # fail every read locally, as an open breaker does
         self.connected_ok = True
+        self.turns: list[str] = []  # entry id of every polling turn taken
+        self.write_turns = 0  # turns taken at PRIORITY_WRITE
+        self.metrics = TransactionMetrics()  # stays empty: nothing goes on a wire
+        self.depth = 1  # sequential block reads, as on a non-pipelining gateway
+        self.native = False
+        self.frame_gap = 0.0
+        self.trace: TraceRecorder | None = None
 
     async def ensure_connected(self) -> bool:
         return self.connected_ok
 
+    @asynccontextmanager
+    async def turn(
+        self, entry_id: str, deadline: float, priority: int = PRIORITY_POLL
+    ) -> AsyncIterator[None]:
+        if priority == PRIORITY_WRITE:
+            self.write_turns += 1
+        else:
+            self.turns.append(entry_id)
+        async with self._bus:
+            yield
+
+    def start_trace(self) -> TraceRecorder:
+        if self.trace is None:
+            self.trace = TraceRecorder()
+        return self.trace
+
+    def bus_share(self) -> dict[str, float]:
+        return {}
+
+    def wait_times(self) -> dict[str, dict[str, float]]:
+        return {}
+
+    def circuit_breakers(self) -> dict[int, dict[str, Any]]:
+        return {}
+
+    def round_trips(self) -> dict[int, dict[str, Any]]:
+        return {}
+
     async def read_block(self, device_id: int, span: Span) -> list[int] | list[bool]:
         self.reads.append(span)
+        if self.circuit_open:
+            raise ReadError(f"open {span}", circuit_open=True)
         if span in self.fail_spans or any(
             span.start <= a < span.end for a in self.fail_addresses
         ):
@@ -72,8 +116,7 @@ class FakeClient:
     ) -> None:
         self.written.append((address, words))
         self.write_multiple_flags.append(multiple)
-        for i, word in enumerate(words):
-            self.values[("holding", address + i)] = word
+        self.values.store(Span("holding", address, len(words)), words)
 
     async def write_coil(self, device_id: int, address: int, value: bool) -> None:
         self.written.append((address, [int(value)]))
@@ -0,0 +1,78 @@
+"""Per-device circuit breaker: trip, fail fast, probe with backoff, recover."""
+
+from custom_components.modbus_connect.breaker import (
+    FAILURE_THRESHOLD,
+    MAX_OPEN_SECONDS,
+    OPEN_SECONDS,
+    CircuitBreaker,
+)
+
+
+def test_opens_after_consecutive_silence_only():
+    breaker = CircuitBreaker()
+    for _ in range(FAILURE_THRESHOLD - 1):
+        assert not breaker.unanswered(0.0)
+    breaker.answered()  # one answer resets the streak
+    for _ in range(FAILURE_THRESHOLD - 1):
+        breaker.unanswered(0.0)
+    assert breaker.allow(0.0)
+    assert breaker.unanswered(0.0)  # the threshold-th in a row opens it
+    assert not breaker.allow(1.0)
+    assert breaker.as_dict(1.0)["state"] == "open"
+    assert breaker.as_dict(1.0)["rejected"] == 1
+
+
+def test_one_probe_per_window_and_backoff():
+    breaker = CircuitBreaker()
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.unanswered(0.0)
+    assert not breaker.allow(OPEN_SECONDS - 0.1)
+    assert breaker.allow(OPEN_SECONDS)  # the probe
+    assert not breaker.allow(OPEN_SECONDS)  # nothing else while it is out
+    assert breaker.as_dict(OPEN_SECONDS)["state"] == "half_open"
+    breaker.unanswered(OPEN_SECONDS + 1)
+    assert breaker.window == 2 * OPEN_SECONDS  # a failed probe doubles the wait
+    assert not breaker.allow(OPEN_SECONDS + 2 * OPEN_SECONDS)
+    assert breaker.allow(OPEN_SECONDS + 1 + 2 * OPEN_SECONDS)
+    for _ in range(20):
+        breaker.probing = True
+        breaker.unanswered(0.0)
+    assert breaker.window == MAX_OPEN_SECONDS
+
+    assert breaker.answered()  # an answer closes it and resets the backoff
+    assert breaker.allow(0.0)
+    assert breaker.window == OPEN_SECONDS
+    assert breaker.trips == 1
+
+
+def test_abandoned_probe_costs_one_window():
+    breaker = CircuitBreaker()
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.unanswered(0.0)
+    assert breaker.allow(OPEN_SECONDS)  # a probe whose caller then gave up
+    assert breaker.allow(2 * OPEN_SECONDS)  # the next window probes again
+
+
+def test_probe_ending_without_word_from_the_device_is_no_longer_out():
+    breaker = CircuitBreaker()
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.unanswered(0.0)
+    assert breaker.allow(OPEN_SECONDS)  # the probe hits a connection error
+    breaker.abandoned()
+    assert breaker.as_dict(OPEN_SECONDS + 1)["state"] == "open"
+    assert not breaker.allow(OPEN_SECONDS + 1)  # its window still holds
+    breaker.unanswered(OPEN_SECONDS + 1)  # a straggler is not the probe failing
+    assert breaker.window == OPEN_SECONDS
+    assert breaker.allow(2 * OPEN_SECONDS + 1)
+    assert breaker.answered()
+
+
+def test_lost_probe_is_not_reported_out_past_its_window():
+    breaker = CircuitBreaker()
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.unanswered(0.0)
+    assert breaker.allow(OPEN_SECONDS)  # never reports back
+    assert breaker.as_dict(2 * OPEN_SECONDS - 0.1)["state"] == "half_open"
+    assert breaker.as_dict(2 * OPEN_SECONDS)["state"] == "open"
+    assert breaker.allow(2 * OPEN_SECONDS)  # the next probe
+    assert breaker.as_dict(2 * OPEN_SECONDS)["state"] == "half_open"
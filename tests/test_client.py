@@ -1,8 +1,23 @@
-"""Write function-code selection and fallback in the pymodbus wrapper."""
+"""Write function-code selection and fallback, and bus turns, in the pymodbus wrapper."""
+
+import asyncio
+import time
 
 import pytest
 
-from custom_components.modbus_connect.client import ModbusBlockClient, WriteError
+from custom_components.modbus_connect.breaker import FAILURE_THRESHOLD, OPEN_SECONDS
+from custom_components.modbus_connect.client import (
+    PRIORITY_URGENT,
+    PRIORITY_WRITE,
+    ModbusBlockClient,
+    ReadError,
+    WriteError,
+)
+from custom_components.modbus_connect.metrics import TransactionMetrics
+from custom_components.modbus_connect.models import Span
+from custom_components.modbus_connect.silence import MIN_GUARD, inter_frame_gap
+from custom_components.modbus_connect.timeouts import MIN_SAMPLES, MIN_TIMEOUT
+from custom_components.modbus_connect.transport import NativeResponse
 
 
 class _Resp:
@@ -35,9 +50,162 @@ def _client(fake: _FakeClient) -> ModbusBlockClient:
     client._client = fake  # type: ignore[attr-defined]
     client._request_delay = 0.0
     client._last_io = 0.0
+    client.framer = "socket"
+    client.target = "127.0.0.1:502"
+    client.metrics = TransactionMetrics()
+    client._timeout = 2.0
+    client._round_trips = {}
+    client._breakers = {}
+    client._line = None
+    client.frame_gap = 0.0
+    client._guards = {}
+    client.trace = None
     return client
 
 
+class _Regs(_Resp):
+    def __init__(self, count: int) -> None:
+        super().__init__(False)
+        self.registers = [0] * count
+
+
+class _Params:
+    timeout_connect = 2.0
+
+
+class _Reader:
+    """Answers holding-register reads, recording the timeout each one ran under."""
+
+    def __init__(self) -> None:
+        self.comm_params = _Params()
+        self.timeouts: list[float] = []
+        self.sent_at: list[float] = []
+        self.silent = False
+        self.gateway_silent: set[int] = set()  # device ids the gateway cannot reach
+        self.dropped = False  # the connection fails under the request
+        self.hang = False  # the request never completes
+
+    async def read_holding_registers(self, address, count, device_id):
+        self.timeouts.append(self.comm_params.timeout_connect)
+        self.sent_at.append(time.monotonic())
+        if self.silent:
+            raise TimeoutError
+        if self.dropped:
+            raise ConnectionResetError
+        if self.hang:
+            await asyncio.Event().wait()
+        if device_id in self.gateway_silent:
+            return NativeResponse(exception_code=11)
+        return _Regs(count)
+
+
+async def test_read_timeout_adapts_below_the_configured_ceiling():
+    reader = _Reader()
+    client = _client(reader)  # type: ignore[arg-type]
+    client._read_funcs = {"holding": reader.read_holding_registers}
+    span = Span("holding", 0, 2)
+    for _ in range(MIN_SAMPLES + 1):
+        await client.read_block(1, span)
+    assert reader.timeouts[:MIN_SAMPLES] == [2.0] * MIN_SAMPLES  # not measured yet
+    adapted = reader.timeouts[-1]
+    assert MIN_TIMEOUT <= adapted < 2.0  # a fast device earns a short timeout
+    assert reader.comm_params.timeout_connect == 2.0  # lent for one read only
+
+    reader.silent = True
+    with pytest.raises(ReadError):
+        await client.read_block(1, span)
+    assert client.read_timeout(1, span) == pytest.approx(min(2.0, 2 * adapted))
+    assert client.read_timeout(2, span) == 2.0  # another device: nothing measured
+    assert client.round_trips()[1]["backoff"] == 2
+
+
+async def test_silent_device_fails_fast_without_stalling_its_neighbours():
+    reader = _Reader()
+    client = _client(reader)  # type: ignore[arg-type]
+    client._read_funcs = {"holding": reader.read_holding_registers}
+    span = Span("holding", 0, 1)
+    reader.gateway_silent = {1}  # the gateway's "target failed to respond" counts
+    for _ in range(FAILURE_THRESHOLD):
+        with pytest.raises(ReadError) as excinfo:
+            await client.read_block(1, span)
+        assert not excinfo.value.circuit_open
+    with pytest.raises(ReadError) as excinfo:
+        await client.read_block(1, span)
+    assert excinfo.value.circuit_open
+    assert len(reader.timeouts) == FAILURE_THRESHOLD  # the last never reached the wire
+    await client.read_block(2, span)  # another unit on the bus is unaffected
+    state = client.circuit_breakers()[1]
+    assert state["state"] == "open"
+    assert state["rejected"] == 1
+    assert client.circuit_breakers()[2]["state"] == "closed"
+
+    # the window passes: one probe goes through, and the device's answer closes it
+    reader.gateway_silent = set()
+    client._breakers[1].retry_at = time.monotonic()
+    await client.read_block(1, span)
+    assert client.circuit_breakers()[1]["state"] == "closed"
+
+
+async def test_probe_ended_by_the_connection_or_its_caller_is_no_longer_out():
+    reader = _Reader()
+    client = _client(reader)  # type: ignore[arg-type]
+    client._read_funcs = {"holding": reader.read_holding_registers}
+    span = Span("holding", 0, 1)
+    reader.silent = True
+    for _ in range(FAILURE_THRESHOLD):
+        with pytest.raises(ReadError):
+            await client.read_block(1, span)
+    breaker = client._breakers[1]
+    reader.silent = False
+
+    reader.dropped = True
+    breaker.retry_at = time.monotonic()
+    with pytest.raises(ReadError):
+        await client.read_block(1, span)
+    assert not breaker.probing
+    assert breaker.window == OPEN_SECONDS  # the device was not heard failing
+
+    reader.dropped = False
+    reader.hang = True
+    breaker.retry_at = time.monotonic()
+    task = asyncio.ensure_future(client.read_block(1, span))
+    await asyncio.sleep(0)
+    assert breaker.probing
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not breaker.probing
+    assert client.circuit_breakers()[1]["state"] == "open"
+
+
+async def test_serial_silence_is_the_line_gap_plus_a_learned_guard():
+    reader = _Reader()
+    client = _client(reader)  # type: ignore[arg-type]
+    client._read_funcs = {"holding": reader.read_holding_registers}
+    client._line = (19200, 8, "E", 1)
+    client.frame_gap = inter_frame_gap(*client._line)
+    assert client.frame_gap == pytest.approx(3.5 * 11 / 19200)  # ~2 ms, not 50-100
+    span = Span("holding", 0, 1)
+
+    await client.read_block(1, span)
+    await client.read_block(1, span)
+    assert reader.sent_at[1] - reader.sent_at[0] >= client.frame_gap - 0.001
+    assert client.round_trips()[1]["guard_time"] == 0.0
+
+    # unanswered right after another frame: the device may need longer
+    reader.silent = True
+    with pytest.raises(ReadError):
+        await client.read_block(1, span)
+    assert client.round_trips()[1]["guard_time"] == MIN_GUARD
+    reader.silent = False
+    await client.read_block(1, span)
+    assert reader.sent_at[-1] - reader.sent_at[-2] >= MIN_GUARD - 0.001
+
+    client._request_delay = 0.05  # an explicit request_delay stays the floor
+    await client.read_block(2, span)
+    assert reader.sent_at[-1] - reader.sent_at[-2] >= 0.049
+
+
 async def test_single_register_uses_fc6():
     fake = _FakeClient()
     await _client(fake).write_registers(1, 103, [40])
@@ -93,6 +261,7 @@ async def test_serial_client_shared_by_path(caplog):
         assert b is a
         assert a.target == "/dev/ttyTEST9"
         assert a.framer == "rtu"
+        assert a.frame_gap == pytest.approx(inter_frame_gap(19200, 8, "E", 1))
         # mismatching line settings keep the first ones, loudly
         assert "line settings" in caplog.text
     finally:
@@ -111,3 +280,88 @@ async def test_serial_and_tcp_clients_are_distinct():
     finally:
         tcp.release("e-tcp")
         ser.release("e-ser")
+
+
+async def test_turns_go_earliest_deadline_first():
+    client = ModbusBlockClient.acquire("127.0.0.1", 15021, "e1")
+    order: list[str] = []
+
+    async def poll(entry_id: str, deadline: float) -> None:
+        async with client.turn(entry_id, deadline):
+            order.append(entry_id)
+
+    try:
+        async with client.turn("e1", 0):  # hold the bus while the others queue
+            tasks = [
+                asyncio.create_task(poll(entry_id, deadline))
+                for entry_id, deadline in (("late", 30), ("soon", 10), ("gone", 5), ("mid", 20))
+            ]
+            await asyncio.sleep(0)
+            tasks[2].cancel()  # a waiter that gives up must not stall the queue
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert order == ["soon", "mid", "late"]
+        share = client.bus_share()
+        assert share["e1"] > 0.5  # it held the bus longest
+        assert sum(share.values()) == pytest.approx(1)
+    finally:
+        client.release("e1")
+    assert "e1" not in client.bus_time  # a released entry takes its share along
+
+
+async def test_writes_and_urgent_turns_overtake_queued_polls():
+    client = ModbusBlockClient.acquire("127.0.0.1", 15022, "e1")
+    order: list[str] = []
+
+    async def take(name: str, deadline: float, priority: int) -> None:
+        async with client.turn(name, deadline, priority):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    try:
+        async with client.turn("e1", 0):  # a poll on the wire
+            tasks = [
+                asyncio.create_task(take(*turn))
+                for turn in (
+                    ("poll-a", 1, 2),
+                    ("poll-b", 2, 2),
+                    ("probe", 50, PRIORITY_URGENT),
+                    ("write-1", 90, PRIORITY_WRITE),
+                    ("write-2", 99, PRIORITY_WRITE),
+                )
+            ]
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+        # writes first (in their own deadline order), then the probe, then polls
+        assert order == ["write-1", "write-2", "probe", "poll-a", "poll-b"]
+        waits = client.wait_times()
+        assert waits["write"]["turns"] == 2
+        assert waits["poll"]["turns"] == 3
+        assert waits["poll"]["max_wait"] > waits["write"]["max_wait"] > 0
+    finally:
+        client.release("e1")
+
+
+async def test_write_turn_runs_alone_on_a_pipeline():
+    client = ModbusBlockClient.acquire("127.0.0.1", 15023, "e1", pipeline_depth=3)
+    on_wire: list[str] = []
+    seen: list[list[str]] = []
+
+    async def take(name: str, priority: int) -> None:
+        async with client.turn("e1", 0, priority):
+            on_wire.append(name)
+            seen.append(sorted(on_wire))
+            await asyncio.sleep(0.01)
+            on_wire.remove(name)
+
+    try:
+        assert client.depth == 3
+        first = [asyncio.create_task(take(f"poll-{i}", 2)) for i in range(2)]
+        await asyncio.sleep(0)
+        write = asyncio.create_task(take("write", PRIORITY_WRITE))
+        later = asyncio.create_task(take("poll-late", 2))
+        await asyncio.gather(*first, write, later)
+        # the write waited for the wire to drain and kept the late poll out
+        assert seen == [["poll-0"], ["poll-0", "poll-1"], ["write"], ["poll-late"]]
+    finally:
+        client.release("e1")
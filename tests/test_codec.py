@@ -5,13 +5,16 @@ from datetime import time
 
 import pytest
 
+from custom_components.modbus_connect import codec
 from custom_components.modbus_connect.codec import (
     CodecError,
     NotWritableError,
+    block_layout,
     decode,
+    decode_block,
     encode,
 )
-from custom_components.modbus_connect.models import EntityDef
+from custom_components.modbus_connect.models import EntityDef, Span
 
 
 def e(**kwargs) -> EntityDef:
@@ -20,6 +23,19 @@ def e(**kwargs) -> EntityDef:
     return EntityDef(**kwargs)
 
 
+@pytest.fixture(autouse=True, params=["interpreted", "compiled"])
+def codec_path(request, monkeypatch):
+    """Run every test against decode/encode and against the compiled codec."""
+    if request.param == "compiled":
+        monkeypatch.setitem(globals(), "decode", lambda d, raw: codec.compile(d).decode(raw))
+        monkeypatch.setitem(
+            globals(),
+            "encode",
+            lambda d, value, current_raw=None: codec.compile(d).encode(value, current_raw),
+        )
+    return request.param
+
+
 # --- plain integer types ---------------------------------------------------
 
 
@@ -463,3 +479,63 @@ def test_bool_payload_on_register_means_1_0():
     defn = e(platform="switch", on_value=True, off_value=False)
     assert encode(defn, True) == [1]
     assert encode(defn, False) == [0]
+
+
+@pytest.mark.parametrize(
+    "defn",
+    [
+        e(type="int16", multiplier=0.1),
+        e(type="uint32", count=2, swap="word", offset=-1),
+        e(type="int32", count=2, swap="word_byte"),
+        e(type="float32", count=2, swap="byte", multiplier=10),
+        e(type="uint16", mask=0x0FF0, value_map={1: "a", 2: "b"}),
+        e(type="uint16", flags={0: "x", 3: "y"}),
+    ],
+)
+def test_compiled_matches_decode_value_and_type(defn):
+    for raw in ([0, 0], [1, 0xFFFF], [0x4120, 0x0010], [0x7FC0, 0], [0x0010, 0x8000]):
+        expected = decode(defn, raw)
+        got = codec.compile(defn).decode(raw)
+        assert got == expected
+        assert type(got) is type(expected)
+
+
+def test_compiled_non_unique_map_fails_only_when_written():
+    compiled = codec.compile(e(type="uint16", value_map={1: "on", 2: "on"}))
+    assert compiled.decode([2]) == "on"
+    with pytest.raises(NotWritableError):
+        compiled.encode("on")
+
+
+def test_decode_block_matches_decode_per_entity():
+    defns = [
+        e(key="u16", address=10, type="uint16", multiplier=0.1),
+        e(key="i32", address=11, type="int32", count=2),
+        e(key="le", address=14, type="uint32", count=2, swap="word_byte"),
+        e(key="byte", address=16, type="int16", swap="byte", offset=5),
+        e(key="low", address=17, type="uint16", mask=0x00FF),
+        e(key="high", address=17, type="uint16", mask=0xFF00, value_map={0x12: "x"}),
+        e(key="f32", address=18, type="float32", count=2),
+        e(key="nan", address=20, type="float32", count=2),
+        e(key="ws", address=22, type="int32", count=2, swap="word"),  # one by one
+        e(key="text", address=24, type="string", count=2),  # one by one
+        e(key="past", address=25, type="uint32", count=2),  # reaches past the block
+        e(key="other", address=12, type="uint16", table="input"),
+    ]
+    words = [123, 0xFFFF, 0xFFFE, 9, 0x0102, 0x0304, 0x8001, 0x1234,
+             0x4120, 0, 0x7FC0, 0, 1, 2, 0x4142, 0x4344]  # fmt: skip
+    decoded = decode_block(words, block_layout(Span("holding", 10, 16), defns))
+    assert decoded.keys() == {"u16", "i32", "le", "byte", "low", "high", "f32", "nan"}
+    for defn in defns:
+        if defn.key in decoded:
+            raw = words[defn.address - 10 : defn.address - 10 + defn.count]
+            assert decoded[defn.key] == decode(defn, raw)
+            assert type(decoded[defn.key]) is type(decode(defn, raw))
+    assert decoded["low"] == 0x34 and decoded["high"] == "x"
+
+
+def test_decode_block_only_the_given_keys():
+    defns = [e(key="a", address=0), e(key="b", address=1)]
+    layout = block_layout(Span("holding", 0, 2), defns)
+    assert decode_block([1, 2], layout, {"b"}) == {"b": 2}
+    assert decode_block([1, 0x10000], layout) == {}  # not words: one by one
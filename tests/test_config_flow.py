@@ -24,8 +24,11 @@ from custom_components.modbus_connect.const import (
     DOMAIN,
     FRAMER_RTU,
     FRAMER_SOCKET,
+    OPTION_AUTO_TUNE,
     OPTION_ENABLED_GROUPS,
     OPTION_MIN_SCAN_INTERVAL,
+    OPTION_NATIVE_TRANSPORT,
+    OPTION_WIRE_TRACE,
 )
 
 DEVICE_YAML = """
@@ -414,7 +417,28 @@ async def test_options_flow(hass: HomeAssistant) -> None:
         result["flow_id"], {OPTION_MIN_SCAN_INTERVAL: 10}
     )
     assert result["type"] is FlowResultType.CREATE_ENTRY
-    assert entry.options == {OPTION_MIN_SCAN_INTERVAL: 10}
+    assert entry.options == {
+        OPTION_MIN_SCAN_INTERVAL: 10,
+        OPTION_AUTO_TUNE: False,
+        OPTION_NATIVE_TRANSPORT: False,
+        OPTION_WIRE_TRACE: False,
+    }
+
+
+async def test_options_flow_offers_native_transport_only_for_networks(
+    hass: HomeAssistant,
+) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_SERIAL_PORT: "/dev/ttyUSB0", CONF_SLAVE_ID: 7, CONF_FILENAME: "acme_x1.yaml"},
+        unique_id="/dev/ttyUSB0:7",
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    # serial ports always go through pymodbus; their traffic can still be traced
+    assert OPTION_NATIVE_TRANSPORT not in form_defaults(result)
+    assert form_defaults(result)[OPTION_WIRE_TRACE] is False
 
 
 async def test_options_flow_defaults_to_device_scan_interval(
@@ -462,6 +486,9 @@ async def test_options_flow_preserves_other_options(hass: HomeAssistant) -> None
     assert entry.options == {
         OPTION_ENABLED_GROUPS: ["extra"],
         OPTION_MIN_SCAN_INTERVAL: 10,
+        OPTION_AUTO_TUNE: False,
+        OPTION_NATIVE_TRANSPORT: False,
+        OPTION_WIRE_TRACE: False,
     }
 
 
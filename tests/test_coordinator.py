@@ -4,15 +4,21 @@ import asyncio
 from datetime import time as dt_time
 
 import pytest
+from homeassistant.helpers.storage import Store
 
+from custom_components.modbus_connect import codec
 from custom_components.modbus_connect.const import (
+    OPTION_AUTO_TUNE,
     OPTION_ENABLED_GROUPS,
     OPTION_SHOW_ALL,
+    WRITE_COALESCE_SECONDS,
 )
 from custom_components.modbus_connect.coordinator import (
+    ModbusConnectCoordinator,
     is_group_visible,
     resolve_enabled_groups,
     resolve_show_all,
+    template_reads,
 )
 from custom_components.modbus_connect.models import (
     EntityDef,
@@ -34,6 +40,8 @@ async def test_adjacent_entities_one_read(hass, monkeypatch):
     assert coordinator.last_update_success
     assert client.reads == [Span("holding", 0, 3)]
     assert coordinator.data == {"a": 100, "b": 200, "c": 300}
+    # the bus is claimed per transaction: the connection check, then the block
+    assert client.turns == [coordinator.entry_id] * 2
 
 
 async def test_device_info_shows_connection(hass, monkeypatch):
@@ -63,6 +71,267 @@ async def test_scan_interval_buckets(hass, monkeypatch):
     assert coordinator.data["slow"] == 2  # kept from previous cycle
 
 
+async def test_covered_slow_entity_rides_along(hass, monkeypatch):
+    faketime = FakeTime()
+    client = FakeClient({0: 1, 3: 2})
+    device = make_device(sensor("fast", 0), sensor("slow", 3, scan_interval=300))
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, faketime)
+    await coordinator.async_refresh()  # both due: one bridged block 0..3
+
+    client.values[("holding", 3)] = 5
+    faketime.now += 60  # only "fast" is due, but its block bridges over "slow"
+    await coordinator.async_refresh()
+    assert client.reads[-1] == Span("holding", 0, 1)  # the plan for "fast" alone...
+    assert coordinator.data["slow"] == 2  # ...does not grow to "slow" (read_ahead does)
+
+    # a fast entity whose own block spans the slow register carries it for free
+    client = FakeClient({0: 1, 3: 2, 4: 3, 100: 4})
+    device = make_device(
+        sensor("tick", 100, scan_interval=10),
+        sensor("fast", 0, type="uint32", count=2),
+        sensor("fast2", 4),
+        sensor("slow", 3, scan_interval=300),
+    )
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, faketime)
+    await coordinator.async_refresh()
+    faketime.now += 10
+    await coordinator.async_refresh()  # "slow" moves onto its phase, between fast ticks
+    slow_due = coordinator._next_due["slow"]
+    client.reads.clear()
+    client.values[("holding", 3)] = 9
+    faketime.now += 20
+    await coordinator.async_refresh()
+    assert client.reads == [Span("holding", 0, 5), Span("holding", 100, 1)]
+    assert coordinator.data["slow"] == 9
+    assert coordinator.last_piggybacked_count == 1
+    # its next slot a whole interval away, on the same phase
+    assert coordinator._next_due["slow"] == slow_due + 300
+    while faketime.now < slow_due:  # the old slot falls between fast ticks
+        faketime.now += 10
+        await coordinator.async_refresh()
+    assert Span("holding", 3, 1) not in client.reads  # never a read of its own
+
+
+async def test_only_entities_over_changed_words_are_decoded(hass, monkeypatch):
+    faketime = FakeTime()
+    client = FakeClient({0: 1, 1: 2, 2: 0, 3: 7})
+    device = make_device(
+        sensor("a", 0), sensor("b", 1), sensor("wide", 2, type="uint32", count=2)
+    )
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, faketime)
+    await coordinator.async_refresh()
+    assert coordinator.last_decoded_count == 3
+
+    faketime.now += 60
+    await coordinator.async_refresh()  # same words: every value is reused
+    assert coordinator.last_polled_count == 3
+    assert coordinator.last_decoded_count == 0
+    assert coordinator.data == {"a": 1, "b": 2, "wide": 7}
+
+    client.values[("holding", 3)] = 8  # the low word of "wide" moves
+    faketime.now += 60
+    await coordinator.async_refresh()
+    assert coordinator.last_decoded_count == 1
+    assert coordinator.data["wide"] == 8
+
+    client.fail_addresses = {1}  # a failed read forgets the word...
+    faketime.now += 60
+    await coordinator.async_refresh()
+    assert coordinator.data["b"] is None
+    client.fail_addresses = set()
+    faketime.now += 60
+    await coordinator.async_refresh()  # ...so the same word decodes again
+    assert coordinator.last_decoded_count == 1
+    assert coordinator.data == {"a": 1, "b": 2, "wide": 8}
+
+
+async def test_changed_blocks_decode_their_numbers_in_bulk(hass, monkeypatch):
+    faketime = FakeTime()
+    client = FakeClient({0: 10, 1: 20, 2: 0, 3: 5, 4: 0x4142})
+    device = make_device(
+        sensor("a", 0, multiplier=0.5),
+        sensor("b", 1),
+        sensor("wide", 2, type="int32", count=2),
+        sensor("text", 4, type="string"),
+    )
+    bulk = []
+
+    def decode_block(words, layout, keys=None):
+        decoded = real(words, layout, keys)
+        bulk.append(set(decoded))
+        return decoded
+
+    real = codec.decode_block
+    monkeypatch.setattr(codec, "decode_block", decode_block)
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, faketime)
+    await coordinator.async_refresh()
+    assert bulk == [{"a", "b", "wide"}]  # the string decodes on its own
+    assert coordinator.last_decoded_count == 4
+    assert coordinator.data == {"a": 5, "b": 20, "wide": 5, "text": "AB"}
+
+    client.values[("holding", 1)] = 21  # one value moved: decoded on use
+    faketime.now += 60
+    await coordinator.async_refresh()
+    assert len(bulk) == 1
+    assert coordinator.data["b"] == 21
+
+
+async def test_rider_skipped_when_its_block_fails(hass, monkeypatch):
+    faketime = FakeTime()
+    client = FakeClient({0: 1, 2: 2, 4: 3})
+    device = make_device(
+        sensor("a", 0), sensor("b", 4), sensor("slow", 2, scan_interval=300)
+    )
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, faketime)
+    await coordinator.async_refresh()
+    slow_due = coordinator._next_due["slow"]
+
+    client.fail_spans = {Span("holding", 0, 5)}  # the bridged block fails once
+    faketime.now += 60
+    await coordinator.async_refresh()
+    # only the due spans are retried; the rider keeps its value and its schedule
+    assert client.reads[-2:] == [Span("holding", 0, 1), Span("holding", 4, 1)]
+    assert coordinator.data["slow"] == 2
+    assert coordinator._next_due["slow"] == slow_due
+    assert "slow" not in coordinator._fail_streak
+
+
+async def test_read_ahead_pulls_in_soon_due_entities_that_fit(hass, monkeypatch):
+    faketime = FakeTime()
+    client = FakeClient({0: 1, 5: 2, 40: 3})
+    device = make_device(
+        sensor("fast", 0, scan_interval=10),
+        sensor("soon", 5, scan_interval=15),  # due 5 s after "fast"
+        sensor("far", 40, scan_interval=15),  # soon as well, but needs its own read
+        read_ahead=10,
+    )
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, faketime)
+    await coordinator.async_refresh()
+
+    client.reads.clear()
+    faketime.now += 10
+    await coordinator.async_refresh()
+    assert client.reads == [Span("holding", 0, 6)]  # grown, not an extra request
+    assert coordinator.last_polled_count == 2
+    # read ahead of its slot: on to the next one, keeping its phase
+    assert coordinator._next_due["soon"] == faketime.now + 5 + 15
+    assert coordinator._next_due["far"] == faketime.now + 5  # unchanged
+
+
+async def test_cadence_classes_run_on_staggered_phases(hass, monkeypatch):
+    faketime = FakeTime()
+    client = FakeClient({0: 1, 100: 2, 200: 3})
+    device = make_device(
+        sensor("fast", 0, scan_interval=10),
+        sensor("mid", 100, scan_interval=30),
+        sensor("slow", 200, scan_interval=60),
+    )
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, faketime)
+    # in phase, the 60 s class would land on the ticks the 30 s class already
+    # loads; one tick later it shares them with the fast class alone
+    assert coordinator.predicted_reads_per_tick == {1: 3, 2: 3}
+    await coordinator.async_refresh()  # the first refresh reads everything
+
+    client.reads.clear()
+    faketime.now += 10
+    await coordinator.async_refresh()
+    assert client.reads == [Span("holding", 0, 1), Span("holding", 200, 1)]
+    assert coordinator._next_due["slow"] == faketime.now + 60  # plain cadence from here
+
+    client.reads.clear()
+    faketime.now += 20
+    await coordinator.async_refresh()
+    assert client.reads == [Span("holding", 0, 1), Span("holding", 100, 1)]
+
+
+async def test_auto_tune_grows_max_read_and_falls_back(hass, hass_storage, monkeypatch):
+    saves = []  # the delayed write would land a minute later: take its data from here
+    monkeypatch.setattr(
+        Store, "async_delay_save", lambda store, func, delay=0: saves.append((store.key, func))
+    )
+    faketime = FakeTime()
+    client = FakeClient({a: a for a in range(20)})
+    device = make_device(*(sensor(f"r{a}", a) for a in range(20)), max_read=8)
+    coordinator = await make_coordinator(
+        hass, device, client, monkeypatch, faketime, options={OPTION_AUTO_TUNE: True}
+    )
+    await coordinator.async_restore_read_limits()  # nothing stored yet
+    await coordinator.async_refresh()
+    assert client.reads == [Span("holding", 0, 8), Span("holding", 8, 8), Span("holding", 16, 4)]
+    assert coordinator.max_read == 16  # the plan splits at the cap: try twice the size
+
+    # the device refuses the larger read: the fallback reads with the last good limit
+    client.fail_spans = {Span("holding", 0, 16)}
+    client.illegal = True
+    client.reads.clear()
+    faketime.now += 30
+    await coordinator.async_refresh()
+    assert client.reads == [
+        Span("holding", 0, 16),
+        Span("holding", 0, 8),
+        Span("holding", 8, 8),
+        Span("holding", 16, 4),
+    ]
+    assert coordinator.data["r12"] == 12
+    assert coordinator.max_read == 8
+    assert coordinator.tuner.read_ceiling == 15
+
+    client.reads.clear()
+    faketime.now += 30
+    await coordinator.async_refresh()  # next trial stays below the refused size
+    assert coordinator.max_read == 15
+    faketime.now += 30
+    await coordinator.async_refresh()
+    assert client.reads[-2:] == [Span("holding", 0, 15), Span("holding", 15, 5)]
+    assert coordinator.tuner.good_read == 15
+
+    key, data_func = saves[-1]
+    assert key == f"modbus_connect.{coordinator.entry_id}.read_limits"
+    assert data_func() == {
+        "filename": "test.yaml",
+        "limits": {"max_read": 15, "max_gap": 8, "read_ceiling": 15, "gap_ceiling": 125},
+    }
+
+    # a reload resumes from the stored limits
+    hass_storage[key] = {"version": 1, "minor_version": 1, "key": key, "data": data_func()}
+    coordinator = ModbusConnectCoordinator(hass, coordinator.config_entry, client, device)
+    await coordinator.async_restore_read_limits()
+    assert (coordinator.max_read, coordinator.max_gap) == (15, 8)
+
+
+async def test_failed_read_limit_trial_learns_no_holes(hass, monkeypatch):
+    monkeypatch.setattr(Store, "async_delay_save", lambda store, func, delay=0: None)
+    faketime = FakeTime()
+    client = FakeClient({a: a for a in (*range(6), 8)})
+    device = make_device(*(sensor(f"r{a}", a) for a in (*range(6), 8)), max_read=6, max_gap=2)
+    coordinator = await make_coordinator(
+        hass, device, client, monkeypatch, faketime, options={OPTION_AUTO_TUNE: True}
+    )
+    await coordinator.async_refresh()
+    assert client.reads == [Span("holding", 0, 6), Span("holding", 8, 1)]
+    assert coordinator.max_read == 12
+
+    # the trial bridges 6..7 and is refused for its size; the unbridged reads pass
+    client.fail_spans = {Span("holding", 0, 9)}
+    client.reads.clear()
+    faketime.now += 30
+    await coordinator.async_refresh()
+    assert client.reads == [Span("holding", 0, 9), Span("holding", 0, 6), Span("holding", 8, 1)]
+    assert coordinator.holes == set()  # the filler was fine: only the size failed
+    assert (coordinator.max_read, coordinator.tuner.read_ceiling) == (6, 8)
+
+
+async def test_auto_tune_is_opt_in(hass, monkeypatch):
+    client = FakeClient({a: a for a in range(20)})
+    device = make_device(*(sensor(f"r{a}", a) for a in range(20)), max_read=8)
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, FakeTime())
+    await coordinator.async_restore_read_limits()
+    await coordinator.async_refresh()
+    assert coordinator.tuner is None
+    assert coordinator.max_read == 8
+    assert len(client.reads) == 3
+
+
 async def test_last_read_count_reports_block_merge(hass, monkeypatch):
     # three adjacent registers merge into a single block -> one read covers three entities
     client = FakeClient({0: 1, 1: 2, 2: 3})
@@ -86,6 +355,22 @@ async def test_last_read_count_counts_separate_blocks(hass, monkeypatch):
     assert len(client.reads) == 2
 
 
+async def test_pipelined_blocks_read_concurrently(hass, monkeypatch):
+    # on a pipelining gateway every block is started at once, and a failed
+    # block still falls back on its own without touching its neighbours
+    client = FakeClient({0: 1, 100: 2, 200: 3})
+    client.depth = 3
+    client.fail_spans = {Span("holding", 100, 1)}
+    device = make_device(sensor("a", 0), sensor("b", 100), sensor("c", 200), max_gap=8)
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, FakeTime())
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert (coordinator.data["a"], coordinator.data["c"]) == (1, 3)
+    assert coordinator.data["b"] is None
+    assert coordinator.last_read_count == 3
+    assert client.turns == [coordinator.entry_id] * 4
+
+
 async def test_last_polled_count_tracks_due_subset(hass, monkeypatch):
     # when only the fast entity is due, both counts drop to that subset
     faketime = FakeTime()
@@ -119,7 +404,11 @@ async def test_read_count_sensor_reports_stable_full_refresh(hass, monkeypatch):
 
     entity = ModbusConnectReadCountSensor(coordinator)
     assert entity.native_value == 2  # full refresh: a+b in one block, slow in another
-    assert entity.extra_state_attributes == {"read_entities": 3}
+    # two blocks of 2 and 1 registers at the default 40 ms + 2 ms/register
+    assert entity.extra_state_attributes == {
+        "read_entities": 3,
+        "estimated_cycle_time": 0.086,
+    }
     assert entity.entity_category == EntityCategory.DIAGNOSTIC
     assert entity.unique_id.endswith("_reads_per_refresh")
     # diagnostic gauge -> no long-term statistics
@@ -422,6 +711,40 @@ async def test_bridged_hole_learned(hass, monkeypatch):
     assert client.reads == [Span("holding", 0, 2), Span("holding", 6, 2)]
 
 
+async def test_read_plan_memoized_per_due_set(hass, monkeypatch):
+    from custom_components.modbus_connect import coordinator as coordinator_module
+
+    calls: list[set[Span]] = []
+    real_plan_blocks = coordinator_module.plan_blocks
+
+    def counting_plan_blocks(spans, **kwargs):
+        calls.append(set(spans))
+        return real_plan_blocks(spans, **kwargs)
+
+    monkeypatch.setattr(coordinator_module, "plan_blocks", counting_plan_blocks)
+    faketime = FakeTime()
+    client = FakeClient({0: 1, 50: 2})
+    device = make_device(sensor("fast", 0), sensor("slow", 50, scan_interval=300))
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, faketime)
+    # staggering plans each cadence class once, into the same memo
+    assert calls == [{Span("holding", 0, 1)}, {Span("holding", 50, 1)}]
+
+    await coordinator.async_refresh()  # both due: the full plan
+    for _ in range(3):
+        faketime.now += 60  # only "fast" due: planned already
+        await coordinator.async_refresh()
+    assert coordinator.full_refresh_read_count == 2  # reuses the all-due plan
+    assert calls[2:] == [{Span("holding", 0, 1), Span("holding", 50, 1)}]
+    assert coordinator.predicted_reads_per_tick  # every due set is memoized by now
+    assert len(calls) == 3
+
+    # learning a hole is the one runtime change to the planner's inputs
+    coordinator._learn_holes([Span("holding", 20, 1)])
+    faketime.now += 60
+    await coordinator.async_refresh()
+    assert len(calls) == 4
+
+
 async def test_partial_failure_keeps_other_entities(hass, monkeypatch):
     client = FakeClient({0: 7})
     client.fail_addresses = {50}
@@ -510,7 +833,7 @@ async def test_confirm_delay_waits_before_readback(hass, monkeypatch):
         ha={"native_min_value": 0, "native_max_value": 50},
     )
     coordinator = await make_coordinator(
-        hass, make_device(defn), client, monkeypatch, FakeTime()
+        hass, make_device(defn, confirm_holds_bus=True), client, monkeypatch, FakeTime()
     )
     await coordinator.async_refresh()
 
@@ -528,6 +851,62 @@ async def test_confirm_delay_waits_before_readback(hass, monkeypatch):
     assert coordinator.data["setpoint"] == pytest.approx(21.5)
 
 
+async def test_deferred_confirm_frees_the_bus_and_corrects_state(hass, monkeypatch):
+    # without confirm_holds_bus the write shows optimistically, releases the
+    # bus, and is read back once its confirm_delay has passed
+    client = FakeClient({0: 150, 10: 1})
+    defn = EntityDef(
+        key="setpoint", platform="number", address=0, multiplier=0.1, confirm_delay=2,
+        ha={"native_min_value": 0, "native_max_value": 50},
+    )
+    coordinator = await make_coordinator(
+        hass, make_device(defn, sensor("other", 10)), client, monkeypatch, FakeTime()
+    )
+    await coordinator.async_refresh()
+    client.reads.clear()
+
+    delay = asyncio.Event()
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds: float) -> None:
+        if seconds == 2:
+            await delay.wait()
+        else:
+            await real_sleep(seconds)
+
+    monkeypatch.setattr(
+        "custom_components.modbus_connect.coordinator.asyncio.sleep", fake_sleep
+    )
+    await coordinator.async_write(defn, 21.5)
+    assert client.written == [(0, [215])]
+    assert client.reads == []  # not yet read back
+    assert coordinator.data["setpoint"] == pytest.approx(21.5)  # optimistic
+
+    # the bus is free meanwhile; a poll of the register keeps the written value
+    client.values[("holding", 0)] = 150  # the device has not applied it yet
+    coordinator._next_due = dict.fromkeys(coordinator._next_due, 0.0)
+    await coordinator.async_refresh()
+    assert coordinator.data["setpoint"] == pytest.approx(21.5)
+
+    client.values[("holding", 0)] = 200  # the device clamped the value
+    client.reads.clear()
+    delay.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert client.reads == [Span("holding", 0, 1)]
+    assert coordinator.data["setpoint"] == pytest.approx(20.0)  # corrected
+
+    # a read-back agreeing with the optimistic state notifies no one
+    delay.clear()
+    await coordinator.async_write(defn, 25.0)
+    updates: list[int] = []
+    coordinator.async_add_listener(lambda: updates.append(1))
+    delay.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert client.reads[-1] == Span("holding", 0, 1)
+    assert coordinator.data["setpoint"] == 25.0
+    assert updates == []
+
+
 async def test_masked_write_read_modify_write(hass, monkeypatch):
     client = FakeClient({0: 0x0A5F})
     defn = EntityDef(
@@ -546,6 +925,218 @@ async def test_masked_write_read_modify_write(hass, monkeypatch):
     assert client.written == [(0, [0x0A3F])]  # other bits preserved
 
 
+async def test_concurrent_writes_coalesce_into_one_fc16(hass, monkeypatch):
+    # a climate action setting three adjacent setpoints in the same tick: one
+    # FC16 write, one read-back, one data update
+    client = FakeClient({10: 0, 11: 0, 12: 0, 20: 0})
+    number = {"native_min_value": 0, "native_max_value": 100}
+    low = EntityDef(key="low", platform="number", address=10, ha=number)
+    high = EntityDef(key="high", platform="number", address=11, ha=number, confirm_delay=0.2)
+    mode = EntityDef(key="mode", platform="number", address=12, ha=number, confirm_delay=0.5)
+    other = EntityDef(key="other", platform="number", address=20, ha=number)
+    coordinator = await make_coordinator(
+        hass,
+        make_device(low, high, mode, other, confirm_holds_bus=True),
+        client,
+        monkeypatch,
+        FakeTime(),
+    )
+    await coordinator.async_refresh()
+    client.reads.clear()
+    updates: list[dict] = []
+    coordinator.async_add_listener(lambda: updates.append(dict(coordinator.data)))
+
+    sleeps: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(
+        "custom_components.modbus_connect.coordinator.asyncio.sleep", fake_sleep
+    )
+    await asyncio.gather(
+        coordinator.async_write(high, 22),
+        coordinator.async_write(low, 18),
+        coordinator.async_write(mode, 3),
+        coordinator.async_write(other, 7),  # not contiguous: its own write
+    )
+    assert client.written == [(10, [18, 22, 3]), (20, [7])]
+    assert client.write_turns == 1
+    assert sleeps == [0.5]  # the longest confirm_delay, once
+    assert client.reads == [Span("holding", 10, 11)]  # one block confirms all four
+    assert len(updates) == 1
+    assert {k: coordinator.data[k] for k in ("low", "high", "mode", "other")} == {
+        "low": 18, "high": 22, "mode": 3, "other": 7
+    }
+
+
+async def test_coalesced_masked_write_builds_on_the_batch(hass, monkeypatch):
+    # two read-modify-write nibbles of one register and a write_multiple
+    # neighbour: the second nibble starts from the first, nothing is lost, and
+    # a lone register still goes FC6 unless its entity asks for FC16
+    client = FakeClient({0: 0x0A5F, 1: 0, 5: 0})
+    number = {"native_min_value": 0, "native_max_value": 15}
+    low = EntityDef(
+        key="low", platform="number", address=0, mask=0x000F, read_modify_write=True, ha=number
+    )
+    mid = EntityDef(
+        key="mid", platform="number", address=0, mask=0x00F0, read_modify_write=True, ha=number
+    )
+    forced = EntityDef(key="forced", platform="number", address=1, write_multiple=True, ha=number)
+    single = EntityDef(key="single", platform="number", address=5, ha=number)
+    coordinator = await make_coordinator(
+        hass, make_device(low, mid, forced, single), client, monkeypatch, FakeTime()
+    )
+    await coordinator.async_refresh()
+    client.reads.clear()
+
+    await asyncio.gather(
+        coordinator.async_write(low, 1),
+        coordinator.async_write(mid, 3),
+        coordinator.async_write(forced, 9),
+        coordinator.async_write(single, 4),
+    )
+    assert client.written == [(0, [0x0A31, 9]), (5, [4])]
+    assert client.write_multiple_flags == [True, False]
+    assert client.reads[0] == Span("holding", 0, 1)  # the one read-modify-write read
+    assert coordinator.data["low"] == 1
+    assert coordinator.data["mid"] == 3
+
+
+async def test_rapid_writes_to_one_entity_collapse_to_the_latest(hass, monkeypatch):
+    # a dragged slider: every step queues a write, only the last one hits the wire
+    client = FakeClient({0: 0})
+    defn = EntityDef(
+        key="level", platform="number", address=0,
+        ha={"native_min_value": 0, "native_max_value": 100},
+    )
+    coordinator = await make_coordinator(
+        hass, make_device(defn), client, monkeypatch, FakeTime()
+    )
+    await coordinator.async_refresh()
+
+    await asyncio.gather(
+        *(coordinator.async_write(defn, step, latest_wins=True) for step in range(1, 11))
+    )
+    assert client.written == [(0, [10])]
+    assert coordinator.data["level"] == 10
+    assert coordinator.write_queue == {
+        "pending": 0, "max_pending": 1, "collapsed": 9, "unchanged": 0, "rmw_cache_hits": 0
+    }
+
+
+async def test_write_of_the_cached_value_is_skipped(hass, monkeypatch):
+    # a setting the register already holds is not written again
+    client = FakeClient({0: 5, 1: 0x00A0})
+    plain = EntityDef(
+        key="plain", platform="number", address=0,
+        ha={"native_min_value": 0, "native_max_value": 100},
+    )
+    nibble = EntityDef(
+        key="nibble", platform="number", address=1, mask=0x00F0, read_modify_write=True,
+        ha={"native_min_value": 0, "native_max_value": 15},
+    )
+    faketime = FakeTime()
+    coordinator = await make_coordinator(
+        hass, make_device(plain, nibble), client, monkeypatch, faketime
+    )
+    await coordinator.async_refresh()
+
+    await coordinator.async_write(plain, 5, latest_wins=True)
+    await coordinator.async_write(nibble, 10, latest_wins=True)  # masked bits hold 10
+    assert client.written == []
+    assert coordinator.write_queue["unchanged"] == 2
+    await coordinator.async_write(plain, 6, latest_wins=True)
+    assert client.written == [(0, [6])]
+    await coordinator.async_write(plain, 6)  # a command goes out regardless
+    assert client.written == [(0, [6]), (0, [6])]
+
+    faketime.now += 31  # older than the 30 s scan interval: the device may differ
+    await coordinator.async_write(plain, 6, latest_wins=True)
+    assert client.written == [(0, [6]), (0, [6]), (0, [6])]
+    assert coordinator.write_queue["unchanged"] == 2
+
+
+async def test_coalesced_write_error_fails_only_its_own_caller(hass, monkeypatch):
+    from homeassistant.exceptions import HomeAssistantError
+
+    client = FakeClient({0: 0, 1: 0})
+    bad = EntityDef(
+        key="bad", platform="select", address=0, value_map={0: "Off", 1: "On"}, ha={}
+    )
+    good = EntityDef(
+        key="good", platform="number", address=1, ha={"native_min_value": 0, "native_max_value": 9}
+    )
+    coordinator = await make_coordinator(
+        hass, make_device(bad, good), client, monkeypatch, FakeTime()
+    )
+    await coordinator.async_refresh()
+
+    results = await asyncio.gather(
+        coordinator.async_write(bad, "Bogus"),  # not in the map
+        coordinator.async_write(good, 5),
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], HomeAssistantError)
+    assert results[1] is None
+    assert client.written == [(1, [5])]
+    assert coordinator.data["good"] == 5
+
+
+async def test_shutdown_fails_queued_writes(hass, monkeypatch):
+    from homeassistant.exceptions import HomeAssistantError
+
+    client = FakeClient({1: 0})
+    number = EntityDef(
+        key="n", platform="number", address=1, ha={"native_min_value": 0, "native_max_value": 9}
+    )
+    coordinator = await make_coordinator(
+        hass, make_device(number), client, monkeypatch, FakeTime()
+    )
+    await coordinator.async_refresh()
+
+    write = asyncio.ensure_future(coordinator.async_write(number, 5))
+    await asyncio.sleep(0)  # queued, its coalescing window still open
+    await coordinator.async_shutdown()
+    with pytest.raises(HomeAssistantError, match="unloading"):
+        await write
+    await asyncio.sleep(2 * WRITE_COALESCE_SECONDS)  # no batch starts afterwards
+    assert client.written == []
+
+
+async def test_masked_writes_reuse_a_fresh_cached_word(hass, monkeypatch):
+    # two nibbles of one control register, toggled one after the other: with
+    # rmw_max_age the polled word is reused and updated by each write
+    ft = FakeTime()
+    client = FakeClient({0: 0x0A5F})
+    number = {"native_min_value": 0, "native_max_value": 15}
+    low = EntityDef(
+        key="low", platform="number", address=0, mask=0x000F, read_modify_write=True, ha=number
+    )
+    high = EntityDef(
+        key="high", platform="number", address=0, mask=0x0F00, read_modify_write=True, ha=number
+    )
+    coordinator = await make_coordinator(
+        hass, make_device(low, high, rmw_max_age=2), client, monkeypatch, ft
+    )
+    await coordinator.async_refresh()
+    client.reads.clear()
+
+    await coordinator.async_write(low, 1)
+    await coordinator.async_write(high, 3)
+    assert client.written == [(0, [0x0A51]), (0, [0x0351])]  # each built on the last
+    assert client.reads == [Span("holding", 0, 1)] * 2  # the read-backs only
+    assert coordinator.write_queue["rmw_cache_hits"] == 2
+
+    ft.now += 3  # the word is stale now: read it first
+    client.reads.clear()
+    await coordinator.async_write(low, 2)
+    assert client.reads == [Span("holding", 0, 1)] * 2
+    assert client.written[-1] == (0, [0x0352])
+
+
 async def test_read_register_reads_linked_value_and_writes_own(hass, monkeypatch):
     # 'charge_current' is shown from reg 144 (via a readback entity) but written to reg 36
     client = FakeClient({144: 250, 36: 0})
@@ -621,6 +1212,79 @@ async def test_read_register_expression_renders_via_jinja(hass, monkeypatch):
     assert coordinator.data["charge_current"] == pytest.approx(25.0)
 
 
+async def test_links_and_templates_render_only_downstream_of_changes(hass, monkeypatch):
+    ft = FakeTime()
+    client = FakeClient({0: 1, 1: 2})
+    device = make_device(
+        sensor("a", 0),
+        sensor("b", 1),
+        # defined before the link it reads: renders after it all the same
+        EntityDef(key="double", platform="sensor", address=10, read_register="{{ total * 2 }}"),
+        EntityDef(key="total", platform="sensor", address=11, read_register="{{ a + b }}"),
+        EntityDef(key="b_copy", platform="sensor", address=12, read_register="{{ b }}"),
+        templates=(
+            TemplateDef(key="from_double", platform="sensor", config={"state": "{{ double }}"}),
+            TemplateDef(key="from_b", platform="sensor", config={"state": "{{ b }}"}),
+            TemplateDef(key="clock", platform="sensor", config={"state": "{{ now() }}"}),
+        ),
+    )
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, ft)
+    rendered = []
+    render_link = coordinator._render_link
+
+    def spy(defn, data):
+        rendered.append(defn.key)
+        return render_link(defn, data)
+
+    monkeypatch.setattr(coordinator, "_render_link", spy)
+    await coordinator.async_refresh()
+    assert rendered.index("total") < rendered.index("double")
+    assert coordinator.data["double"] == 6
+    assert all(coordinator.affects(t) for t in ("from_double", "from_b", "clock"))
+
+    rendered.clear()
+    client.values[("holding", 0)] = 5
+    ft.now += 60
+    await coordinator.async_refresh()
+    assert rendered == ["total", "double"]  # b_copy reads nothing that changed
+    assert coordinator.data["double"] == 14
+    assert coordinator.affects("from_double") and coordinator.affects("clock")
+    assert not coordinator.affects("from_b")
+
+    rendered.clear()
+    ft.now += 60
+    await coordinator.async_refresh()
+    assert rendered == []
+    coordinator.async_set_updated_data({**coordinator.data})  # e.g. a confirmed write
+    assert coordinator.affects("from_b")
+
+
+@pytest.mark.parametrize(
+    ("state", "volatile"),
+    [
+        ("{{ (a * 2) | round(1) if a is number else values['a'] }}", False),
+        ("{% set x = key('a') %}{% for i in range(x) %}{{ loop.index }}{% endfor %}", False),
+        ("{{ now() - a }}", True),
+        ("{{ a | relative_time }}", True),
+        ("{{ time_until(a) }}", True),
+        ("{{ device_attr('x', 'name') ~ a }}", True),
+        ("{{ area_name('kitchen') ~ a }}", True),
+        ("{{ closest(states.zone) ~ a }}", True),
+        ("{{ a is is_state('on') }}", True),
+        ("{{ some_future_helper(a) }}", True),  # unknown: assume it reads the world
+        ("{{ a", True),
+    ],
+)
+def test_templates_using_more_than_the_device_values_are_volatile(state, volatile):
+    device = make_device(
+        sensor("a", 0),
+        templates=(TemplateDef(key="t", platform="sensor", config={"state": state}),),
+    )
+    reads, volatiles = template_reads(device)
+    assert reads["t"] == {"a"}
+    assert ("t" in volatiles) == volatile
+
+
 async def test_static_value_entity_never_reads_and_writes_fc16(hass, monkeypatch):
     # a write-only command register: shown from static_value, never read, written via FC16
     client = FakeClient({})
@@ -831,6 +1495,25 @@ async def test_all_reads_fail_raises(hass, monkeypatch):
     assert not coordinator.last_update_success
 
 
+async def test_open_circuit_skips_fallback_and_learning(hass, monkeypatch):
+    client = FakeClient({0: 1, 6: 2})
+    device = make_device(sensor("a", 0), sensor("b", 6))
+    coordinator = await make_coordinator(hass, device, client, monkeypatch, FakeTime())
+    await coordinator.async_refresh()
+    client.reads.clear()
+
+    client.circuit_open = True  # the device went silent; its breaker fails reads locally
+    coordinator._next_due = dict.fromkeys(coordinator._next_due, 0.0)
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    # no unbridged retries of a read that never reached the device
+    assert client.reads == [Span("holding", 0, 7)]
+    assert coordinator.last_read_count == 0
+    assert coordinator.holes == set()
+    assert coordinator.failed_reads_by_key == {}
+    assert coordinator.consecutive_failures == 1
+
+
 async def test_partial_fallback_learns_no_holes(hass, monkeypatch):
     client = FakeClient({0: 1, 6: 2})
     client.fail_addresses = {6}  # a real entity address fails, not a bridge
@@ -889,7 +1572,7 @@ async def test_failed_chunk_of_wide_span_does_not_mix_generations(hass, monkeypa
     await coordinator.async_refresh()
     assert coordinator.data["serial"] == "AAAAAAAAAAAA"
 
-    client.values = dict.fromkeys((("holding", a) for a in range(100, 106)), 16962)  # now "BB" x 6
+    client.values.store(Span("holding", 100, 6), [16962] * 6)  # now "BB" x 6
     client.fail_addresses = {104}  # second chunk fails this cycle
     ft.now += 60
     await coordinator.async_refresh()
@@ -1021,7 +1704,7 @@ async def test_write_between_blocks_not_clobbered_by_refresh(hass, monkeypatch):
     write = hass.async_create_task(
         coordinator.async_write(coordinator.entity_defs["setpoint"], 5)
     )
-    await asyncio.sleep(0)  # the write queues on the client lock
+    await asyncio.sleep(2 * WRITE_COALESCE_SECONDS)  # the write queues for a bus turn
     gate.set()  # block 1 completes; the write slots in before block 2
     await write
     await refresh
@@ -1132,6 +1815,35 @@ async def test_read_health_entities(hass, monkeypatch):
     assert counter.native_value == 1
 
 
+async def test_transaction_metric_sensors(hass, monkeypatch):
+    from custom_components.modbus_connect.sensor import (
+        ModbusConnectBusWaitSensor,
+        ModbusConnectRequestLatencySensor,
+    )
+
+    ft = FakeTime()
+    client = FakeClient({0: 1})
+    coordinator = await make_coordinator(
+        hass, make_device(sensor("a", 0)), client, monkeypatch, ft
+    )
+    latency = ModbusConnectRequestLatencySensor(coordinator)
+    wait = ModbusConnectBusWaitSensor(coordinator)
+    assert latency.entity_registry_enabled_default is False
+    assert latency.native_value is None  # nothing measured yet
+    assert wait.native_value is None
+
+    device_id = coordinator.device_id
+    client.metrics.record(3, device_id, 0.04, ft.now, sent=12, received=9)
+    client.metrics.record(3, device_id, 0.06, ft.now, sent=12, received=9)
+    client.metrics.record(
+        3, device_id, 2.0, ft.now, sent=12, received=0, outcome="timeout"
+    )
+    client.metrics.record(3, 99, 1.0, ft.now, sent=12, received=9)  # another device
+    assert latency.native_value == pytest.approx(50.0)
+    assert latency.extra_state_attributes["timeouts"] == 1
+    assert latency.extra_state_attributes["answers"] == 2
+
+
 # --- register quarantine ------------------------------------------------------
 
 
@@ -18,6 +18,7 @@ import yaml
 
 from custom_components.modbus_connect import codec
 from custom_components.modbus_connect.client import (
+    PRIORITY_WRITE,
     ModbusBlockClient,
     ReadError,
     WriteError,
@@ -40,6 +41,8 @@ NO_FC16_ZONE = 65000  # refuses multi-register writes (FC16); singles work
 ERROR_ZONE = 65280  # answers every request with ILLEGAL DATA ADDRESS
 GATEWAY_ZONE = 65500  # answers GATEWAY TARGET FAILED TO RESPOND (code 11)
 
+PIPELINE_LATENCY = 0.2  # seconds the pipelining server takes per read (at most)
+
 
 @pytest.fixture
 async def modbus_server(socket_enabled: None):
@@ -108,7 +111,7 @@ async def test_sdm630_polls_in_few_transactions(modbus_server):
         # 1) With the device's own (conservative, converted) read limits.
         blocks = plan_blocks(spans, max_read=device.max_read, max_gap=device.max_gap)
         cache: dict[tuple[str, int], int] = {}
-        async with client.lock:
+        async with client.turn("e2e-test", 0):
             for block in blocks:
                 values = await client.read_block(1, block)
                 for i, addr in enumerate(range(block.start, block.end)):
@@ -125,7 +128,7 @@ async def test_sdm630_polls_in_few_transactions(modbus_server):
         # 2) With max_register_read: 100 as a user would configure it.
         requests.clear()
         blocks_100 = plan_blocks(spans, max_read=100, max_gap=8)
-        async with client.lock:
+        async with client.turn("e2e-test", 0):
             for block in blocks_100:
                 await client.read_block(1, block)
 
@@ -150,10 +153,11 @@ def _crc16(data: bytes) -> bytes:
 
 @pytest.fixture
 async def rtu_server(socket_enabled: None):
-    """A zero-filled RTU-over-TCP server: raw RTU frames (CRC16, no MBAP).
+    """An RTU-over-TCP server: raw RTU frames (CRC16, no MBAP).
 
     Understands only the fixed-size read requests (FC3/FC4) — enough to prove
-    the client really frames RTU when asked to.
+    the client really frames RTU when asked to. Registers hold their own
+    addresses, so a mis-decoded payload shows.
     """
     requests: list[tuple[int, int, int]] = []
 
@@ -165,7 +169,7 @@ async def rtu_server(socket_enabled: None):
                     continue
                 uid, fc, addr, count = struct.unpack(">BBHH", frame[:6])
                 requests.append((fc, addr, count))
-                body = bytes([uid, fc, count * 2]) + bytes(count * 2)
+                body = struct.pack(f">BBB{count}H", uid, fc, count * 2, *range(addr, addr + count))
                 writer.write(body + _crc16(body))
                 await writer.drain()
         except (asyncio.IncompleteReadError, ConnectionResetError):
@@ -180,16 +184,20 @@ async def rtu_server(socket_enabled: None):
     await server.wait_closed()
 
 
-async def test_rtu_over_tcp_framing(rtu_server):
+@pytest.mark.parametrize("native", [False, True])
+async def test_rtu_over_tcp_framing(rtu_server, native):
     port, requests = rtu_server
-    client = ModbusBlockClient.acquire("127.0.0.1", port, "e2e-rtu", framer="rtu")
+    client = ModbusBlockClient.acquire(
+        "127.0.0.1", port, "e2e-rtu", framer="rtu", native=native
+    )
     try:
         assert client.framer == "rtu"
+        assert client.native == native
         assert await client.ensure_connected()
-        async with client.lock:
-            values = await client.read_block(1, Span("holding", 0, 4))
-        assert values == [0, 0, 0, 0]
-        assert requests == [(3, 0, 4)]
+        async with client.turn("e2e-rtu", 0):
+            values = await client.read_block(1, Span("holding", 300, 4))
+        assert list(values) == [300, 301, 302, 303]
+        assert requests == [(3, 300, 4)]
     finally:
         client.release("e2e-rtu")
 
@@ -222,7 +230,7 @@ async def test_request_delay_spaces_transactions(modbus_server):
     )
     try:
         assert await client.ensure_connected()
-        async with client.lock:
+        async with client.turn("e2e-delay", 0):
             await client.read_block(1, Span("holding", 0, 1))
             start = time.monotonic()
             await client.read_block(1, Span("holding", 0, 1))
@@ -311,12 +319,21 @@ async def test_client_is_shared_and_refcounted(modbus_server):
     ModbusBlockClient._instances[f"127.0.0.1:{port}"].release("entry-d")
 
 
-async def test_writes_and_errors(modbus_server):
+@pytest.mark.parametrize(
+    ("native", "pipeline_depth"), [(False, None), (True, None), (False, 4)]
+)
+async def test_writes_and_errors(modbus_server, native, pipeline_depth):
+    # the same semantics over pymodbus and over the native transport, with and
+    # without pipelining
     port, requests = modbus_server
-    client = ModbusBlockClient.acquire("127.0.0.1", port, "e2e-writes")
+    client = ModbusBlockClient.acquire(
+        "127.0.0.1", port, "e2e-writes", pipeline_depth=pipeline_depth, native=native
+    )
+    assert client.native == (native or pipeline_depth is not None)
+    assert client.depth == (pipeline_depth or 1)
     try:
         assert await client.ensure_connected()
-        async with client.lock:
+        async with client.turn("e2e-writes", 0, PRIORITY_WRITE):
             # single register -> FC6
             await client.write_registers(1, 100, [7])
             assert requests[-1] == (6, 100, 7)
@@ -346,5 +363,117 @@ async def test_writes_and_errors(modbus_server):
                 await client.write_registers(1, ERROR_ZONE, [1, 2])
             with pytest.raises(WriteError):
                 await client.write_coil(1, ERROR_ZONE, True)
+
+        # every transaction above was timed and sized
+        metrics = client.metrics.device_summary(1, time.monotonic())
+        assert metrics["count"] == len(requests) + 2  # two went before the clear
+        assert metrics["exception_codes"] == {2: 6}  # FC16 refusal, read, 4 writes
+        assert metrics["timeouts"] == 0
+        assert set(client.metrics.by_function) == {3, 5, 6, 16}
+        assert client.metrics.bytes_sent > 0
+        assert client.metrics.bytes_received > 0
     finally:
         client.release("e2e-writes")
+
+
+@pytest.fixture
+async def pipelining_server(socket_enabled: None):
+    """A Modbus/TCP server that works on every request at once.
+
+    Each read answers after LATENCY seconds with registers holding their own
+    addresses, so out-of-order answers show up as wrong values if the client
+    mismatched them. Records the peak number of requests in flight.
+    """
+    stats = {"in_flight": 0, "peak": 0}
+
+    async def answer(writer, tid, uid, addr, count, delay):
+        stats["in_flight"] += 1
+        stats["peak"] = max(stats["peak"], stats["in_flight"])
+        await asyncio.sleep(delay)
+        stats["in_flight"] -= 1
+        payload = struct.pack(f">BB{count}H", 3, count * 2, *range(addr, addr + count))
+        writer.write(struct.pack(">HHHB", tid, 0, len(payload) + 1, uid) + payload)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks = []
+        try:
+            while True:
+                tid, _, length, uid = struct.unpack(">HHHB", await reader.readexactly(7))
+                _, addr, count = struct.unpack(">BHH", await reader.readexactly(length - 1))
+                # later requests answer sooner: the replies come back reversed
+                delay = PIPELINE_LATENCY / (1 + len(tasks) % 4)
+                tasks.append(asyncio.create_task(answer(writer, tid, uid, addr, count, delay)))
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    yield server.sockets[0].getsockname()[1], stats
+    server.close()
+    await server.wait_closed()
+
+
+async def test_pipelined_reads_overlap_and_match_by_transaction_id(pipelining_server):
+    port, stats = pipelining_server
+    client = ModbusBlockClient.acquire("127.0.0.1", port, "deep", pipeline_depth=4)
+    ModbusBlockClient.acquire("127.0.0.1", port, "shallow", pipeline_depth=3)  # same client
+    try:
+        assert client.depth == 3  # as deep as every sharing entry allows
+        assert await client.ensure_connected()
+
+        async def read(address: int) -> list:
+            async with client.turn("deep", 0):
+                return await client.read_block(1, Span("holding", address, 2))
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(read(a) for a in (0, 10, 20, 30, 40, 50)))
+        elapsed = time.monotonic() - start
+        assert [list(r) for r in results] == [[a, a + 1] for a in (0, 10, 20, 30, 40, 50)]
+        assert stats["peak"] == 3
+        # six reads of up to 0.2 s each, three at a time: two rounds, not six
+        assert elapsed < 4 * PIPELINE_LATENCY
+    finally:
+        client.release("shallow")
+        client.release("deep")
+
+
+async def test_pipelining_needs_plain_tcp_and_no_request_delay(modbus_server, caplog):
+    port, _ = modbus_server
+    rtu = ModbusBlockClient.acquire(
+        "127.0.0.1", port, "rtu", framer="rtu", pipeline_depth=4
+    )
+    try:
+        assert not rtu.pipelining  # RTU-over-TCP has no transaction ids to match
+        assert rtu.depth == 1
+    finally:
+        rtu.release("rtu")
+    native_rtu = ModbusBlockClient.acquire(
+        "127.0.0.1", port, "rtu", framer="rtu", pipeline_depth=4, native=True
+    )
+    try:
+        assert native_rtu.native and not native_rtu.pipelining
+        assert native_rtu.depth == 1
+    finally:
+        native_rtu.release("rtu")
+    client = ModbusBlockClient.acquire(
+        "127.0.0.1", port, "spaced", pipeline_depth=4, request_delay=0.05
+    )
+    late = ModbusBlockClient.acquire("127.0.0.1", port, "late", pipeline_depth=2)
+    try:
+        assert client.pipelining
+        assert client.depth == 1  # enforced silence between frames: one at a time
+        client.release("spaced")
+        assert client.depth == 2
+    finally:
+        late.release("late")
+    plain = ModbusBlockClient.acquire("127.0.0.1", port, "plain")
+    deep = ModbusBlockClient.acquire("127.0.0.1", port, "deep", pipeline_depth=4)
+    try:
+        assert deep is plain
+        assert not plain.pipelining and plain.depth == 1
+        assert "without pipelining" in caplog.text
+    finally:
+        plain.release("plain")
+        plain.release("deep")
@@ -22,7 +22,9 @@ from custom_components.modbus_connect.const import (
     DOMAIN,
     OPTION_ENABLED_GROUPS,
     OPTION_MIN_SCAN_INTERVAL,
+    OPTION_NATIVE_TRANSPORT,
     OPTION_SHOW_ALL,
+    OPTION_WIRE_TRACE,
 )
 from custom_components.modbus_connect.diagnostics import (
     async_get_config_entry_diagnostics,
@@ -293,12 +295,14 @@ async def test_connection_tuning_reaches_the_client(hass: HomeAssistant) -> None
     (directory / "tuned.yaml").write_text(
         DEVICE_YAML.replace(
             "model: X1",
-            "model: X1\n  timeout: 5\n  retries: 3\n  request_delay: 0.05",
+            "model: X1\n  timeout: 5\n  retries: 3\n  request_delay: 0.05\n"
+            "  pipeline_depth: 2",
         ),
         encoding="utf-8",
     )
     entry = make_entry("tuned.yaml")
     entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(entry, options={OPTION_NATIVE_TRANSPORT: True})
     with patch.object(
         ModbusBlockClient, "acquire", return_value=make_client()
     ) as acquire:
@@ -307,6 +311,8 @@ async def test_connection_tuning_reaches_the_client(hass: HomeAssistant) -> None
     assert acquire.call_args.kwargs["timeout"] == 5
     assert acquire.call_args.kwargs["retries"] == 3
     assert acquire.call_args.kwargs["request_delay"] == pytest.approx(0.05)
+    assert acquire.call_args.kwargs["pipeline_depth"] == 2
+    assert acquire.call_args.kwargs["native"] is True
 
 
 async def test_valve_platform(hass: HomeAssistant) -> None:
@@ -620,12 +626,31 @@ async def test_diagnostics(hass: HomeAssistant) -> None:
     assert diagnostics["device"]["manufacturer"] == "Acme"
     assert diagnostics["device"]["model"] == "X1"
     assert diagnostics["polling"]["last_update_success"] is True
+    assert diagnostics["polling"]["transport"] == "pymodbus"
+    assert diagnostics["polling"]["wire_trace"] is None
     by_key = {e["key"]: e for e in diagnostics["entities"]}
     assert by_key["temperature"]["value"] == pytest.approx(21.5)
     assert by_key["temperature"]["address"] == 0
     assert {t["key"] for t in diagnostics["templates"]} >= {"double_temp", "t_climate"}
 
 
+async def test_wire_trace_option_records_for_diagnostics(hass: HomeAssistant) -> None:
+    entry = make_entry()
+    client = make_client()
+    write_device_file(hass)
+    entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(entry, options={OPTION_WIRE_TRACE: True})
+    with patch.object(ModbusBlockClient, "acquire", return_value=client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert client.trace is not None
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    trace = diagnostics["polling"]["wire_trace"]
+    assert trace["records"] == 0  # the fake client puts nothing on a wire
+    assert set(trace) == {"started", "records", "dropped", "bytes", "data"}
+
+
 async def test_switch_variants_and_undecodable_value(hass: HomeAssistant) -> None:
     entry = make_entry()
     client = make_client()
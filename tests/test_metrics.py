@@ -0,0 +1,61 @@
+"""Tests for the transaction metrics."""
+
+import pytest
+
+from custom_components.modbus_connect.metrics import (
+    WINDOW,
+    LatencyHistogram,
+    TransactionMetrics,
+)
+
+
+def test_histogram_summary_and_quantiles():
+    histogram = LatencyHistogram()
+    for seconds in [0.03] * 18 + [0.4, 1.5]:
+        histogram.observe(seconds, 10.0)
+    summary = histogram.summary(10.0)
+    assert summary["count"] == 20
+    assert summary["mean"] == pytest.approx((18 * 0.03 + 1.9) / 20, abs=1e-4)
+    assert summary["p50"] == 0.05  # bucket resolution: the 20-50 ms bucket
+    assert summary["p95"] == 0.5
+    assert summary["max"] == 1.5
+    assert summary["buckets"]["0.05"] == 18
+    assert summary["buckets"]["inf"] == 0
+
+
+def test_quantile_never_exceeds_the_slowest_sample():
+    histogram = LatencyHistogram()
+    histogram.observe(0.012, 0.0)
+    assert histogram.summary(0.0)["p95"] == 0.012
+
+
+def test_histogram_rolls_over_two_windows():
+    histogram = LatencyHistogram()
+    histogram.observe(2.5, 0.0)
+    histogram.observe(0.01, WINDOW + 1)  # a new window: the old one still counts
+    assert histogram.summary(WINDOW + 1)["count"] == 2
+    assert histogram.summary(2 * WINDOW + 2)["max"] == 0.01  # the slow one aged out
+    assert histogram.summary(4 * WINDOW)["count"] == 0
+
+
+def test_outcomes_are_counted_per_device():
+    metrics = TransactionMetrics(("write", "poll"))
+    metrics.record(3, 1, 0.05, 0.0, sent=12, received=29)
+    metrics.record(3, 1, 0.02, 0.0, sent=12, received=9, exception_code=2)
+    metrics.record(4, 2, 2.0, 0.0, sent=12, received=0, outcome="timeout")
+    metrics.record(4, 2, 0.0, 0.0, sent=12, received=0, outcome="connection_error")
+    metrics.wait("poll", 0.2, 0.0)
+
+    assert (metrics.bytes_sent, metrics.bytes_received) == (48, 38)
+    one = metrics.device_summary(1, 0.0)
+    assert one["count"] == 2  # exception answers still time the device
+    assert one["exception_codes"] == {2: 1}
+    two = metrics.device_summary(2, 0.0)
+    assert two["count"] == 0  # a timeout measures the setting, not the device
+    assert (two["timeouts"], two["connection_errors"]) == (1, 1)
+
+    snapshot = metrics.as_dict(0.0)
+    assert set(snapshot["function_codes"]) == {3}
+    assert set(snapshot["devices"]) == {1, 2}
+    assert snapshot["turn_waits"]["poll"]["count"] == 1
+    assert snapshot["turn_waits"]["write"]["count"] == 0
@@ -1,12 +1,22 @@
 """Tests for the read-block planner."""
 
-from custom_components.modbus_connect.models import Span
+import pytest
+
+from custom_components.modbus_connect.models import ReadCost, Span
 from custom_components.modbus_connect.planner import (
+    AddressIndex,
+    absorb_spans,
     bridged_addresses,
+    bridged_ranges,
+    covering_block,
+    estimate_read_time,
     plan_blocks,
     spans_in_block,
 )
 
+# 40 ms per round trip, 2 ms per register: bridging pays up to a 19-register gap
+GATEWAY = ReadCost(request=0.04, register=0.002)
+
 
 def s(start: int, count: int = 1, table: str = "holding") -> Span:
     return Span(table, start, count)
@@ -122,3 +132,121 @@ def test_bridged_addresses():
         ("holding", 4),
         ("holding", 5),
     }
+
+
+def test_cost_model_bridges_beyond_max_gap_when_cheaper():
+    # greedy stops at max_gap; a 15-register hole costs 30 ms, a round trip 40 ms
+    spans = [s(0, 2), s(17, 2)]
+    assert plan_blocks(spans, max_read=100, max_gap=8) == [s(0, 2), s(17, 2)]
+    assert plan_blocks(spans, max_read=100, max_gap=8, cost=GATEWAY) == [s(0, 19)]
+
+
+def test_cost_model_splits_when_the_gap_costs_more():
+    spans = [s(0, 2), s(30, 2)]
+    assert plan_blocks(spans, max_read=100, max_gap=50) == [s(0, 32)]
+    assert plan_blocks(spans, max_read=100, max_gap=50, cost=GATEWAY) == [s(0, 2), s(30, 2)]
+
+
+def test_cost_model_beats_greedy_under_the_cap():
+    # greedy grows the first block as far as the cap allows; the optimum cuts at
+    # the wider hole instead — two reads either way, but fewer registers on the wire
+    spans = [s(0, 4), s(9, 2), s(13, 4)]
+    greedy = plan_blocks(spans, max_read=12, max_gap=8)
+    optimal = plan_blocks(spans, max_read=12, cost=GATEWAY)
+    assert greedy == [s(0, 11), s(13, 4)]
+    assert optimal == [s(0, 4), s(9, 8)]
+    assert estimate_read_time(optimal, GATEWAY) < estimate_read_time(greedy, GATEWAY)
+
+
+def test_cost_model_respects_holes_boundaries_and_cap():
+    spans = [s(0, 2), s(6, 2), s(20, 2), s(40, 2)]
+    holes = {("holding", 4)}
+    boundaries = {("holding", 20)}
+    blocks = plan_blocks(
+        spans, max_read=10, cost=GATEWAY, holes=holes, boundaries=boundaries
+    )
+    assert blocks == [s(0, 2), s(6, 2), s(20, 2), s(40, 2)]
+
+
+def test_cost_model_chunks_an_oversized_span():
+    assert plan_blocks([s(0, 300)], max_read=125, cost=GATEWAY) == [
+        s(0, 125),
+        s(125, 125),
+        s(250, 50),
+    ]
+
+
+def test_estimate_read_time_packs_bits():
+    assert estimate_read_time([s(0, 10), s(0, 32, table="coil")], GATEWAY) == pytest.approx(
+        0.04 + 10 * 0.002 + 0.04 + 2 * 0.002
+    )
+
+
+def test_address_index_coalesces_and_answers_ranges():
+    index = AddressIndex({("holding", 3), ("holding", 4), ("holding", 10), ("coil", 4)})
+    index.add_range("holding", 5, 8)  # touches 3..4: one range 3..7
+    assert index.ranges("holding") == [(3, 8), (10, 11)]
+    assert index.any_in("holding", 0, 4)
+    assert not index.any_in("holding", 8, 10)
+    assert not index.any_in("input", 0, 100)
+    assert ("holding", 7) in index
+    assert ("holding", 8) not in index
+    assert len(index) == 7
+    # a plain set of pairs, as far as callers comparing or listing it care
+    assert index == {("coil", 4), *(("holding", a) for a in (3, 4, 5, 6, 7, 10))}
+    assert sorted(index)[0] == ("coil", 4)
+    index.add_range("holding", 0, 20)  # swallows both ranges
+    assert index.ranges("holding") == [(0, 20)]
+
+
+def test_wide_hole_index_blocks_bridging():
+    holes = AddressIndex()
+    holes.add_range("coil", 100, 1900)
+    spans = [s(0, 1, table="coil"), s(1999, 1, table="coil")]
+    assert plan_blocks(spans, max_read=2000, max_gap=2000, holes=holes) == spans
+    assert plan_blocks(spans, max_read=2000, max_gap=2000) == [s(0, 2000, table="coil")]
+
+
+def test_bridged_ranges():
+    spans = [s(0, 2), s(6, 2), s(8, 1), s(12, 1), s(0, 1, table="input")]
+    assert bridged_ranges(s(0, 13), sorted(spans)) == [s(2, 4), s(9, 3)]
+
+
+def test_covering_block():
+    blocks = [s(0, 16, table="coil"), s(0, 6), s(20, 4)]  # sorted, as planned
+    assert covering_block(blocks, s(3, 2)) == s(0, 6)
+    assert covering_block(blocks, s(5, 2)) is None  # runs past the block
+    assert covering_block(blocks, s(10)) is None
+    assert covering_block(blocks, s(20, 4)) == s(20, 4)
+    assert covering_block(blocks, s(15, table="coil")) == s(0, 16, table="coil")
+    assert covering_block(blocks, s(3, table="input")) is None
+
+
+def test_absorb_spans_grows_blocks_without_new_requests():
+    blocks = [s(10, 2), s(40, 2)]
+    grown, taken = absorb_spans(
+        blocks, [s(5), s(25), s(44, 2)], max_read=10, max_gap=8, holes={("holding", 42)}
+    )
+    # s(5) leads block 10..11; s(25) reaches neither; s(44) is behind a hole
+    assert grown == [s(5, 7), s(40, 2)]
+    assert taken == [s(5)]
+    assert blocks == [s(10, 2), s(40, 2)]  # the caller's plan is untouched
+    # the cap binds what a block can still take in
+    assert absorb_spans([s(0, 8)], [s(8, 2)], max_read=10) == ([s(0, 10)], [s(8, 2)])
+    assert absorb_spans([s(0, 8)], [s(9, 3)], max_read=10, max_gap=8) == ([s(0, 8)], [])
+
+
+def test_absorb_spans_never_grows_a_block_into_another():
+    # bridging s(19, 3) onto A would grow A over the start of B: B takes it
+    blocks = [s(0, 10), s(20, 10)]
+    grown, taken = absorb_spans(blocks, [s(19, 3)], max_read=30, max_gap=12)
+    assert (grown, taken) == ([s(0, 10), s(19, 11)], [s(19, 3)])
+    # ...and when B is full, nobody does
+    assert absorb_spans(blocks, [s(19, 3)], max_read=10, max_gap=12) == (blocks, [])
+    # a span in the gap joins a block it does not push into the other
+    grown, taken = absorb_spans(blocks, [s(12), s(18)], max_read=30, max_gap=2)
+    assert grown == [s(0, 13), s(18, 12)]
+    assert taken == [s(12), s(18)]
+    # the result comes back sorted even if the blocks were not
+    grown, _ = absorb_spans([s(20, 10), s(0, 10)], [s(12)], max_read=30, max_gap=2)
+    assert grown == [s(0, 13), s(20, 10)]
@@ -0,0 +1,70 @@
+"""Tests for the raw register cache."""
+
+from array import array
+
+from custom_components.modbus_connect.models import Span
+from custom_components.modbus_connect.rawcache import RawCache
+
+
+def test_store_read_and_missing_by_span():
+    cache = RawCache()
+    cache.store(Span("holding", 100, 3), [1, 2, 3], 5.0)
+    cache.store(Span("holding", 110, 2), array("H", [7, 8]), 6.0)  # the native client's type
+
+    assert cache.read(Span("holding", 100, 3)) == [1, 2, 3]
+    assert cache.read(Span("holding", 101, 2)) == [2, 3]
+    assert cache.read(Span("holding", 110, 2)) == [7, 8]
+    assert cache.read(Span("holding", 102, 9)) is None  # 103..109 never read
+    assert cache.missing(Span("holding", 103, 1))
+    assert cache.missing(Span("holding", 99, 2))  # below the stored run
+    assert cache.missing(Span("holding", 111, 2))  # past it
+    assert cache.missing(Span("input", 100, 1))  # another table
+    assert not cache.missing(Span("holding", 110, 2))
+    assert cache.stored_at(("holding", 101)) == 5.0
+    assert cache.stored_at(("holding", 105)) is None
+
+
+def test_the_run_grows_both_ways():
+    cache = RawCache()
+    cache.store(Span("input", 500, 2), [5, 6])
+    cache.store(Span("input", 10, 1), [1])  # below the run's start
+    cache.store(Span("input", 60000, 1), [9])
+    assert cache.read(Span("input", 500, 2)) == [5, 6]
+    assert cache[("input", 10)] == 1
+    assert cache[("input", 60000)] == 9
+    assert ("input", 11) not in cache
+
+
+def test_clear_forgets_only_the_span():
+    cache = RawCache()
+    cache.store(Span("holding", 0, 4), [1, 2, 3, 4])
+    cache.clear(Span("holding", 1, 2))
+    cache.clear(Span("holding", 50, 2))  # outside the run: nothing to forget
+    cache.clear(Span("coil", 0, 1))  # a table never stored
+    assert cache.get(("holding", 0)) == 1
+    assert cache.get(("holding", 1)) is None
+    assert cache.get(("holding", 2), -1) == -1
+    assert cache.read(Span("holding", 3, 1)) == [4]
+    assert cache.missing(Span("holding", 0, 4))
+
+
+def test_bits_come_back_as_bools():
+    cache = RawCache()
+    cache.store(Span("coil", 0, 3), [True, False, 1])
+    cache[("discrete", 4)] = False
+    assert cache.read(Span("coil", 0, 3)) == [True, False, True]
+    assert cache[("discrete", 4)] is False
+    assert ("discrete", 4) in cache
+    cache.update({("coil", 1): True})
+    assert cache.read(Span("coil", 0, 2)) == [True, True]
+
+
+def test_store_reports_the_addresses_that_changed():
+    cache = RawCache()
+    assert cache.store(Span("holding", 0, 3), [1, 2, 3]) == [0, 1, 2]  # all new
+    assert cache.store(Span("holding", 0, 3), array("H", [1, 2, 3])) == []
+    assert cache.store(Span("holding", 1, 3), [2, 9, 4]) == [2, 3]
+    cache.clear(Span("holding", 0, 1))
+    assert cache.store(Span("holding", 0, 2), [1, 2]) == [0]  # absent counts as changed
+    assert cache.store(Span("coil", 0, 2), [False, True]) == [0, 1]
+    assert cache.store(Span("coil", 0, 2), [0, 1]) == []
@@ -0,0 +1,46 @@
+"""Tests for the cadence scheduler."""
+
+from custom_components.modbus_connect.schedule import (
+    MAX_HORIZON,
+    due_periods,
+    horizon,
+    period_ticks,
+    stagger_phases,
+)
+
+
+def test_period_ticks_round_up():
+    assert period_ticks(10, 10) == 1
+    assert period_ticks(25, 10) == 3
+    assert period_ticks(5, 10) == 1
+
+
+def test_horizon_is_capped_lcm():
+    assert horizon([1, 3, 6]) == 6
+    assert horizon([]) == 1
+    assert horizon([1009, 1013]) == MAX_HORIZON
+
+
+def test_stagger_flattens_peak():
+    # 10/30/60/300 s classes on a 10 s tick
+    weights = {1: 2, 3: 1, 6: 1, 30: 3}
+    phases = stagger_phases(weights)
+    assert phases[1] == 0
+    assert phases[3] == 0  # nothing to gain: the fast class loads every tick
+    assert phases[6] % 3 != 0  # kept off the 30 s class's ticks
+    load = [
+        sum(w for p, w in weights.items() if p in due_periods(phases, k)) for k in range(30)
+    ]
+    assert max(load) == 5  # in phase, tick 0 would carry all 7
+    assert sum(load) == 30 * 2 + 10 + 5 + 3
+
+
+def test_stagger_keeps_phase_zero_without_gain():
+    assert stagger_phases({1: 1, 30: 1}) == {1: 0, 30: 0}
+    assert stagger_phases({}) == {}
+
+
+def test_due_periods():
+    phases = {1: 0, 3: 0, 6: 1}
+    assert due_periods(phases, 0) == {1, 3}
+    assert due_periods(phases, 7) == {1, 6}
@@ -2,7 +2,7 @@
 
 import pytest
 
-from custom_components.modbus_connect.models import SwitchTarget, derive_name
+from custom_components.modbus_connect.models import ReadCost, SwitchTarget, derive_name
 from custom_components.modbus_connect.schema import DeviceSchemaError, parse_device
 
 DEVICE = {"device": {"manufacturer": "Acme", "model": "X1"}}
@@ -179,6 +179,9 @@ def test_connection_tuning_parsed():
             "timeout": 5,
             "retries": 3,
             "request_delay": 0.05,
+            "pipeline_depth": 4,
+            "confirm_holds_bus": True,
+            "rmw_max_age": 2,
         },
         "holding": {"x": {"address": 1, "ha": {"platform": "sensor"}}},
     }
@@ -186,6 +189,9 @@ def test_connection_tuning_parsed():
     assert dev.timeout == 5
     assert dev.retries == 3
     assert dev.request_delay == pytest.approx(0.05)
+    assert dev.pipeline_depth == 4
+    assert dev.confirm_holds_bus is True
+    assert dev.rmw_max_age == 2
 
 
 def test_connection_tuning_defaults_absent():
@@ -193,17 +199,41 @@ def test_connection_tuning_defaults_absent():
     assert dev.timeout is None
     assert dev.retries is None
     assert dev.request_delay is None
+    assert dev.pipeline_depth is None
+    assert dev.confirm_holds_bus is False
+    assert dev.rmw_max_age is None
+
+
+def test_read_cost_parsed():
+    data = {
+        "device": {
+            "manufacturer": "Acme",
+            "model": "X1",
+            "read_cost": {"request": 0.04, "register": 0.002},
+        },
+        "holding": {"x": {"address": 1, "ha": {"platform": "sensor"}}},
+    }
+    dev = parse_device(data, "t.yaml")
+    assert dev.read_cost == ReadCost(request=0.04, register=0.002)
+    assert parse_device(doc(x={"address": 1, "ha": {"platform": "sensor"}})).read_cost is None
 
 
 @pytest.mark.parametrize(
     ("field", "match"),
     [
+        ({"read_cost": {"request": 0.04}}, "device.read_cost"),
+        ({"read_cost": {"request": 0, "register": 0.002}}, "device.read_cost.request"),
+        ({"read_cost": {"request": 0.04, "register": -1}}, "device.read_cost.register"),
         ({"timeout": 0}, "device.timeout"),
         ({"timeout": 61}, "device.timeout"),
         ({"timeout": "fast"}, "device.timeout"),
         ({"retries": 11}, "device.retries"),
         ({"request_delay": -0.1}, "device.request_delay"),
         ({"request_delay": 6}, "device.request_delay"),
+        ({"pipeline_depth": 0}, "device.pipeline_depth"),
+        ({"pipeline_depth": 17}, "device.pipeline_depth"),
+        ({"confirm_holds_bus": "yes"}, "confirm_holds_bus"),
+        ({"rmw_max_age": -1}, "device.rmw_max_age"),
     ],
 )
 def test_connection_tuning_invalid(field, match):
@@ -0,0 +1,39 @@
+"""RTU inter-frame gap from the line settings, and learned per-device guard times."""
+
+import pytest
+
+from custom_components.modbus_connect.silence import (
+    MAX_GUARD,
+    MIN_GUARD,
+    RELAX_AFTER,
+    GuardTime,
+    inter_frame_gap,
+)
+
+
+def test_inter_frame_gap_is_three_and_a_half_characters():
+    assert inter_frame_gap(9600, 8, "N", 1) == pytest.approx(3.5 * 10 / 9600)
+    assert inter_frame_gap(19200, 8, "e", 1) == pytest.approx(3.5 * 11 / 19200)
+    assert inter_frame_gap(9600, 8, "N", 2) == pytest.approx(3.5 * 11 / 9600)
+    # above 19200 baud the specification fixes it at 1.75 ms
+    assert inter_frame_gap(115200, 8, "N", 1) == pytest.approx(0.00175)
+
+
+def test_guard_grows_on_short_silence_timeouts_and_relaxes():
+    guard = GuardTime()
+    guard.timed_out(silence=5.0)  # after a long quiet the silence is not to blame
+    assert guard.seconds == 0.0
+    guard.timed_out(silence=0.002)
+    assert guard.seconds == MIN_GUARD
+    for _ in range(10):
+        guard.timed_out(silence=0.0)
+    assert guard.seconds == MAX_GUARD
+
+    for _ in range(RELAX_AFTER - 1):
+        guard.answered()
+    assert guard.seconds == MAX_GUARD
+    guard.answered()
+    assert guard.seconds == MAX_GUARD / 2
+    for _ in range(10 * RELAX_AFTER):
+        guard.answered()
+    assert guard.seconds == 0.0  # halved below the minimum: gone
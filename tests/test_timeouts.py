@@ -0,0 +1,60 @@
+"""Tests for the adaptive request timeouts."""
+
+import pytest
+
+from custom_components.modbus_connect.timeouts import (
+    MIN_SAMPLES,
+    MIN_TIMEOUT,
+    RoundTripEstimator,
+    size_factor,
+)
+
+
+def test_ceiling_until_enough_samples():
+    estimator = RoundTripEstimator()
+    for _ in range(MIN_SAMPLES - 1):
+        estimator.observe(0.03, 0)
+    assert estimator.timeout(0, 2.0) == 2.0
+    estimator.observe(0.03, 0)
+    assert estimator.timeout(0, 2.0) < 2.0
+
+
+def test_steady_device_converges_to_its_round_trip():
+    estimator = RoundTripEstimator()
+    for _ in range(100):
+        estimator.observe(0.3, 0)
+    assert estimator.srtt == pytest.approx(0.3)
+    assert estimator.rttvar == pytest.approx(0, abs=1e-3)
+    assert estimator.timeout(0, 2.0) == pytest.approx(0.3, rel=0.02)
+    # larger responses get proportionally longer, never past the ceiling
+    assert estimator.timeout(64, 2.0) == pytest.approx(0.6, rel=0.02)
+    assert estimator.timeout(250, 1.0) == 1.0
+
+
+def test_samples_are_normalized_by_size():
+    estimator = RoundTripEstimator()
+    estimator.observe(0.2 * size_factor(128), 128)
+    assert estimator.srtt == pytest.approx(0.2)
+
+
+def test_jitter_widens_and_floor_holds():
+    estimator = RoundTripEstimator()
+    for i in range(40):
+        estimator.observe(0.02 if i % 2 else 0.08, 0)
+    assert estimator.timeout(0, 2.0) > 0.08  # deviation keeps slow answers in
+    fast = RoundTripEstimator()
+    for _ in range(MIN_SAMPLES):
+        fast.observe(0.001, 0)
+    assert fast.timeout(0, 2.0) == MIN_TIMEOUT
+
+
+def test_timeouts_back_off_until_an_answer():
+    estimator = RoundTripEstimator()
+    for _ in range(50):
+        estimator.observe(0.1, 0)
+    base = estimator.timeout(0, 5.0)
+    estimator.timed_out()
+    estimator.timed_out()
+    assert estimator.timeout(0, 5.0) == pytest.approx(4 * base)
+    estimator.observe(0.1, 0)
+    assert estimator.timeout(0, 5.0) == pytest.approx(base, rel=0.05)
@@ -0,0 +1,129 @@
+"""Tests for the wire trace: the binary format, the bounded ring, and replaying
+a trace under the block client."""
+
+import struct
+import time
+
+import pytest
+
+from custom_components.modbus_connect.client import ModbusBlockClient, ReadError
+from custom_components.modbus_connect.models import Span
+from custom_components.modbus_connect.trace import (
+    ANSWERED,
+    TIMEOUT,
+    TraceRecord,
+    TraceRecorder,
+    read_trace,
+)
+
+
+def _words(function_code: int, *words: int) -> bytes:
+    return struct.pack(f">BB{len(words)}H", function_code, 2 * len(words), *words)
+
+
+def _record(address, count, response, *, latency=0.02, outcome=ANSWERED, code=0, device_id=1):
+    return TraceRecord(0.0, latency, device_id, 3, address, count, outcome, code, response)
+
+
+def test_records_round_trip_through_bytes_and_base64():
+    recorder = TraceRecorder()
+    now = time.monotonic()
+    recorder.record(now, 0.025, 7, 3, 100, 2, ANSWERED, None, _words(3, 1, 2))
+    recorder.record(now + 1, 2.0, 7, 4, 0, 10, TIMEOUT)
+    recorder.record(now + 2, 0.01, 7, 3, 500, 1, ANSWERED, 2, bytes([0x83, 2]))
+
+    records = read_trace(recorder.dump())
+    assert records == read_trace(recorder.as_dict()["data"].encode())
+    answered, silent, refused = records
+    assert (answered.device_id, answered.address, answered.quantity) == (7, 100, 2)
+    assert answered.response == _words(3, 1, 2)
+    assert answered.latency == pytest.approx(0.025)
+    assert silent.outcome == TIMEOUT and silent.response == b""
+    assert silent.time - answered.time == pytest.approx(1 - 2.0 + 0.025)  # start times
+    assert refused.exception_code == 2
+    with pytest.raises(ValueError):
+        read_trace(b"not a trace")
+
+
+def test_ring_drops_the_oldest_records():
+    recorder = TraceRecorder(max_bytes=200)
+    for i in range(20):
+        recorder.record(float(i), 0.01, 1, 3, i, 1, ANSWERED, None, _words(3, i))
+    assert recorder.size <= 200
+    assert recorder.dropped == 20 - len(recorder)
+    assert [r.address for r in read_trace(recorder.dump())] == list(
+        range(recorder.dropped, 20)
+    )
+
+
+async def test_replay_answers_as_recorded():
+    records = [
+        _record(0, 2, _words(3, 10, 11)),
+        _record(0, 2, _words(3, 20, 21)),
+        _record(50, 1, bytes([0x83, 2]), code=2),
+        _record(60, 1, b"", outcome=TIMEOUT, latency=0.5),
+    ]
+    client = ModbusBlockClient.replay(records, speed=0)
+    assert await client.ensure_connected()
+    async with client.turn("replay", 0):
+        assert list(await client.read_block(1, Span("holding", 0, 2))) == [10, 11]
+        assert list(await client.read_block(1, Span("holding", 0, 2))) == [20, 21]
+        with pytest.raises(ReadError) as refused:
+            await client.read_block(1, Span("holding", 50, 1))
+        assert refused.value.illegal_address
+        with pytest.raises(ReadError):
+            await client.read_block(1, Span("holding", 60, 1))
+    assert client.metrics.timeouts[1] == 1
+
+
+async def test_replay_synthesizes_blocks_the_trace_does_not_hold():
+    records = [_record(0, 2, _words(3, 1, 2)), _record(2, 2, _words(3, 3, 4))]
+    client = ModbusBlockClient.replay(records, speed=0)
+    await client.ensure_connected()
+    async with client.turn("replay", 0):
+        # a planner that merges the two blocks reads what the device held
+        assert list(await client.read_block(1, Span("holding", 0, 4))) == [1, 2, 3, 4]
+        with pytest.raises(ReadError) as unknown:
+            await client.read_block(1, Span("holding", 2, 4))
+        assert unknown.value.illegal_address
+        await client.write_registers(1, 4, [5, 6])
+        assert list(await client.read_block(1, Span("holding", 2, 4))) == [3, 4, 5, 6]
+    assert client._client.synthesized == 4
+    assert client._client.matched == 0
+
+
+async def test_replay_keeps_or_compresses_the_recorded_timing():
+    records = [_record(0, 1, _words(3, 1), latency=0.2)]
+    for speed, slowest in ((1, 0.2), (10, 0.02)):
+        client = ModbusBlockClient.replay(records, speed=speed)
+        await client.ensure_connected()
+        started = time.monotonic()
+        async with client.turn("replay", 0):
+            await client.read_block(1, Span("holding", 0, 1))
+        elapsed = time.monotonic() - started
+        assert slowest * 0.9 <= elapsed < slowest + 0.15
+
+
+async def test_a_replay_records_the_trace_it_replays():
+    records = [
+        _record(0, 3, _words(3, 7, 8, 9), latency=0.0),
+        _record(9, 1, bytes([0x83, 2]), code=2, latency=0.0),
+        TraceRecord(0.0, 0.0, 2, 1, 0, 10, ANSWERED, 0, bytes([1, 2, 0b101, 0b10])),
+    ]
+    client = ModbusBlockClient.replay(records, speed=0)
+    recorder = client.start_trace()
+    await client.ensure_connected()
+    async with client.turn("replay", 0):
+        await client.read_block(1, Span("holding", 0, 3))
+        with pytest.raises(ReadError):
+            await client.read_block(1, Span("holding", 9, 1))
+        bits = await client.read_block(2, Span("coil", 0, 10))
+    assert list(bits) == [True, False, True] + [False] * 6 + [True]
+
+    again = read_trace(recorder.dump())
+    assert [(r.device_id, r.function_code, r.address, r.quantity) for r in again] == [
+        (r.device_id, r.function_code, r.address, r.quantity) for r in records
+    ]
+    assert [(r.response, r.exception_code) for r in again] == [
+        (r.response, r.exception_code) for r in records
+    ]
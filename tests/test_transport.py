@@ -0,0 +1,156 @@
+"""Native transport framing: CRC, register decoding, and response matching."""
+
+import asyncio
+import struct
+
+import pytest
+
+from custom_components.modbus_connect.transport import (
+    FramingError,
+    NativeTcpClient,
+    _MbapProtocol,
+    _RtuProtocol,
+    crc16,
+    decode_words,
+)
+
+
+class _Transport(asyncio.Transport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: list[bytes] = []
+
+    def write(self, data) -> None:
+        self.sent.append(bytes(data))
+
+
+def test_crc16_matches_the_modbus_reference():
+    # read one holding register at 0 from device 1: "01 03 00 00 00 01 84 0A"
+    assert struct.pack("<H", crc16(bytes.fromhex("010300000001"))) == bytes.fromhex("840a")
+
+
+def test_decode_words_is_big_endian():
+    assert list(decode_words(memoryview(bytes.fromhex("0001ff00abcd")))) == [1, 0xFF00, 0xABCD]
+
+
+async def test_mbap_matches_responses_by_transaction_id():
+    protocol = _MbapProtocol()
+    protocol.connection_made(_Transport())
+    loop = asyncio.get_running_loop()
+    first, _ = protocol.frame(1, b"\x03\x00\x00\x00\x01")
+    protocol.pending[first] = a = loop.create_future()
+    second, _ = protocol.frame(1, b"\x03\x00\x01\x00\x01")
+    protocol.pending[second] = b = loop.create_future()
+    # the second answer arrives first, split across two reads
+    wire = struct.pack(">HHHB", second, 0, 5, 1) + b"\x03\x02\x00\x02"
+    wire += struct.pack(">HHHB", first, 0, 5, 1) + b"\x03\x02\x00\x01"
+    protocol.data_received(wire[:5])
+    protocol.data_received(wire[5:])
+    assert a.result() == b"\x03\x02\x00\x01"
+    assert b.result() == b"\x03\x02\x00\x02"
+    assert not protocol.pending
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        struct.pack(">HHHB", 1, 0, 0, 1),  # zero length: not even a unit id
+        struct.pack(">HHHB", 1, 7, 5, 1),  # not Modbus
+    ],
+)
+async def test_mbap_bad_header_fails_requests_in_flight(header):
+    protocol = _MbapProtocol()
+    protocol.connection_made(_Transport())
+    loop = asyncio.get_running_loop()
+    futures = []
+    for address in range(2):
+        key, _ = protocol.frame(1, b"\x03\x00" + bytes([address]) + b"\x00\x01")
+        protocol.pending[key] = future = loop.create_future()
+        futures.append(future)
+
+    protocol.data_received(header + b"\x03\x02\x00\x01")
+    for future in futures:
+        with pytest.raises(FramingError):
+            future.result()
+    assert not protocol.pending
+    assert not protocol._buffer  # nothing after it starts a frame
+
+    # a well-formed answer afterwards is read as usual
+    key, _ = protocol.frame(1, b"\x03\x00\x00\x00\x01")
+    protocol.pending[key] = future = loop.create_future()
+    protocol.data_received(struct.pack(">HHHB", key, 0, 5, 1) + b"\x03\x02\x00\x09")
+    assert future.result() == b"\x03\x02\x00\x09"
+
+
+async def test_rtu_drops_a_garbled_frame_and_reads_the_next():
+    protocol = _RtuProtocol()
+    protocol.connection_made(_Transport())
+    loop = asyncio.get_running_loop()
+    key, frame = protocol.frame(7, b"\x03\x00\x00\x00\x01")
+    assert frame[:1] == b"\x07"
+    assert crc16(frame[:-2]) == struct.unpack("<H", frame[-2:])[0]
+    protocol.pending[key] = future = loop.create_future()
+
+    body = b"\x07\x03\x02\x12\x34"
+    protocol.data_received(body + b"\x00\x00")  # bad CRC: dropped, still waiting
+    assert not future.done()
+    protocol.data_received(body + struct.pack("<H", crc16(body)))
+    assert future.result() == b"\x03\x02\x12\x34"
+
+    protocol.pending[key] = error = loop.create_future()
+    body = b"\x07\x83\x02"  # exception response: fixed five bytes
+    protocol.data_received(body + struct.pack("<H", crc16(body)))
+    assert error.result() == b"\x83\x02"
+
+
+async def _answer(read, pdu: bytes, unit: int = 1):
+    """Run ``read`` on a client wired to a fake transport; the gateway answers ``pdu``."""
+    client = NativeTcpClient("gateway", 502, timeout=1, retries=0)
+    client._protocol = protocol = _MbapProtocol()
+    protocol.connection_made(transport := _Transport())
+    task = asyncio.ensure_future(read(client))
+    await asyncio.sleep(0)
+    (tid,) = struct.unpack_from(">H", transport.sent[-1])
+    protocol.data_received(struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit) + pdu)
+    return await task
+
+
+async def test_read_answers_decode_when_they_match_the_request():
+    registers = await _answer(
+        lambda c: c.read_holding_registers(0, 2, device_id=1), b"\x03\x04\x00\x01\xff\xff"
+    )
+    assert list(registers.registers) == [1, 0xFFFF]
+    coils = await _answer(lambda c: c.read_coils(0, 9, device_id=1), b"\x01\x02\x05\x01")
+    assert coils.bits[:9] == [True, False, True, False, False, False, False, False, True]
+    error = await _answer(lambda c: c.read_holding_registers(0, 2, device_id=1), b"\x83")
+    assert error.exception_code == 0  # an exception answer cut short still reads as one
+
+
+@pytest.mark.parametrize(
+    "pdu",
+    [
+        b"\x03\x04\x00\x01\x00",  # truncated: four bytes announced, three sent
+        b"\x03\x03\x00\x01\x00",  # odd byte count
+        b"\x03\x02\x00\x01",  # one register where two were asked for
+        b"\x04\x04\x00\x01\x00\x02",  # another function's answer
+        b"\x03",  # nothing but the function code
+    ],
+)
+async def test_malformed_read_answers_raise_framing_error(pdu):
+    with pytest.raises(FramingError):
+        await _answer(lambda c: c.read_holding_registers(0, 2, device_id=1), pdu)
+
+
+async def test_malformed_write_answer_raises_framing_error():
+    assert not (
+        await _answer(lambda c: c.write_register(0, 5, device_id=1), b"\x06\x00\x00\x00\x05")
+    ).isError()
+    with pytest.raises(FramingError):
+        await _answer(lambda c: c.write_register(0, 5, device_id=1), b"\x10\x00\x00\x00\x01")
+
+
+async def test_mbap_answer_from_another_unit_fails_its_request():
+    with pytest.raises(FramingError, match="unit 2"):
+        await _answer(
+            lambda c: c.read_holding_registers(0, 1, device_id=1), b"\x03\x02\x00\x01", unit=2
+        )
@@ -0,0 +1,74 @@
+"""Tests for the read-limit auto-tuner."""
+
+import pytest
+
+from custom_components.modbus_connect.models import Span
+from custom_components.modbus_connect.tuning import MIN_SAMPLES, ReadLimitTuner
+
+
+def s(start: int, count: int = 1) -> Span:
+    return Span("holding", start, count)
+
+
+def test_grows_while_capped_and_proves_on_success():
+    tuner = ReadLimitTuner(8, 8)
+    assert tuner.step(capped=True)
+    assert (tuner.max_read, tuner.good_read) == (16, 8)
+    # no block exercised the trial yet: it stays pending, no further growth
+    tuner.observe(s(0, 8), 0, 0.05, ok=True)
+    assert not tuner.step(capped=True)
+    tuner.observe(s(0, 16), 0, 0.06, ok=True)
+    assert tuner.step(capped=True)
+    assert (tuner.max_read, tuner.good_read) == (32, 16)
+    tuner.observe(s(0, 20), 0, 0.06, ok=True)
+    assert not tuner.step(capped=False)  # the plan fits: nothing left to gain
+    assert tuner.as_dict() == {
+        "max_read": 32,
+        "max_gap": 8,
+        "read_ceiling": 125,
+        "gap_ceiling": 125,
+    }
+
+
+def test_rejection_falls_back_and_caps():
+    tuner = ReadLimitTuner(8, 8)
+    tuner.step(capped=True)
+    tuner.observe(s(0, 16), 0, 2.0, ok=False)
+    tuner.observe(s(20, 4), 0, 0.05, ok=True)
+    assert tuner.step(capped=True)
+    assert (tuner.max_read, tuner.read_ceiling) == (8, 15)
+    tuner.step(capped=True)
+    assert tuner.max_read == 15
+
+
+def test_outage_reverts_without_capping():
+    tuner = ReadLimitTuner(8, 8)
+    tuner.step(capped=True)
+    tuner.observe(s(0, 16), 0, 2.0, ok=False)
+    tuner.observe(s(20, 4), 0, 2.0, ok=False)
+    tuner.step(capped=True)
+    assert (tuner.max_read, tuner.read_ceiling) == (8, 125)
+
+
+def test_gap_follows_fitted_costs():
+    # 40 ms per round trip, 2 ms per register: bridging pays up to 20 registers
+    tuner = ReadLimitTuner(64, 8)
+    for i in range(MIN_SAMPLES):
+        count = 1 + i % 10
+        tuner.observe(s(0, count), 0, 0.04 + 0.002 * count, ok=True)
+    assert tuner.cost is not None
+    assert tuner.cost.request == pytest.approx(0.04)
+    assert tuner.step(capped=False)
+    assert (tuner.max_gap, tuner.good_gap) == (20, 8)
+    # the wider gap is refused: back to the last good one, capped below it
+    tuner.observe(s(0, 30), 20, 0.1, ok=False)
+    tuner.observe(s(40, 2), 0, 0.04, ok=True)
+    tuner.step(capped=False)
+    assert (tuner.max_gap, tuner.gap_ceiling) == (8, 19)
+
+
+def test_restores_from_dict():
+    learned = {"max_read": 32, "max_gap": 12, "read_ceiling": 40, "gap_ceiling": 125}
+    tuner = ReadLimitTuner(**learned)
+    assert (tuner.max_read, tuner.good_read, tuner.max_gap) == (32, 32, 12)
+    assert tuner.as_dict() == learned